@@ -0,0 +1,50 @@
+import json
+import os
+import pytest
+from brownie import Contract
+from functools import lru_cache
+from hypothesis import HealthCheck, settings
+from pathlib import Path
+
+
+ABI_DIR = Path(__file__).parent / "abis"
+
+
+# NOTE: hypothesis profiles layered on brownie's settings (loaded before
+# conftests). Select with HYPOTHESIS_PROFILE env var, "dev" by default.
+# isolation fixtures are function scoped by design with brownie's given
+for name, max_examples in [("dev", 10), ("ci", 25), ("nightly", 200)]:
+    settings.register_profile(
+        name,
+        parent=settings.default,
+        max_examples=max_examples,
+        suppress_health_check=[HealthCheck.function_scoped_fixture]
+    )
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "dev"))
+
+
+@lru_cache(maxsize=None)
+def load_abi(name: str) -> list:
+    """
+    Returns the pinned ABI stored at tests/abis/<name>.json
+    """
+    with open(ABI_DIR / f"{name}.json") as f:
+        return json.load(f)
+
+
+# NOTE: loads mainnet contracts from pinned ABIs instead of
+# Contract.from_explorer, so tests don't depend on etherscan
+@pytest.fixture(scope="session")
+def contract_at():
+    def load(abi_name: str, address: str) -> Contract:
+        return Contract.from_abi(abi_name, address, load_abi(abi_name))
+
+    yield load
+
+
+# NOTE: brownie's xdist runner drops every collected test unless all of them
+# use module_isolation, so isolate each module (chain reset between
+# modules). fn_isolation stays opt in per test module
+@pytest.fixture(scope="module", autouse=True)
+def isolated_module(module_isolation):
+    pass
@@ -1,5 +1,5 @@
 import pytest
-from brownie import Contract, OverlayV1UniswapV3Factory
+from brownie import OverlayV1UniswapV3Factory
 
 
 @pytest.fixture(scope="module")
@@ -18,35 +18,38 @@ def bob(accounts):
 
 
 @pytest.fixture(scope="module")
-def dai():
-    yield Contract.from_explorer("0x6B175474E89094C44Da98b954EedeAC495271d0F")
+def dai(contract_at):
+    yield contract_at("ERC20", "0x6B175474E89094C44Da98b954EedeAC495271d0F")
 
 
 @pytest.fixture(scope="module")
-def weth():
-    yield Contract.from_explorer("0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2")
+def weth(contract_at):
+    yield contract_at("ERC20", "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2")
 
 
 @pytest.fixture(scope="module")
-def uni():
+def uni(contract_at):
     # to be used as example ovl
-    yield Contract.from_explorer("0x1f9840a85d5aF5bf1D1762F925BDADdC4201F984")
+    yield contract_at("ERC20", "0x1f9840a85d5aF5bf1D1762F925BDADdC4201F984")
 
 
 @pytest.fixture(scope="module")
-def uni_factory():
-    yield Contract.from_explorer("0x1F98431c8aD98523631AE4a59f267346ea31F984")
+def uni_factory(contract_at):
+    yield contract_at("UniswapV3Factory",
+                      "0x1F98431c8aD98523631AE4a59f267346ea31F984")
 
 
 @pytest.fixture(scope="module")
-def pool_daiweth_30bps():
-    yield Contract.from_explorer("0xC2e9F25Be6257c210d7Adf0D4Cd6E3E881ba25f8")
+def pool_daiweth_30bps(contract_at):
+    yield contract_at("UniswapV3Pool",
+                      "0xC2e9F25Be6257c210d7Adf0D4Cd6E3E881ba25f8")
 
 
 @pytest.fixture(scope="module")
-def pool_uniweth_30bps():
+def pool_uniweth_30bps(contract_at):
     # to be used as example ovlweth pool
-    yield Contract.from_explorer("0x1d42064Fc4Beb5F8aAF85F4617AE8b3b5B8Bd801")
+    yield contract_at("UniswapV3Pool",
+                      "0x1d42064Fc4Beb5F8aAF85F4617AE8b3b5B8Bd801")
 
 
 # TODO: change params to (600, 3600, 300, 14)
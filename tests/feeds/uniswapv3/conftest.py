@@ -1,60 +1,63 @@
 import pytest
-from brownie import Contract, OverlayV1UniswapV3Feed
+from brownie import OverlayV1UniswapV3Feed
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def gov(accounts):
     yield accounts[0]
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def alice(accounts):
     yield accounts[1]
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def bob(accounts):
     yield accounts[2]
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def rando(accounts):
     yield accounts[3]
 
 
-@pytest.fixture(scope="module")
-def dai():
-    yield Contract.from_explorer("0x6B175474E89094C44Da98b954EedeAC495271d0F")
+@pytest.fixture(scope="session")
+def dai(contract_at):
+    yield contract_at("ERC20", "0x6B175474E89094C44Da98b954EedeAC495271d0F")
 
 
-@pytest.fixture(scope="module")
-def weth():
-    yield Contract.from_explorer("0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2")
+@pytest.fixture(scope="session")
+def weth(contract_at):
+    yield contract_at("ERC20", "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2")
 
 
-@pytest.fixture(scope="module")
-def uni():
+@pytest.fixture(scope="session")
+def uni(contract_at):
     # to be used as example ovl
-    yield Contract.from_explorer("0x1f9840a85d5aF5bf1D1762F925BDADdC4201F984")
+    yield contract_at("ERC20", "0x1f9840a85d5aF5bf1D1762F925BDADdC4201F984")
 
 
-@pytest.fixture(scope="module")
-def uni_factory():
-    yield Contract.from_explorer("0x1F98431c8aD98523631AE4a59f267346ea31F984")
+@pytest.fixture(scope="session")
+def uni_factory(contract_at):
+    yield contract_at("UniswapV3Factory",
+                      "0x1F98431c8aD98523631AE4a59f267346ea31F984")
 
 
-@pytest.fixture(scope="module")
-def pool_daiweth_30bps():
-    yield Contract.from_explorer("0xC2e9F25Be6257c210d7Adf0D4Cd6E3E881ba25f8")
+@pytest.fixture(scope="session")
+def pool_daiweth_30bps(contract_at):
+    yield contract_at("UniswapV3Pool",
+                      "0xC2e9F25Be6257c210d7Adf0D4Cd6E3E881ba25f8")
 
 
-@pytest.fixture(scope="module")
-def pool_uniweth_30bps():
+@pytest.fixture(scope="session")
+def pool_uniweth_30bps(contract_at):
     # to be used as example ovlweth pool
-    yield Contract.from_explorer("0x1d42064Fc4Beb5F8aAF85F4617AE8b3b5B8Bd801")
+    yield contract_at("UniswapV3Pool",
+                      "0x1d42064Fc4Beb5F8aAF85F4617AE8b3b5B8Bd801")
 
 
-@pytest.fixture(scope="module", params=[(600, 3600, 200)])
+@pytest.fixture(scope="session", params=[(600, 3600, 200)])
 def create_quanto_feed(gov, pool_daiweth_30bps, pool_uniweth_30bps,
                        dai, weth, uni, request):
     micro, macro, cardinality = request.param
@@ -81,12 +84,14 @@ def create_quanto_feed(gov, pool_daiweth_30bps, pool_uniweth_30bps,
     yield create_quanto_feed
 
 
+# NOTE: module scoped since other modules' isolation fixtures reset the
+# chain, which would drop a session scoped deploy
 @pytest.fixture(scope="module")
 def quanto_feed(create_quanto_feed):
     yield create_quanto_feed()
 
 
-@pytest.fixture(scope="module", params=[(600, 3600, 200)])
+@pytest.fixture(scope="session", params=[(600, 3600, 200)])
 def create_inverse_feed(gov, pool_uniweth_30bps, weth, uni, request):
     micro, macro, cardinality = request.param
 
@@ -114,6 +119,8 @@ def create_inverse_feed(gov, pool_uniweth_30bps, weth, uni, request):
     yield create_inverse_feed
 
 
+# NOTE: module scoped since other modules' isolation fixtures reset the
+# chain, which would drop a session scoped deploy
 @pytest.fixture(scope="module")
 def inverse_feed(create_inverse_feed):
     yield create_inverse_feed()
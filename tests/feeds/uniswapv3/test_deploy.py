@@ -1,116 +1,70 @@
 import pytest
-from brownie import Contract, OverlayV1UniswapV3Feed, reverts
+from brownie import OverlayV1UniswapV3Feed, reverts
+
+
+@pytest.fixture(scope="session")
+def usdc(contract_at):
+    yield contract_at("ERC20", "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48")
+
+
+@pytest.fixture(scope="session")
+def pool_daiusdc_5bps(contract_at):
+    yield contract_at("UniswapV3Pool",
+                      "0x6c6Bc977E13Df9b0de53b251522280BB72383700")
+
+
+# NOTE: overrides to the default (valid) feed deploy args. Contract args are
+# fixture names resolved at test time
+DEPLOY_FEED_REVERT_CASES = [
+    ({"market_pool": "pool_daiusdc_5bps", "market_base_token": "dai",
+      "market_quote_token": "usdc",
+      "market_base_amount": 1000000000000000000},
+     "OVLV1: marketToken != X"),
+    ({"market_base_token": "rando", "market_quote_token": "weth"},
+     "OVLV1: marketToken != marketBaseToken"),
+    ({"market_base_token": "dai", "market_quote_token": "rando"},
+     "OVLV1: marketToken != marketQuoteToken"),
+    ({"ovlweth_pool": "pool_daiusdc_5bps", "ovl": "dai",
+      "market_base_token": "dai", "market_quote_token": "weth"},
+     "OVLV1: marketToken != X"),
+    ({"ovl": "dai", "market_base_token": "dai",
+      "market_quote_token": "weth"},
+     "OVLV1: ovlXToken != OVL"),
+]
+
+
+@pytest.mark.parametrize("overrides,revert_msg", DEPLOY_FEED_REVERT_CASES,
+                         ids=["market_token_not_weth",
+                              "market_token_not_base",
+                              "market_token_not_quote",
+                              "weth_not_in_ovlweth_pool",
+                              "ovl_not_in_ovlweth_pool"])
+def test_deploy_feed_reverts(gov, overrides, revert_msg, request):
+    args = {
+        "market_pool": "pool_daiweth_30bps",
+        "ovlweth_pool": "pool_uniweth_30bps",
+        "ovl": "uni",
+        "market_base_token": "weth",
+        "market_quote_token": "dai",
+        "market_base_amount": 1000000,
+    }
+    args.update(overrides)
+
+    # resolve fixture names to contracts/accounts
+    contracts = {k: request.getfixturevalue(v) for k, v in args.items()
+                 if isinstance(v, str)}
+    args.update(contracts)
 
-
-@pytest.fixture
-def usdc():
-    yield Contract.from_explorer("0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48")
-
-
-@pytest.fixture
-def pool_daiusdc_5bps():
-    yield Contract.from_explorer("0x6c6Bc977E13Df9b0de53b251522280BB72383700")
-
-
-def test_deploy_feed_reverts_on_market_token_not_weth(gov, dai, usdc, uni,
-                                                      pool_daiusdc_5bps,
-                                                      pool_uniweth_30bps):
-    market_pool = pool_daiusdc_5bps
-    ovlweth_pool = pool_uniweth_30bps
-    ovl = uni
-    market_base_token = dai
-    market_quote_token = usdc
-    market_base_amount = 1000000000000000000
-    micro_window = 600
-    macro_window = 3600
-    cardinality = 200
-
-    with reverts("OVLV1: marketToken != X"):
-        gov.deploy(OverlayV1UniswapV3Feed, market_pool,
-                   market_base_token, market_quote_token,
-                   market_base_amount, ovlweth_pool, ovl,
-                   micro_window, macro_window, cardinality, cardinality)
-
-
-def test_deploy_feed_reverts_on_market_token_not_base(gov, weth,
-                                                      dai, rando, uni,
-                                                      pool_daiweth_30bps,
-                                                      pool_uniweth_30bps):
-    market_pool = pool_daiweth_30bps
-    ovlweth_pool = pool_uniweth_30bps
-    ovl = uni
-    market_base_token = rando
-    market_quote_token = weth
-    market_base_amount = 1000000
-    micro_window = 600
-    macro_window = 3600
-    cardinality = 200
-
-    with reverts("OVLV1: marketToken != marketBaseToken"):
-        gov.deploy(OverlayV1UniswapV3Feed, market_pool,
-                   market_base_token, market_quote_token,
-                   market_base_amount, ovlweth_pool, ovl,
-                   micro_window, macro_window, cardinality, cardinality)
-
-
-def test_deploy_feed_reverts_on_market_token_not_quote(gov, dai, rando, uni,
-                                                       pool_daiweth_30bps,
-                                                       pool_uniweth_30bps):
-    market_pool = pool_daiweth_30bps
-    ovlweth_pool = pool_uniweth_30bps
-    ovl = uni
-    market_base_token = dai
-    market_quote_token = rando
-    market_base_amount = 1000000
-    micro_window = 600
-    macro_window = 3600
-    cardinality = 200
-
-    with reverts("OVLV1: marketToken != marketQuoteToken"):
-        gov.deploy(OverlayV1UniswapV3Feed, market_pool,
-                   market_base_token, market_quote_token,
-                   market_base_amount, ovlweth_pool, ovl,
-                   micro_window, macro_window, cardinality, cardinality)
-
-
-def test_deploy_feed_reverts_on_weth_not_in_ovlweth_pool(gov, weth, dai,
-                                                         pool_daiweth_30bps,
-                                                         pool_daiusdc_5bps):
-    market_pool = pool_daiweth_30bps
-    ovlweth_pool = pool_daiusdc_5bps
-    ovl = dai
-    market_base_token = dai
-    market_quote_token = weth
-    market_base_amount = 1000000
     micro_window = 600
     macro_window = 3600
     cardinality = 200
 
-    with reverts("OVLV1: marketToken != X"):
-        gov.deploy(OverlayV1UniswapV3Feed, market_pool,
-                   market_base_token, market_quote_token,
-                   market_base_amount, ovlweth_pool, ovl,
-                   micro_window, macro_window, cardinality, cardinality)
-
-
-def test_deploy_feed_reverts_on_ovl_not_in_ovlweth_pool(gov, weth, dai,
-                                                        pool_daiweth_30bps,
-                                                        pool_uniweth_30bps):
-    market_pool = pool_daiweth_30bps
-    ovlweth_pool = pool_uniweth_30bps
-    ovl = dai
-    market_base_token = dai
-    market_quote_token = weth
-    market_base_amount = 1000000
-    micro_window = 600
-    macro_window = 3600
-    cardinality = 200
-
-    with reverts("OVLV1: ovlXToken != OVL"):
-        gov.deploy(OverlayV1UniswapV3Feed, market_pool,
-                   market_base_token, market_quote_token,
-                   market_base_amount, ovlweth_pool, ovl,
-                   micro_window, macro_window, cardinality, cardinality)
+    with reverts(revert_msg):
+        gov.deploy(OverlayV1UniswapV3Feed, args["market_pool"],
+                   args["market_base_token"], args["market_quote_token"],
+                   args["market_base_amount"], args["ovlweth_pool"],
+                   args["ovl"], micro_window, macro_window, cardinality,
+                   cardinality)
 
 
 def test_deploy_feed_reverts_on_cardinal_in_market_pool(gov, weth, dai, uni,
@@ -1,14 +1,34 @@
+import pytest
 from brownie import chain
 
 
-def test_latest_updates_data_on_first_call_for_quanto_feed(pool_daiweth_30bps,
-                                                           pool_uniweth_30bps,
-                                                           quanto_feed):
-    micro_window = quanto_feed.microWindow()
-    macro_window = quanto_feed.macroWindow()
-    market_base_amount = quanto_feed.marketBaseAmount()
-    market_base_token = quanto_feed.marketBaseToken()
-    market_quote_token = quanto_feed.marketQuoteToken()
+def feed_immutables(feed):
+    """
+    Returns (micro_window, macro_window, market_base_amount,
+    market_base_token, market_quote_token) set on feed deploy
+    """
+    return (feed.microWindow(), feed.macroWindow(), feed.marketBaseAmount(),
+            feed.marketBaseToken(), feed.marketQuoteToken())
+
+
+# NOTE: feed immutables are constant for the module scoped feeds so only
+# fetch them once per module
+@pytest.fixture(scope="module")
+def quanto_feed_immutables(quanto_feed):
+    yield feed_immutables(quanto_feed)
+
+
+@pytest.fixture(scope="module")
+def inverse_feed_immutables(inverse_feed):
+    yield feed_immutables(inverse_feed)
+
+
+def test_latest_updates_data_on_first_call_for_quanto_feed(
+    pool_daiweth_30bps, pool_uniweth_30bps, quanto_feed,
+    quanto_feed_immutables
+):
+    (micro_window, macro_window, market_base_amount, market_base_token,
+     market_quote_token) = quanto_feed_immutables
     timestamp = chain[-1]['timestamp']
 
     actual = quanto_feed.latest()
@@ -44,13 +64,11 @@ def test_latest_updates_data_on_first_call_for_quanto_feed(pool_daiweth_30bps,
     assert expect == actual
 
 
-def test_latest_updates_data_on_first_call_for_inverse_feed(pool_uniweth_30bps,
-                                                            inverse_feed):
-    micro_window = inverse_feed.microWindow()
-    macro_window = inverse_feed.macroWindow()
-    market_base_amount = inverse_feed.marketBaseAmount()
-    market_base_token = inverse_feed.marketBaseToken()
-    market_quote_token = inverse_feed.marketQuoteToken()
+def test_latest_updates_data_on_first_call_for_inverse_feed(
+    pool_uniweth_30bps, inverse_feed, inverse_feed_immutables
+):
+    (micro_window, macro_window, market_base_amount, market_base_token,
+     market_quote_token) = inverse_feed_immutables
     timestamp = chain[-1]['timestamp']
 
     actual = inverse_feed.latest()
@@ -86,14 +104,12 @@ def test_latest_updates_data_on_first_call_for_inverse_feed(pool_uniweth_30bps,
     assert expect == actual
 
 
-def test_latest_updates_data_on_many_calls_for_quanto_feed(pool_daiweth_30bps,
-                                                           pool_uniweth_30bps,
-                                                           quanto_feed):
-    micro_window = quanto_feed.microWindow()
-    macro_window = quanto_feed.macroWindow()
-    market_base_amount = quanto_feed.marketBaseAmount()
-    market_base_token = quanto_feed.marketBaseToken()
-    market_quote_token = quanto_feed.marketQuoteToken()
+def test_latest_updates_data_on_many_calls_for_quanto_feed(
+    pool_daiweth_30bps, pool_uniweth_30bps, quanto_feed,
+    quanto_feed_immutables
+):
+    (micro_window, macro_window, market_base_amount, market_base_token,
+     market_quote_token) = quanto_feed_immutables
 
     # fetch from feed 3 times in a row w 60s in between
     for i in range(3):
@@ -132,13 +148,11 @@ def test_latest_updates_data_on_many_calls_for_quanto_feed(pool_daiweth_30bps,
         assert expect == actual
 
 
-def test_latest_updates_data_on_many_calls_for_inverse_feed(pool_uniweth_30bps,
-                                                            inverse_feed):
-    micro_window = inverse_feed.microWindow()
-    macro_window = inverse_feed.macroWindow()
-    market_base_amount = inverse_feed.marketBaseAmount()
-    market_base_token = inverse_feed.marketBaseToken()
-    market_quote_token = inverse_feed.marketQuoteToken()
+def test_latest_updates_data_on_many_calls_for_inverse_feed(
+    pool_uniweth_30bps, inverse_feed, inverse_feed_immutables
+):
+    (micro_window, macro_window, market_base_amount, market_base_token,
+     market_quote_token) = inverse_feed_immutables
 
     # fetch from feed 3 times in a row w 60s in between
     for i in range(3):
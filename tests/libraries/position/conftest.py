@@ -38,3 +38,17 @@ def position(create_position):
 @pytest.fixture(scope="module")
 def mid_resolution():
     yield 100000000000000  # 1e14
+
+
+@pytest.fixture(scope="module")
+def sample_pos(position):
+    # NOTE: mid_ratio tests in test_entry_price.py
+    entry_price = 100000000000000000000  # 100
+    mid_ratio = position.calcEntryToMidRatio(entry_price, entry_price)
+
+    is_long = True
+    liquidated = False
+    notional = 10000000000000000000  # 10
+    debt = 8000000000000000000  # 8
+    oi = notional * 1000000000000000000 // entry_price  # 0.1
+    yield (notional, debt, mid_ratio, is_long, liquidated, oi)
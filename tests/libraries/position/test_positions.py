@@ -10,21 +10,11 @@ def get_position_key(owner: str, id: int) -> HexBytes:
     return web3.solidityKeccak(['address', 'uint256'], [owner, id])
 
 
-def test_positions_setter(position, alice):
+def test_positions_setter(position, alice, sample_pos):
     owner = alice
     id = 0
 
-    is_long = True
-    liquidated = False
-    entry_price = 100000000000000000000  # 100
-    notional = 10000000000000000000  # 10
-    debt = 8000000000000000000  # 8
-
-    oi = int((notional / entry_price) * 1000000000000000000)  # 0.1
-    # NOTE: mid_ratio tests in test_entry_price.py
-    mid_ratio = position.calcEntryToMidRatio(entry_price, entry_price)
-
-    pos = (notional, debt, mid_ratio, is_long, liquidated, oi)
+    pos = sample_pos
     position.set(owner, id, pos)
 
     # pos key
@@ -36,22 +26,12 @@ def test_positions_setter(position, alice):
     assert expect == actual
 
 
-def test_positions_getter(position, bob):
+def test_positions_getter(position, bob, sample_pos):
     owner = bob
     id = 1
 
     # add the position first
-    is_long = True
-    liquidated = False
-    entry_price = 100000000000000000000  # 100
-    notional = 10000000000000000000  # 10
-    debt = 8000000000000000000  # 8
-
-    oi = int((notional / entry_price) * 1000000000000000000)  # 0.1
-    # NOTE: mid_ratio tests in test_entry_price.py
-    mid_ratio = position.calcEntryToMidRatio(entry_price, entry_price)
-
-    pos = (notional, debt, mid_ratio, is_long, liquidated, oi)
+    pos = sample_pos
     position.set(owner, id, pos)
 
     # check retrieved position is expected
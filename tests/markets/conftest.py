@@ -1,10 +1,12 @@
 import pytest
 from brownie import (
-    Contract, OverlayV1Token, OverlayV1Market, OverlayV1Factory,
+    multicall, OverlayV1Token, OverlayV1Market, OverlayV1Factory,
     OverlayV1UniswapV3Factory, OverlayV1FeedFactoryMock,
     OverlayV1FeedMock, OverlayV1Deployer, OverlayV1UniswapV3Feed, web3
 )
 
+from .utils import multicall_latest, RiskParameter
+
 
 @pytest.fixture(scope="module")
 def gov(accounts):
@@ -36,6 +38,14 @@ def fake_factory(accounts):
     yield accounts[5]
 
 
+# NOTE: deployed once per module so brownie's multicall context manager
+# reuses it rather than deploying a new Multicall2 on entry (reverted by
+# fn_isolation). module scoped to run after module_isolation's chain reset
+@pytest.fixture(scope="module")
+def multicall2(accounts):
+    yield multicall.deploy({"from": accounts[0]})
+
+
 @pytest.fixture(scope="module")
 def minter_role():
     yield web3.solidityKeccak(['string'], ["MINTER"])
@@ -96,35 +106,38 @@ def fake_feed(create_fake_feed):
 
 
 @pytest.fixture(scope="module")
-def dai():
-    yield Contract.from_explorer("0x6B175474E89094C44Da98b954EedeAC495271d0F")
+def dai(contract_at):
+    yield contract_at("ERC20", "0x6B175474E89094C44Da98b954EedeAC495271d0F")
 
 
 @pytest.fixture(scope="module")
-def weth():
-    yield Contract.from_explorer("0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2")
+def weth(contract_at):
+    yield contract_at("ERC20", "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2")
 
 
 @pytest.fixture(scope="module")
-def uni():
+def uni(contract_at):
     # to be used as example ovl
-    yield Contract.from_explorer("0x1f9840a85d5aF5bf1D1762F925BDADdC4201F984")
+    yield contract_at("ERC20", "0x1f9840a85d5aF5bf1D1762F925BDADdC4201F984")
 
 
 @pytest.fixture(scope="module")
-def uni_factory():
-    yield Contract.from_explorer("0x1F98431c8aD98523631AE4a59f267346ea31F984")
+def uni_factory(contract_at):
+    yield contract_at("UniswapV3Factory",
+                      "0x1F98431c8aD98523631AE4a59f267346ea31F984")
 
 
 @pytest.fixture(scope="module")
-def pool_daiweth_30bps():
-    yield Contract.from_explorer("0xC2e9F25Be6257c210d7Adf0D4Cd6E3E881ba25f8")
+def pool_daiweth_30bps(contract_at):
+    yield contract_at("UniswapV3Pool",
+                      "0xC2e9F25Be6257c210d7Adf0D4Cd6E3E881ba25f8")
 
 
 @pytest.fixture(scope="module")
-def pool_uniweth_30bps():
+def pool_uniweth_30bps(contract_at):
     # to be used as example ovlweth pool
-    yield Contract.from_explorer("0x1d42064Fc4Beb5F8aAF85F4617AE8b3b5B8Bd801")
+    yield contract_at("UniswapV3Pool",
+                      "0x1d42064Fc4Beb5F8aAF85F4617AE8b3b5B8Bd801")
 
 
 # TODO: change params to (600, 3600, 300, 14)
@@ -324,3 +337,28 @@ def market(gov, feed, feed_factory, factory, ovl, create_market, request):
     yield create_market(feed=feed, feed_factory=feed_factory,
                         factory=factory, risk_params=risk_params,
                         governance=gov, ovl=ovl)
+
+
+# NOTE: risk params are constant for the module unless set in a test, so
+# read once in a single eth_call
+@pytest.fixture(scope="module")
+def risk_params(market, multicall2):
+    with multicall_latest():
+        params = {rp: market.params(rp) for rp in RiskParameter}
+    yield {rp: int(value) for rp, value in params.items()}
+
+
+@pytest.fixture(scope="module")
+def mock_risk_params(mock_market, multicall2):
+    with multicall_latest():
+        params = {rp: mock_market.params(rp) for rp in RiskParameter}
+    yield {rp: int(value) for rp, value in params.items()}
+
+
+# NOTE: max approve market spending once per module, before the isolation
+# snapshot, so builds don't each need their own approve tx
+@pytest.fixture(scope="module")
+def approve_market(ovl, market, mock_market, alice, bob):
+    for trader in (alice, bob):
+        ovl.approve(market, 2**256-1, {"from": trader})
+        ovl.approve(mock_market, 2**256-1, {"from": trader})
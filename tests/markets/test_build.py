@@ -1,21 +1,127 @@
 import pytest
+from collections import namedtuple
 from pytest import approx
 from brownie import chain, reverts
 from brownie.test import given, strategy
 from decimal import Decimal
+from hypothesis import example
 from math import log
-from random import randint
+from random import Random
 
 from .utils import (
-    calculate_position_info,
+    calculate_position_info_int,
     get_position_key,
     mid_from_feed,
     entry_from_mid_ratio,
     calculate_mid_ratio,
-    RiskParameter
+    iapprox,
+    multicall_latest,
+    RiskParameter,
+    ONE,
+    ONE_E18
 )
 
 
+MarketParams = namedtuple("MarketParams", [
+    "trading_fee_rate", "cap_notional", "cap_leverage", "min_collateral"
+])
+
+
+@pytest.fixture(scope="module")
+def market_params(market, multicall2):
+    # NOTE: risk params are constant for the module unless set in a test
+    idx_trade = RiskParameter.TRADING_FEE_RATE
+    idx_cap_notional = RiskParameter.CAP_NOTIONAL
+    idx_cap_leverage = RiskParameter.CAP_LEVERAGE
+    idx_min_collateral = RiskParameter.MIN_COLLATERAL
+
+    # batch the param reads into a single eth_call
+    with multicall_latest():
+        trading_fee_rate = market.params(idx_trade)
+        cap_notional = market.params(idx_cap_notional)
+        cap_leverage = market.params(idx_cap_leverage)
+        min_collateral = market.params(idx_min_collateral)
+
+    yield MarketParams(
+        trading_fee_rate=int(trading_fee_rate),
+        cap_notional=int(cap_notional),
+        cap_leverage=int(cap_leverage),
+        min_collateral=int(min_collateral)
+    )
+
+
+MockMarketParams = namedtuple("MockMarketParams", [
+    "delta", "lmbda", "maintenance_fraction", "liq_fee_rate", "cap_notional"
+])
+
+
+@pytest.fixture(scope="module")
+def mock_market_params(mock_market, multicall2):
+    # NOTE: risk params are constant for the module unless set in a test
+    idx_delta = RiskParameter.DELTA
+    idx_lmbda = RiskParameter.LMBDA
+    idx_mmf = RiskParameter.MAINTENANCE_MARGIN_FRACTION
+    idx_liq = RiskParameter.LIQUIDATION_FEE_RATE
+    idx_cap_notional = RiskParameter.CAP_NOTIONAL
+
+    # batch the param reads into a single eth_call
+    with multicall_latest():
+        delta = mock_market.params(idx_delta)
+        lmbda = mock_market.params(idx_lmbda)
+        maintenance_fraction = mock_market.params(idx_mmf)
+        liq_fee_rate = mock_market.params(idx_liq)
+        cap_notional = mock_market.params(idx_cap_notional)
+
+    yield MockMarketParams(
+        delta=int(delta),
+        lmbda=int(lmbda),
+        maintenance_fraction=int(maintenance_fraction),
+        liq_fee_rate=int(liq_fee_rate),
+        cap_notional=int(cap_notional)
+    )
+
+
+# NOTE: (notional, leverage, is_long) bounds of the build strategies,
+# always run so fewer random examples are needed per test (see the
+# hypothesis profiles in tests/conftest.py)
+BUILD_EDGE_CASES = [
+    (Decimal("0.001"), Decimal("1.0"), True),
+    (Decimal("0.001"), Decimal("5.0"), False),
+    (Decimal("80000"), Decimal("1.0"), False),
+    (Decimal("80000"), Decimal("5.0"), True),
+]
+
+
+def build_edge_cases(test):
+    """
+    Pins BUILD_EDGE_CASES as explicit hypothesis examples on test
+    """
+    for notional, leverage, is_long in BUILD_EDGE_CASES:
+        test = example(notional=notional, leverage=leverage,
+                       is_long=is_long)(test)
+    return test
+
+
+def build_position(market, trader, notional, leverage, is_long,
+                   trading_fee_rate):
+    """
+    Builds position of notional, leverage (Decimal) on market from trader.
+    Returns build tx and expected (collateral, debt, trade_fee) in wei
+    """
+    collateral, _, debt, trade_fee = calculate_position_info_int(
+        int(notional * ONE_E18), int(leverage * ONE_E18), trading_fee_rate)
+
+    # NOTE: slippage tests in test_slippage.py
+    # NOTE: setting to min/max here, so never reverts with slippage>max
+    input_price_limit = 2**256-1 if is_long else 0
+    tx = market.build(collateral, int(leverage * ONE_E18), is_long,
+                      input_price_limit, {"from": trader})
+    return tx, collateral, debt, trade_fee
+
+
+pytestmark = pytest.mark.usefixtures("approve_market")
+
+
 # NOTE: Tests passing with isolation fixture
 # TODO: Fix tests to pass even without isolation fixture (?)
 @pytest.fixture(autouse=True)
@@ -23,57 +129,73 @@ def isolation(fn_isolation):
     pass
 
 
+@build_edge_cases
 @given(
     notional=strategy('decimal', min_value='0.001', max_value='80000',
                       places=3),
     leverage=strategy('decimal', min_value='1.0', max_value='5.0', places=3),
     is_long=strategy('bool'))
-def test_build_creates_position(market, feed, ovl, alice, notional, leverage,
-                                is_long):
+def test_build(market, factory, feed, ovl, alice, market_params, multicall2,
+               notional, leverage, is_long):
+    # NOTE: single build tx checked for position info, oi, transfers and
+    # balances (trader, market, fee recipient) so each example only sends
+    # one build
     # NOTE: current position id is zero given isolation fixture
     expect_pos_id = 0
 
-    # calculate expected pos info data
-    idx_trade = RiskParameter.TRADING_FEE_RATE.value
-    trading_fee_rate = Decimal(market.params(idx_trade) / 1e18)
-    collateral, notional, debt, trade_fee \
-        = calculate_position_info(notional, leverage, trading_fee_rate)
-
-    # input values for tx
-    input_collateral = int((collateral) * Decimal(1e18))
-    input_leverage = int(leverage * Decimal(1e18))
-    input_is_long = is_long
-
-    # NOTE: slippage tests in test_slippage.py
-    # NOTE: setting to min/max here, so never reverts with slippage>max
-    input_price_limit = 2**256-1 if is_long else 0
-
-    # approve collateral amount: collateral + trade fee
-    approve_collateral = int((collateral + trade_fee) * Decimal(1e18))
-
-    # approve market for spending then build
-    ovl.approve(market, approve_collateral, {"from": alice})
-    tx = market.build(input_collateral, input_leverage, input_is_long,
-                      input_price_limit, {"from": alice})
+    # priors actual values
+    # NOTE: no update() prior needed. oi is zero after isolation so build's
+    # own update() pays no funding
+    fee_recipient = factory.feeRecipient()
+
+    # NOTE: multicall results are lazy proxies so cast before arithmetic
+    with multicall_latest():
+        priors = (
+            market.oiLong() if is_long else market.oiShort(),
+            market.oiLongShares() if is_long else market.oiShortShares(),
+            ovl.balanceOf(alice),
+            ovl.balanceOf(market),
+            ovl.balanceOf(fee_recipient)
+        )
+    (expect_oi, expect_oi_shares, expect_balance_alice,
+     expect_balance_market, expect_balance_recipient) \
+        = [int(prior) for prior in priors]
+
+    tx, collateral, debt, trade_fee = build_position(
+        market, alice, notional, leverage, is_long,
+        market_params.trading_fee_rate)
 
     # check position id
-    actual_pos_id = tx.return_value
+    # NOTE: read from Build event, as tx.return_value requests a
+    # debug_traceTransaction. return value checked in
+    # test_build_updates_market
+    actual_pos_id = tx.events["Build"]["positionId"]
     assert actual_pos_id == expect_pos_id
 
+    # batch the post build state reads into a single eth_call
+    expect_pos_key = get_position_key(alice.address, expect_pos_id)
+    with multicall_latest():
+        actual_pos = market.positions(expect_pos_key)
+        actual_oi = market.oiLong() if is_long else market.oiShort()
+        actual_oi_shares = market.oiLongShares() \
+            if is_long else market.oiShortShares()
+        actual_balance_alice = ovl.balanceOf(alice)
+        actual_balance_market = ovl.balanceOf(market)
+        actual_balance_recipient = ovl.balanceOf(fee_recipient)
+
     # calculate oi and expected entry price
     # NOTE: ask(), bid() tested in test_price.py
+    # NOTE: integer math in wei, converting notional from Decimal once
     data = feed.latest()
-    mid = Decimal(mid_from_feed(data)) / Decimal(1e18)
-    oi = notional / mid
+    mid = mid_from_feed(data)
+    notional_e18 = int(notional * ONE_E18)
+    oi = notional_e18 * ONE // mid
 
-    idx_cap_notional = RiskParameter.CAP_NOTIONAL.value
-    cap_notional = Decimal(
-        market.capNotionalAdjustedForBounds(
-            data, market.params(idx_cap_notional))) \
-        / Decimal(1e18)
-    cap_oi = (Decimal(cap_notional) / mid)
+    cap_notional = int(market.capNotionalAdjustedForBounds(
+        data, market_params.cap_notional))
+    cap_oi = cap_notional * ONE // mid
 
-    volume = int((oi / cap_oi) * Decimal(1e18))  # TODO: circuit breaker adj
+    volume = oi * ONE // cap_oi  # TODO: circuit breaker adj
     price = market.ask(data, volume) if is_long \
         else market.bid(data, volume)
 
@@ -81,20 +203,17 @@ def test_build_creates_position(market, feed, ovl, alice, notional, leverage,
     expect_is_long = is_long
     expect_liquidated = False
     expect_entry_price = price
-    expect_notional_initial = int(notional * Decimal(1e18))
-    expect_oi_initial = int(oi * Decimal(1e18))
-    expect_debt = int(debt * Decimal(1e18))
-    expect_mid_ratio = calculate_mid_ratio(price, int(mid_from_feed(data)))
+    expect_notional_initial = notional_e18
+    expect_oi_initial = oi
+    expect_debt = debt
+    expect_mid_ratio = calculate_mid_ratio(price, mid)
 
     # check position info
-    expect_pos_key = get_position_key(alice.address, expect_pos_id)
-    actual_pos = market.positions(expect_pos_key)
     (actual_notional_initial, actual_debt, actual_mid_ratio,
      actual_is_long, actual_liquidated, actual_oi_initial) = actual_pos
 
     # calculate the entry price
-    mid_price = int(mid_from_feed(data))
-    actual_entry_price = entry_from_mid_ratio(actual_mid_ratio, mid_price)
+    actual_entry_price = entry_from_mid_ratio(actual_mid_ratio, mid)
 
     assert actual_is_long == expect_is_long
     assert actual_liquidated == expect_liquidated
@@ -107,66 +226,52 @@ def test_build_creates_position(market, feed, ovl, alice, notional, leverage,
     # check build event
     assert "Build" in tx.events
     assert tx.events["Build"]["sender"] == alice.address
-    assert tx.events["Build"]["positionId"] == actual_pos_id
     assert tx.events["Build"]["oi"] == actual_oi_initial
     assert tx.events["Build"]["debt"] == actual_debt
     assert tx.events["Build"]["isLong"] == actual_is_long
     assert int(tx.events["Build"]["price"]) == approx(actual_entry_price)
 
+    # check aggregate oi values added to
+    expect_oi += oi
+    expect_oi_shares += oi
 
-@given(
-    notional=strategy('decimal', min_value='0.001', max_value='80000',
-                      places=3),
-    leverage=strategy('decimal', min_value='1.0', max_value='5.0', places=3),
-    is_long=strategy('bool'))
-def test_build_adds_oi(market, feed, ovl, alice, notional, leverage, is_long):
-    # calculate expected pos info data
-    idx_trade = RiskParameter.TRADING_FEE_RATE.value
-    trading_fee_rate = Decimal(market.params(idx_trade) / 1e18)
-    collateral, notional, debt, trade_fee \
-        = calculate_position_info(notional, leverage, trading_fee_rate)
-
-    # input values for tx
-    input_collateral = int(collateral * Decimal(1e18))
-    input_leverage = int(leverage * Decimal(1e18))
-    input_is_long = is_long
-
-    # NOTE: slippage tests in test_slippage.py
-    # NOTE: setting to min/max here, so never reverts with slippage>max
-    input_price_limit = 2**256-1 if is_long else 0
+    assert int(actual_oi) == approx(expect_oi)
+    assert int(actual_oi_shares) == approx(expect_oi_shares)
 
-    # approve collateral amount: collateral + trade fee
-    approve_collateral = int((collateral + trade_fee) * Decimal(1e18))
+    # check Transfer events for:
+    # 1. collateral in; 2. trade fees out
+    expect_collateral_in = collateral + trade_fee
+    expect_trade_fee = trade_fee
 
-    # priors actual values
-    _ = market.update({"from": alice})  # update funding prior
-    expect_oi = market.oiLong() if is_long else market.oiShort()
-    expect_oi_shares = market.oiLongShares() \
-        if is_long else market.oiShortShares()
+    assert 'Transfer' in tx.events
+    assert len(tx.events['Transfer']) == 2
 
-    # approve market for spending then build
-    ovl.approve(market, approve_collateral, {"from": alice})
-    _ = market.build(input_collateral, input_leverage, input_is_long,
-                     input_price_limit, {"from": alice})
+    # check collateral in event (1)
+    assert tx.events['Transfer'][0]['from'] == alice.address
+    assert tx.events['Transfer'][0]['to'] == market.address
+    assert int(tx.events['Transfer'][0]['value']) == \
+        approx(expect_collateral_in)
 
-    # calculate oi
-    data = feed.latest()
-    mid = Decimal(mid_from_feed(data)) / Decimal(1e18)
-    oi = notional / mid
+    # check trade fee out event (2)
+    assert tx.events['Transfer'][1]['from'] == market.address
+    assert tx.events['Transfer'][1]['to'] == fee_recipient
+    assert int(tx.events['Transfer'][1]['value']) == approx(expect_trade_fee)
 
-    # calculate expected oi info data
-    expect_oi += int(oi * Decimal(1e18))
-    expect_oi_shares += int(oi * Decimal(1e18))
+    # check collateral transferred to market and trading fees to recipient
+    # NOTE: exact given transfer values checked against expected above
+    transfer_in = tx.events['Transfer'][0]['value']
+    transfer_out = tx.events['Transfer'][1]['value']
 
-    # compare with actual aggregate oi values
-    actual_oi = market.oiLong() if is_long else market.oiShort()
-    actual_oi_shares = market.oiLongShares() if is_long else market.oiShort()
+    expect_balance_alice -= transfer_in
+    expect_balance_market += transfer_in - transfer_out
+    expect_balance_recipient += transfer_out
 
-    assert int(actual_oi) == approx(expect_oi)
-    assert int(actual_oi_shares) == approx(expect_oi_shares)
+    assert int(actual_balance_alice) == expect_balance_alice
+    assert int(actual_balance_market) == expect_balance_market
+    assert int(actual_balance_recipient) == expect_balance_recipient
 
 
-def test_build_updates_market(market, ovl, alice):
+def test_build_updates_market(market, ovl, alice, market_params):
     # position build attributes
     notional_initial = Decimal(1000)
     leverage = Decimal(1.5)
@@ -175,32 +280,16 @@ def test_build_updates_market(market, ovl, alice):
     # cache prior timestamp update last value
     prior_timestamp_update_last = market.timestampUpdateLast()
 
-    # mine the chain forward for some time difference with build
-    chain.mine(timedelta=600)
+    # advance time for some difference with build. build tx mines the block
+    chain.sleep(600)
 
-    # calculate expected pos info data
-    idx_trade = RiskParameter.TRADING_FEE_RATE.value
-    trading_fee_rate = Decimal(market.params(idx_trade) / 1e18)
-    collateral, _, _, trade_fee \
-        = calculate_position_info(notional_initial, leverage, trading_fee_rate)
-
-    # input values for build
-    input_collateral = int(collateral * Decimal(1e18))
-    input_leverage = int(leverage * Decimal(1e18))
-    input_is_long = is_long
+    tx, _, _, _ = build_position(market, alice, notional_initial, leverage,
+                                 is_long, market_params.trading_fee_rate)
 
-    # NOTE: slippage tests in test_slippage.py
-    # NOTE: setting to min/max here, so never reverts with slippage>max
-    input_price_limit = 2**256-1 if is_long else 0
-
-    # approve collateral amount: collateral + trade fee
-    approve_collateral = int((collateral + trade_fee) * Decimal(1e18))
-
-    # approve then build
-    # NOTE: build() tests in test_build.py
-    ovl.approve(market, approve_collateral, {"from": alice})
-    tx = market.build(input_collateral, input_leverage, input_is_long,
-                      input_price_limit, {"from": alice})
+    # check build() returns the position id emitted in Build event
+    # NOTE: current position id is zero given isolation fixture
+    assert tx.return_value == 0
+    assert tx.events["Build"]["positionId"] == 0
 
     # get the expected timestamp and check equal to actual
     expect_timestamp_update_last = chain[tx.block_number]['timestamp']
@@ -210,59 +299,37 @@ def test_build_updates_market(market, ovl, alice):
     assert actual_timestamp_update_last != prior_timestamp_update_last
 
 
+@build_edge_cases
 @given(
     notional=strategy('decimal', min_value='0.001', max_value='80000',
                       places=3),
     leverage=strategy('decimal', min_value='1.0', max_value='5.0', places=3),
     is_long=strategy('bool'))
-def test_build_registers_volume(market, feed, ovl, alice, notional, leverage,
-                                is_long):
-    # calculate expected pos info data
-    idx_trade = RiskParameter.TRADING_FEE_RATE.value
-    trading_fee_rate = Decimal(market.params(idx_trade) / 1e18)
-    collateral, notional, debt, trade_fee \
-        = calculate_position_info(notional, leverage, trading_fee_rate)
-
-    # input values for the tx
-    input_collateral = int(collateral * Decimal(1e18))
-    input_leverage = int(leverage * Decimal(1e18))
-    input_is_long = is_long
-
-    # NOTE: slippage tests in test_slippage.py
-    # NOTE: setting to min/max here, so never reverts with slippage>max
-    input_price_limit = 2**256-1 if is_long else 0
-
-    # approve collateral amount: collateral + trade fee
-    approve_collateral = int((collateral + trade_fee) * Decimal(1e18))
-
-    # update funding prior
-    _ = market.update({"from": alice})
-
+def test_build_registers_volume(market, feed, ovl, alice, market_params,
+                                notional, leverage, is_long):
+    # NOTE: no update() prior needed. oi is zero after isolation so build's
+    # own update() pays no funding
     # priors actual values. longs get the ask, shorts get the bid on build
     snapshot_volume = market.snapshotVolumeAsk() if is_long else \
         market.snapshotVolumeBid()
     last_timestamp, last_window, last_volume = snapshot_volume
 
-    # approve market for spending then build
-    ovl.approve(market, approve_collateral, {"from": alice})
-    tx = market.build(input_collateral, input_leverage, input_is_long,
-                      input_price_limit, {"from": alice})
+    tx, _, _, _ = build_position(market, alice, notional, leverage, is_long,
+                                 market_params.trading_fee_rate)
 
     # calculate expected rolling volume and window numbers when
     # adjusted for decay
     # NOTE: decayOverWindow() tested in test_rollers.py
     data = feed.latest()
     _, micro_window, _, _, _, _, _, _ = data
-    mid = Decimal(mid_from_feed(data)) / Decimal(1e18)
+    mid = mid_from_feed(data)
 
-    oi = notional / mid
-    idx_cap_notional = RiskParameter.CAP_NOTIONAL.value
-    cap_notional = Decimal(
-        market.capNotionalAdjustedForBounds(
-            data, market.params(idx_cap_notional))/1e18)
-    cap_oi = cap_notional / mid
+    oi = int(notional * ONE_E18) * ONE // mid
+    cap_notional = int(market.capNotionalAdjustedForBounds(
+        data, market_params.cap_notional))
+    cap_oi = cap_notional * ONE // mid
 
-    input_volume = int((oi / cap_oi) * Decimal(1e18))
+    input_volume = oi * ONE // cap_oi
     input_window = micro_window
     input_timestamp = chain[tx.block_number]['timestamp']
 
@@ -291,192 +358,47 @@ def test_build_registers_volume(market, feed, ovl, alice, notional, leverage,
     assert int(actual_volume) == approx(expect_volume)
 
 
-@given(
-    notional=strategy('decimal', min_value='0.001', max_value='80000',
-                      places=3),
-    leverage=strategy('decimal', min_value='1.0', max_value='5.0', places=3),
-    is_long=strategy('bool'))
-def test_build_executes_transfers(market, factory, ovl, alice, notional,
-                                  leverage, is_long):
-    # calculate expected pos info data
-    idx_trade = RiskParameter.TRADING_FEE_RATE.value
-    trading_fee_rate = Decimal(market.params(idx_trade) / 1e18)
-    collateral, notional, debt, trade_fee \
-        = calculate_position_info(notional, leverage, trading_fee_rate)
-
-    # input values for the tx
-    input_collateral = int(collateral * Decimal(1e18))
-    input_leverage = int(leverage * Decimal(1e18))
-    input_is_long = is_long
-
-    # NOTE: slippage tests in test_slippage.py
-    # NOTE: setting to min/max here, so never reverts with slippage>max
-    input_price_limit = 2**256-1 if is_long else 0
-
-    # approve collateral amount: collateral + trade fee
-    # amount of collateral that will be transferred in
-    approve_collateral = int((collateral + trade_fee) * Decimal(1e18))
-
-    # approve market for spending then build
-    ovl.approve(market, approve_collateral, {"from": alice})
-    tx = market.build(input_collateral, input_leverage, input_is_long,
-                      input_price_limit, {"from": alice})
-
-    # expected values
-    expect_collateral_in = approve_collateral
-    expect_trade_fee = int(trade_fee * Decimal(1e18))
-
-    # check Transfer events for:
-    # 1. collateral in; 2. trade fees out
-    assert 'Transfer' in tx.events
-    assert len(tx.events['Transfer']) == 2
-
-    # check collateral in event (1)
-    assert tx.events['Transfer'][0]['from'] == alice.address
-    assert tx.events['Transfer'][0]['to'] == market.address
-    assert int(tx.events['Transfer'][0]['value']) == \
-        approx(expect_collateral_in)
-
-    # check trade fee out event (2)
-    assert tx.events['Transfer'][1]['from'] == market.address
-    assert tx.events['Transfer'][1]['to'] == factory.feeRecipient()
-    assert int(tx.events['Transfer'][1]['value']) == approx(expect_trade_fee)
-
-
-@given(
-    notional=strategy('decimal', min_value='0.001', max_value='80000',
-                      places=3),
-    leverage=strategy('decimal', min_value='1.0', max_value='5.0', places=3),
-    is_long=strategy('bool'))
-def test_build_transfers_collateral_to_market(market, ovl, alice, notional,
-                                              leverage, is_long):
-    # calculate expected pos info data
-    idx_trade = RiskParameter.TRADING_FEE_RATE.value
-    trading_fee_rate = Decimal(market.params(idx_trade) / 1e18)
-    collateral, notional, debt, trade_fee \
-        = calculate_position_info(notional, leverage, trading_fee_rate)
-
-    # input values for the tx
-    input_collateral = int(collateral * Decimal(1e18))
-    input_leverage = int(leverage * Decimal(1e18))
-    input_is_long = is_long
-
-    # NOTE: slippage tests in test_slippage.py
-    # NOTE: setting to min/max here, so never reverts with slippage>max
-    input_price_limit = 2**256-1 if is_long else 0
-
-    # approve collateral amount: collateral + trade fee
-    # amount of collateral that will be transferred in
-    approve_collateral = int((collateral + trade_fee) * Decimal(1e18))
-
-    # priors actual values
-    expect_balance_alice = ovl.balanceOf(alice)
-    expect_balance_market = ovl.balanceOf(market)
-
-    # approve market for spending then build
-    ovl.approve(market, approve_collateral, {"from": alice})
-    _ = market.build(input_collateral, input_leverage, input_is_long,
-                     input_price_limit, {"from": alice})
-
-    # calculate expected collateral info data
-    expect_collateral_in = int((collateral + trade_fee) * Decimal(1e18))
-    expect_balance_alice -= expect_collateral_in
-    expect_balance_market += int(collateral * Decimal(1e18))
-
-    actual_balance_alice = ovl.balanceOf(alice)
-    actual_balance_market = ovl.balanceOf(market)
-
-    assert int(actual_balance_alice) == approx(expect_balance_alice)
-    assert int(actual_balance_market) == approx(expect_balance_market)
-
-
-@given(
-    notional=strategy('decimal', min_value='0.001', max_value='80000',
-                      places=3),
-    leverage=strategy('decimal', min_value='1.0', max_value='5.0', places=3),
-    is_long=strategy('bool'))
-def test_build_transfers_trading_fees(market, factory, ovl, alice, notional,
-                                      leverage, is_long):
-    # calculate expected pos info data
-    idx_trade = RiskParameter.TRADING_FEE_RATE.value
-    trading_fee_rate = Decimal(market.params(idx_trade) / 1e18)
-    collateral, notional, debt, trade_fee \
-        = calculate_position_info(notional, leverage, trading_fee_rate)
-
-    # input values for the tx
-    input_collateral = int(collateral * Decimal(1e18))
-    input_leverage = int(leverage * Decimal(1e18))
-    input_is_long = is_long
-
-    # NOTE: slippage tests in test_slippage.py
-    # NOTE: setting to min/max here, so never reverts with slippage>max
-    input_price_limit = 2**256-1 if is_long else 0
-
-    # approve collateral amount: collateral + trade fee
-    # amount of collateral that will be transferred in
-    approve_collateral = int((collateral + trade_fee) * Decimal(1e18))
-
-    # priors actual values
-    recipient = factory.feeRecipient()
-    expect = ovl.balanceOf(recipient)
-
-    # approve market for spending then build
-    ovl.approve(market, approve_collateral, {"from": alice})
-    _ = market.build(input_collateral, input_leverage, input_is_long,
-                     input_price_limit, {"from": alice})
-
-    expect += int(trade_fee * Decimal(1e18))
-    actual = ovl.balanceOf(recipient)
-
-    assert int(actual) == approx(expect)
-
-
 def test_build_reverts_when_leverage_less_than_one(market, ovl, alice):
     # NOTE: current position id is zero given isolation fixture
     expect_pos_id = 0
 
-    input_collateral = int(100 * Decimal(1e18))
+    input_collateral = int(100 * ONE_E18)
     input_is_long = True
 
     # NOTE: slippage tests in test_slippage.py
     # NOTE: setting to min/max here, so never reverts with slippage>max
     input_price_limit = 2**256-1 if input_is_long else 0
 
-    # approve market for spending before build
-    ovl.approve(market, 2**256-1, {"from": alice})
-
     # check build reverts when input leverage is less than one (ONE = 1e18)
-    input_leverage = int(Decimal(1e18) - 1)
+    input_leverage = int(ONE_E18 - 1)
     with reverts("OVLV1:lev<min"):
         _ = market.build(input_collateral, input_leverage, input_is_long,
                          input_price_limit, {"from": alice})
 
     # check build succeeds when input leverage is equal to one
-    input_leverage = int(Decimal(1e18))
+    input_leverage = int(ONE_E18)
     tx = market.build(input_collateral, input_leverage, input_is_long,
                       input_price_limit, {"from": alice})
 
     # check position id
-    actual_pos_id = tx.return_value
+    actual_pos_id = tx.events["Build"]["positionId"]
     assert expect_pos_id == actual_pos_id
 
 
-def test_build_reverts_when_leverage_greater_than_cap(market, ovl, alice):
+def test_build_reverts_when_leverage_greater_than_cap(market, ovl, alice,
+                                                      market_params):
     # NOTE: current position id is zero given isolation fixture
     expect_pos_id = 0
 
-    input_collateral = int(100 * Decimal(1e18))
+    input_collateral = int(100 * ONE_E18)
     input_is_long = True
 
     # NOTE: slippage tests in test_slippage.py
     # NOTE: setting to min/max here, so never reverts with slippage>max
     input_price_limit = 2**256-1 if input_is_long else 0
 
-    # approve market for spending before build. Use the max just for here
-    ovl.approve(market, 2**256 - 1, {"from": alice})
-
     # check build reverts when input leverage is less than one (ONE = 1e18)
-    cap_leverage = market.params(RiskParameter.CAP_LEVERAGE.value)
+    cap_leverage = market_params.cap_leverage
     input_leverage = cap_leverage + 1
     with reverts("OVLV1:lev>max"):
         _ = market.build(input_collateral, input_leverage, input_is_long,
@@ -488,7 +410,7 @@ def test_build_reverts_when_leverage_greater_than_cap(market, ovl, alice):
                       input_price_limit, {"from": alice})
 
     # check position id
-    actual_pos_id = tx.return_value
+    actual_pos_id = tx.events["Build"]["positionId"]
     assert expect_pos_id == actual_pos_id
 
 
@@ -496,12 +418,13 @@ def test_build_reverts_when_leverage_greater_than_cap(market, ovl, alice):
     leverage=strategy('decimal', min_value='1.0', max_value='5.0', places=3),
     is_long=strategy('bool'))
 def test_build_reverts_when_collateral_less_than_min(market, ovl, alice,
+                                                     market_params,
                                                      leverage, is_long):
     # NOTE: current position id is zero given isolation fixture
     expect_pos_id = 0
-    min_collateral = market.params(RiskParameter.MIN_COLLATERAL.value)
+    min_collateral = market_params.min_collateral
 
-    input_leverage = int(leverage * Decimal(1e18))
+    input_leverage = int(leverage * ONE_E18)
     input_is_long = is_long
     input_collateral = min_collateral - 1
 
@@ -509,9 +432,6 @@ def test_build_reverts_when_collateral_less_than_min(market, ovl, alice,
     # NOTE: setting to min/max here, so never reverts with slippage>max
     input_price_limit = 2**256-1 if is_long else 0
 
-    # approve market for spending then build. use max
-    ovl.approve(market, 2**256 - 1, {"from": alice})
-
     # check build reverts for min_collat > collat
     with reverts("OVLV1:collateral<min"):
         _ = market.build(input_collateral, input_leverage, input_is_long,
@@ -523,16 +443,17 @@ def test_build_reverts_when_collateral_less_than_min(market, ovl, alice,
                       input_price_limit, {"from": alice})
 
     # check position id
-    actual_pos_id = tx.return_value
+    actual_pos_id = tx.events["Build"]["positionId"]
     assert expect_pos_id == actual_pos_id
 
 
 @given(is_long=strategy('bool'))
-def test_build_reverts_when_oi_greater_than_cap(market, ovl, alice, is_long):
+def test_build_reverts_when_oi_greater_than_cap(market, ovl, alice,
+                                                market_params, is_long):
     # NOTE: current position id is zero given isolation fixture
     expect_pos_id = 0
 
-    input_leverage = int(1e18)
+    input_leverage = ONE
     input_is_long = is_long
 
     tol = 1e-4
@@ -541,11 +462,8 @@ def test_build_reverts_when_oi_greater_than_cap(market, ovl, alice, is_long):
     # NOTE: setting to min/max here, so never reverts with slippage>max
     input_price_limit = 2**256-1 if is_long else 0
 
-    # approve market for spending before build. use max
-    ovl.approve(market, 2**256 - 1, {"from": alice})
-
     # check build reverts when notional is greater than static cap
-    cap_notional = market.params(RiskParameter.CAP_NOTIONAL.value)
+    cap_notional = market_params.cap_notional
     input_collateral = cap_notional * (1 + tol)
     with reverts("OVLV1:oi>cap"):
         _ = market.build(input_collateral, input_leverage, input_is_long,
@@ -557,19 +475,14 @@ def test_build_reverts_when_oi_greater_than_cap(market, ovl, alice, is_long):
                       input_price_limit, {"from": alice})
 
     # check position id
-    actual_pos_id = tx.return_value
+    actual_pos_id = tx.events["Build"]["positionId"]
     assert expect_pos_id == actual_pos_id
 
 
 # NOTE: use mock_market so price doesn't move during test
 @given(is_long=strategy('bool'))
 def test_build_reverts_when_liquidatable(mock_market, feed, ovl, alice,
-                                         is_long):
-    idx_delta = RiskParameter.DELTA.value
-    idx_lmbda = RiskParameter.LMBDA.value
-    idx_mmf = RiskParameter.MAINTENANCE_MARGIN_FRACTION.value
-    idx_liq = RiskParameter.LIQUIDATION_FEE_RATE.value
-
+                                         mock_market_params, is_long):
     # NOTE: current position id is zero given isolation fixture
     expect_pos_id = 0
     leverage = Decimal(5)
@@ -577,10 +490,11 @@ def test_build_reverts_when_liquidatable(mock_market, feed, ovl, alice,
     tol = 1e-3
 
     # priors
-    delta = Decimal(mock_market.params(idx_delta)) / Decimal(1e18)
-    lmbda = Decimal(mock_market.params(idx_lmbda)) / Decimal(1e18)
-    maintenance_fraction = Decimal(mock_market.params(idx_mmf)) / Decimal(1e18)
-    liq_fee_rate = Decimal(mock_market.params(idx_liq)) / Decimal(1e18)
+    delta = Decimal(mock_market_params.delta) / ONE_E18
+    lmbda = Decimal(mock_market_params.lmbda) / ONE_E18
+    maintenance_fraction = Decimal(
+        mock_market_params.maintenance_fraction) / ONE_E18
+    liq_fee_rate = Decimal(mock_market_params.liq_fee_rate) / ONE_E18
 
     # Use mid price to calculate liquidation price
     data = feed.latest()
@@ -609,20 +523,16 @@ def test_build_reverts_when_liquidatable(mock_market, feed, ovl, alice,
             * (Decimal(log(entry_price / mid_price)) + delta) / lmbda
 
     # calculate notional from required market impact
-    idx_cap_notional = RiskParameter.CAP_NOTIONAL.value
     cap_notional = mock_market.capNotionalAdjustedForBounds(
-        data, mock_market.params(idx_cap_notional))
+        data, mock_market_params.cap_notional)
 
-    input_leverage = int(leverage * Decimal(1e18))
+    input_leverage = int(leverage * ONE_E18)
     input_is_long = is_long
 
     # NOTE: slippage tests in test_slippage.py
     # NOTE: setting to min/max here, so never reverts with slippage>max
     input_price_limit = 2**256-1 if is_long else 0
 
-    # approve market for spending before build. use max
-    ovl.approve(mock_market, 2**256 - 1, {"from": alice})
-
     # check build reverts when position is liquidatable
     input_notional = Decimal(cap_notional) * volume * Decimal(1 + tol)
     input_collateral = int((input_notional / leverage))
@@ -637,15 +547,15 @@ def test_build_reverts_when_liquidatable(mock_market, feed, ovl, alice,
                            input_price_limit, {"from": alice})
 
     # check position id
-    assert tx.return_value == expect_pos_id
+    assert tx.events["Build"]["positionId"] == expect_pos_id
 
 
 def test_build_reverts_when_oi_zero(mock_market, mock_feed, ovl, alice, bob):
     # NOTE: current position id is zero given isolation fixture
     expect_pos_id = 0
 
-    input_collateral = int(1e18)
-    input_leverage = int(1e18)
+    input_collateral = ONE
+    input_leverage = ONE
     input_is_long = True
 
     tol = 1e-4
@@ -654,9 +564,6 @@ def test_build_reverts_when_oi_zero(mock_market, mock_feed, ovl, alice, bob):
     # NOTE: setting to min/max here, so never reverts with slippage>max
     input_price_limit = 2**256-1
 
-    # approve market for spending before build. use max
-    ovl.approve(mock_market, 2**256 - 1, {"from": alice})
-
     # check build reverts when price so large that
     # notional / price rounds down to zero
     price = int(Decimal(input_collateral)
@@ -676,99 +583,100 @@ def test_build_reverts_when_oi_zero(mock_market, mock_feed, ovl, alice, bob):
                            input_price_limit, {"from": alice})
 
     # check position id
-    actual_pos_id = tx.return_value
+    actual_pos_id = tx.events["Build"]["positionId"]
     assert expect_pos_id == actual_pos_id
 
 
 def test_multiple_build_creates_multiple_positions(market, factory, ovl,
-                                                   feed, alice, bob):
+                                                   feed, alice, bob,
+                                                   market_params, multicall2):
     # loop through 10 times
     n = 10
     total_notional_long = Decimal(10000)
     total_notional_short = Decimal(7500)
 
     # set k to zero to avoid funding calcs
-    market.setRiskParam(RiskParameter.K.value, 0, {"from": factory})
-
-    # alice goes long and bob goes short n times
-    input_total_notional_long = total_notional_long * Decimal(1e18)
-    input_total_notional_short = total_notional_short * Decimal(1e18)
+    market.setRiskParam(RiskParameter.K, 0, {"from": factory})
 
     # NOTE: current position id is zero given isolation fixture
     expect_pos_id = 0
 
     # calculate expected pos info data
-    trading_fee_rate = Decimal(
-        market.params(RiskParameter.TRADING_FEE_RATE.value) / 1e18)
-    leverage_cap = Decimal(
-        market.params(RiskParameter.CAP_LEVERAGE.value) / 1e18)
-
-    # approve collateral amount: collateral + trade fee
-    approve_collateral_alice = int((input_total_notional_long
-                                    * (1 + trading_fee_rate)))
-    approve_collateral_bob = int((input_total_notional_short
-                                  * (1 + trading_fee_rate)))
-
-    # approve market for spending then build
-    ovl.approve(market, approve_collateral_alice, {"from": alice})
-    ovl.approve(market, approve_collateral_bob, {"from": bob})
+    trading_fee_rate = market_params.trading_fee_rate
+    leverage_cap = market_params.cap_leverage // ONE
 
+    # alice goes long and bob goes short n times
     # per trade notional values
     notional_alice = total_notional_long / Decimal(n)
     notional_bob = total_notional_short / Decimal(n)
     is_long_alice = True
     is_long_bob = False
 
+    # NOTE: slippage tests in test_slippage.py
+    # NOTE: setting to min/max here, so never reverts with slippage>max
+    input_price_limit_alice = 2**256-1 if is_long_alice else 0
+    input_price_limit_bob = 2**256-1 if is_long_bob else 0
+
+    # pre-compute (collateral, leverage, debt) for each build with a random
+    # leverage, so the loop below only mines, builds and checks
+    # NOTE: seeded so leverages are reproducible across runs
+    rng = Random(0xC0FFEE)
+    builds_alice = []
+    builds_bob = []
+    for _ in range(n):
+        leverage_alice = rng.randint(1, leverage_cap) * ONE
+        leverage_bob = rng.randint(1, leverage_cap) * ONE
+
+        collateral_alice, _, debt_alice, _ = calculate_position_info_int(
+            int(notional_alice * ONE_E18), leverage_alice, trading_fee_rate)
+        collateral_bob, _, debt_bob, _ = calculate_position_info_int(
+            int(notional_bob * ONE_E18), leverage_bob, trading_fee_rate)
+
+        builds_alice.append((collateral_alice, leverage_alice, debt_alice))
+        builds_bob.append((collateral_bob, leverage_bob, debt_bob))
+
+    # NOTE: aggregate oi tracked from the previous post build reads, as k is
+    # zero so oi doesn't change between builds. zero given isolation fixture
+    expect_oi_long = 0
+    expect_oi_short = 0
+
     for i in range(n):
         chain.mine(timedelta=60)
 
-        # choose a random leverage
-        leverage_alice = randint(1, leverage_cap)
-        leverage_bob = randint(1, leverage_cap)
-
-        # calculate collateral amounts
-        collateral_alice, _, debt_alice, _ = calculate_position_info(
-            notional_alice, leverage_alice, trading_fee_rate)
-        collateral_bob, _, debt_bob, _ = calculate_position_info(
-            notional_bob, leverage_bob, trading_fee_rate)
-
-        input_collateral_alice = int(collateral_alice * Decimal(1e18))
-        input_collateral_bob = int(collateral_bob * Decimal(1e18))
-        input_leverage_alice = int(leverage_alice * Decimal(1e18))
-        input_leverage_bob = int(leverage_bob * Decimal(1e18))
-
-        # NOTE: slippage tests in test_slippage.py
-        # NOTE: setting to min/max here, so never reverts with slippage>max
-        input_price_limit_alice = 2**256-1 if is_long_alice else 0
-        input_price_limit_bob = 2**256-1 if is_long_bob else 0
+        input_collateral_alice, input_leverage_alice, debt_alice \
+            = builds_alice[i]
+        input_collateral_bob, input_leverage_bob, debt_bob = builds_bob[i]
 
         # cache price, liquidity data from feed
         data = feed.latest()
         mid_price = mid_from_feed(data)
 
-        # cache current aggregate long oi for comparison later
-        expect_oi_long = market.oiLong()
-
         # build position for alice
         tx_alice = market.build(input_collateral_alice, input_leverage_alice,
                                 is_long_alice, input_price_limit_alice,
                                 {"from": alice})
 
-        actual_pos_id_alice = tx_alice.return_value
+        actual_pos_id_alice = tx_alice.events["Build"]["positionId"]
         expect_pos_id_alice = expect_pos_id
 
         assert actual_pos_id_alice == expect_pos_id_alice
 
+        # batch alice's post build reads with bob's feed read, as
+        # no blocks mined between alice's and bob's build
+        # NOTE: multicall results are lazy proxies so cast before arithmetic
+        with multicall_latest():
+            actual_pos_alice = market.positions(
+                get_position_key(alice.address, expect_pos_id_alice))
+            actual_oi_long = market.oiLong()
+            data = feed.latest()
+
         # check position info for alice for everything
         # except price to avoid impact calcs
-        expect_notional_alice = int(notional_alice * Decimal(1e18))
-        expect_oi_alice = int(Decimal(expect_notional_alice) * Decimal(1e18)
-                              / Decimal(mid_price))
-        expect_debt_alice = int(debt_alice * Decimal(1e18))
+        expect_notional_alice = int(notional_alice * ONE_E18)
+        expect_oi_alice = expect_notional_alice * ONE // mid_price
+        expect_debt_alice = debt_alice
         expect_is_long_alice = is_long_alice
         expect_liquidated_alice = False
-        actual_pos_alice = market.positions(
-            get_position_key(alice.address, expect_pos_id_alice))
 
         (actual_notional_alice, actual_debt_alice, actual_mid_ratio_alice,
          actual_is_long_alice, actual_liquidated_alice,
@@ -777,60 +685,56 @@ def test_multiple_build_creates_multiple_positions(market, factory, ovl,
         assert actual_is_long_alice == expect_is_long_alice
         assert actual_liquidated_alice == expect_liquidated_alice
         assert int(actual_notional_alice) == approx(expect_notional_alice)
-        assert int(actual_oi_alice) == approx(expect_oi_alice, rel=1e-3)
+        assert iapprox(actual_oi_alice, expect_oi_alice)
         assert int(actual_debt_alice) == approx(expect_debt_alice)
 
         # check oi added to long side by alice
         expect_oi_long += expect_oi_alice
-        actual_oi_long = market.oiLong()
-
-        assert int(actual_oi_long) == approx(expect_oi_long, rel=1e-3)
+        assert iapprox(actual_oi_long, expect_oi_long)
+        expect_oi_long = int(actual_oi_long)
 
         # increment expect position id
         expect_pos_id += 1
 
-        # cache price, liquidity data from feed
-        data = feed.latest()
+        # cache price from feed read above
         mid_price = mid_from_feed(data)
 
-        # cache current aggregate short oi for comparison later
-        expect_oi_short = market.oiShort()
-
         # build position for bob
         tx_bob = market.build(input_collateral_bob, input_leverage_bob,
                               is_long_bob, input_price_limit_bob,
                               {"from": bob})
 
-        actual_pos_id_bob = tx_bob.return_value
+        actual_pos_id_bob = tx_bob.events["Build"]["positionId"]
         expect_pos_id_bob = expect_pos_id
         assert actual_pos_id_bob == expect_pos_id_bob
 
+        with multicall_latest():
+            actual_pos_bob = market.positions(
+                get_position_key(bob.address, expect_pos_id_bob))
+            actual_oi_short = market.oiShort()
+
         # check position info for bob for everything
         # except price to avoid impact calcs
-        expect_notional_bob = int(notional_bob * Decimal(1e18))
-        expect_oi_bob = int(Decimal(expect_notional_bob) * Decimal(1e18)
-                            / Decimal(mid_price))
-        expect_debt_bob = int(debt_bob * Decimal(1e18))
+        expect_notional_bob = int(notional_bob * ONE_E18)
+        expect_oi_bob = expect_notional_bob * ONE // mid_price
+        expect_debt_bob = debt_bob
         expect_is_long_bob = is_long_bob
         expect_liquidated_bob = False
-        actual_pos_bob = market.positions(
-            get_position_key(bob.address, expect_pos_id_bob))
 
         (actual_notional_bob, actual_debt_bob, actual_mid_ratio_bob,
          actual_is_long_bob, actual_liquidated_bob,
          actual_oi_bob) = actual_pos_bob
 
         assert actual_is_long_bob == expect_is_long_bob
-        assert actual_liquidated_bob is expect_liquidated_bob
+        assert actual_liquidated_bob == expect_liquidated_bob
         assert int(actual_notional_bob) == approx(expect_notional_bob)
-        assert int(actual_oi_bob) == approx(expect_oi_bob, rel=1e-3)
+        assert iapprox(actual_oi_bob, expect_oi_bob)
         assert int(actual_debt_bob) == approx(expect_debt_bob)
 
         # check oi added to short side by bob
         expect_oi_short += expect_oi_bob
-        actual_oi_short = market.oiShort()
-
-        assert int(actual_oi_short) == approx(expect_oi_short, rel=1e-3)
+        assert iapprox(actual_oi_short, expect_oi_short)
+        expect_oi_short = int(actual_oi_short)
 
         # increment expect position id
         expect_pos_id += 1
@@ -94,7 +94,7 @@ def test_mock_market_fixture(mock_market, mock_feed, ovl, factory,
         25000000000000,
         14
     ]
-    actual_params = [mock_market.params(name.value) for name in RiskParameter]
+    actual_params = [mock_market.params(name) for name in RiskParameter]
     assert expect_params == actual_params
 
     # check mock market has minter and burner roles on ovl token
@@ -137,7 +137,7 @@ def test_market_fixture(market, feed, ovl, factory, minter_role,
         25000000000000,
         14
     ]
-    actual_params = [market.params(name.value) for name in RiskParameter]
+    actual_params = [market.params(name) for name in RiskParameter]
     assert expect_params == actual_params
 
     # check market has minter and burner roles on ovl token
@@ -1,80 +1,84 @@
+import pytest
 from decimal import Decimal
 from math import exp
 
 from .utils import RiskParameter
 
 
-def test_data_is_valid(market, rando):
-    tx = market.update({"from": rando})
-    data = tx.return_value
-    idx = RiskParameter.PRICE_DRIFT_UPPER_LIMIT.value
+# NOTE: Oracle.Data with 3000s macro window. price_now, price_ago zeroed
+# and set per test with data_with_prices
+BASE_DATA = (1643583611, 600, 3000, 2569091057405103628119, 0, 0,
+             4677792160494647834844974, True)
 
-    _, _, _, _, price_macro_now, price_macro_ago, _, _ = data
-    drift = (market.params(idx) / Decimal(1e18))
 
+def data_with_prices(price_now: int, price_ago: int) -> tuple:
+    """
+    Returns BASE_DATA with priceOverMacroWindow, priceOneMacroWindowAgo set
+    """
+    return BASE_DATA[:4] + (price_now, price_ago) + BASE_DATA[6:]
+
+
+# NOTE: drift bounds on dp over the 3000s macro window used in the data
+# below, from the price drift upper limit constant for the module
+@pytest.fixture(scope="module")
+def drift_bounds(risk_params):
+    drift = risk_params[RiskParameter.PRICE_DRIFT_UPPER_LIMIT] / Decimal(1e18)
+    yield exp(-drift * 3000), exp(drift * 3000)
+
+
+def test_data_is_valid(market, rando, drift_bounds):
+    # NOTE: eth_call for update() return data, so no tx mined
+    data = market.update.call({"from": rando})
+
+    _, _, _, _, price_macro_now, price_macro_ago, _, _ = data
     dp = price_macro_now / price_macro_ago
-    dp_lower_limit = exp(-drift * 3000)
-    dp_upper_limit = exp(drift * 3000)
+    dp_lower_limit, dp_upper_limit = drift_bounds
 
     expect = (dp >= dp_lower_limit and dp <= dp_upper_limit)
     actual = market.dataIsValid(data)
     assert expect == actual
 
 
-def test_data_is_valid_when_dp_less_than_lower_limit(market):
+def test_data_is_valid_when_dp_less_than_lower_limit(market, drift_bounds):
     tol = 1e-04
-    idx = RiskParameter.PRICE_DRIFT_UPPER_LIMIT.value
-    drift = (market.params(idx) / Decimal(1e18))
+    _, dp_upper_limit = drift_bounds
 
     price_now = 2562676671798193257266
 
     # check data is not valid when price is less than lower limit
-    pow = Decimal(drift) * Decimal(3000) * Decimal(1+tol)
-    price_ago = int(price_now * exp(pow))
-    data = (1643583611, 600, 3000, 2569091057405103628119,
-            price_now, price_ago,
-            4677792160494647834844974, True)
+    price_ago = int(price_now * dp_upper_limit ** (1+tol))
+    data = data_with_prices(price_now, price_ago)
 
     expect = False
     actual = market.dataIsValid(data)
     assert expect == actual
 
     # check data is valid when price is just above the lower limit
-    pow = Decimal(drift) * Decimal(3000) * Decimal(1-tol)
-    price_ago = int(price_now * exp(pow))
-    data = (1643583611, 600, 3000, 2569091057405103628119,
-            price_now, price_ago,
-            4677792160494647834844974, True)
+    price_ago = int(price_now * dp_upper_limit ** (1-tol))
+    data = data_with_prices(price_now, price_ago)
 
     expect = True
     actual = market.dataIsValid(data)
     assert expect == actual
 
 
-def test_data_is_valid_when_dp_greater_than_upper_limit(market):
+def test_data_is_valid_when_dp_greater_than_upper_limit(market, drift_bounds):
     tol = 1e-04
-    idx = RiskParameter.PRICE_DRIFT_UPPER_LIMIT.value
-    drift = (market.params(idx) / Decimal(1e18))
+    _, dp_upper_limit = drift_bounds
 
     price_ago = 2562676671798193257266
 
     # check data is not valid when price is greater than upper limit
-    pow = Decimal(drift) * Decimal(3000) * Decimal(1+tol)
-    price_now = int(price_ago * exp(pow))
-    data = (1643583611, 600, 3000, 2569091057405103628119,
-            price_now, price_ago,
-            4677792160494647834844974, True)
+    price_now = int(price_ago * dp_upper_limit ** (1+tol))
+    data = data_with_prices(price_now, price_ago)
 
     expect = False
     actual = market.dataIsValid(data)
     assert expect == actual
 
     # check data is valid when price is just below the upper limit
-    pow = Decimal(drift) * Decimal(3000) * Decimal(1-tol)
-    price_now = int(price_ago * exp(pow))
-    data = (1643583611, 600, 3000, 2569091057405103628119,
-            price_now, price_ago,
-            4677792160494647834844974, True)
+    price_now = int(price_ago * dp_upper_limit ** (1-tol))
+    data = data_with_prices(price_now, price_ago)
 
     expect = True
     actual = market.dataIsValid(data)
@@ -82,18 +86,14 @@ def test_data_is_valid_when_dp_greater_than_upper_limit(market):
 
 
 def test_data_is_valid_when_price_now_is_zero(market):
-    data = (1643583611, 600, 3000, 2569091057405103628119,
-            0, 2565497026032266989873,
-            4677792160494647834844974, True)
+    data = data_with_prices(0, 2565497026032266989873)
     expect = False
     actual = market.dataIsValid(data)
     assert expect == actual
 
 
 def test_data_is_valid_when_price_ago_is_zero(market):
-    data = (1643583611, 600, 3000, 2569091057405103628119,
-            2565497026032266989873, 0,
-            4677792160494647834844974, True)
+    data = data_with_prices(2565497026032266989873, 0)
     expect = False
     actual = market.dataIsValid(data)
     assert expect == actual
@@ -13,6 +13,9 @@ from .utils import (
 )
 
 
+pytestmark = pytest.mark.usefixtures("approve_market")
+
+
 # NOTE: Tests passing with isolation fixture
 # TODO: Fix tests to pass even without isolation fixture (?)
 @pytest.fixture(autouse=True)
@@ -31,9 +34,9 @@ def test_liquidate_updates_position(mock_market, mock_feed, alice, rando,
     tol = 1e-4
 
     # calculate expected pos info data
-    idx_trade = RiskParameter.TRADING_FEE_RATE.value
+    idx_trade = RiskParameter.TRADING_FEE_RATE
     trading_fee_rate = Decimal(mock_market.params(idx_trade) / 1e18)
-    collateral, _, _, trade_fee \
+    collateral, _, _, _ \
         = calculate_position_info(notional_initial, leverage, trading_fee_rate)
 
     # input values for build
@@ -45,12 +48,8 @@ def test_liquidate_updates_position(mock_market, mock_feed, alice, rando,
     # NOTE: setting to min/max here, so never reverts with slippage>max
     input_price_limit = 2**256-1 if is_long else 0
 
-    # approve collateral amount: collateral + trade fee
-    approve_collateral = int((collateral + trade_fee) * Decimal(1e18))
-
-    # approve then build
+    # build
     # NOTE: build() tests in test_build.py
-    ovl.approve(mock_market, approve_collateral, {"from": alice})
     tx = mock_market.build(input_collateral, input_leverage, input_is_long,
                            input_price_limit, {"from": alice})
     pos_id = tx.return_value
@@ -93,8 +92,8 @@ def test_liquidate_updates_position(mock_market, mock_feed, alice, rando,
     # calculate expected liquidation price
     # NOTE: p_liq = p_entry * ( MM * OI(0) + D ) / OI if long
     # NOTE:       = p_entry * ( 2 - ( MM * OI(0) + D ) / OI ) if short
-    idx_mmf = RiskParameter.MAINTENANCE_MARGIN_FRACTION.value
-    idx_liq = RiskParameter.LIQUIDATION_FEE_RATE.value
+    idx_mmf = RiskParameter.MAINTENANCE_MARGIN_FRACTION
+    idx_liq = RiskParameter.LIQUIDATION_FEE_RATE
     maintenance_fraction = Decimal(mock_market.params(idx_mmf)) \
         / Decimal(1e18)
     liq_fee_rate = Decimal(mock_market.params(idx_liq)) / Decimal(1e18)
@@ -181,7 +180,7 @@ def test_liquidate_updates_position(mock_market, mock_feed, alice, rando,
     expect_cost = int(liq_cost)
 
     # adjust value for maintenance burn
-    idx_mmbr = RiskParameter.MAINTENANCE_MARGIN_BURN_RATE.value
+    idx_mmbr = RiskParameter.MAINTENANCE_MARGIN_BURN_RATE
     maintenance_burn = Decimal(mock_market.params(idx_mmbr)) \
         / Decimal(1e18)
 
@@ -206,9 +205,9 @@ def test_liquidate_removes_oi(mock_market, mock_feed, alice, rando, ovl,
     tol = 1e-4
 
     # calculate expected pos info data
-    idx_trade = RiskParameter.TRADING_FEE_RATE.value
+    idx_trade = RiskParameter.TRADING_FEE_RATE
     trading_fee_rate = Decimal(mock_market.params(idx_trade) / 1e18)
-    collateral, _, _, trade_fee \
+    collateral, _, _, _ \
         = calculate_position_info(notional_initial, leverage, trading_fee_rate)
 
     # input values for build
@@ -220,12 +219,8 @@ def test_liquidate_removes_oi(mock_market, mock_feed, alice, rando, ovl,
     # NOTE: setting to min/max here, so never reverts with slippage>max
     input_price_limit = 2**256-1 if is_long else 0
 
-    # approve collateral amount: collateral + trade fee
-    approve_collateral = int((collateral + trade_fee) * Decimal(1e18))
-
-    # approve then build
+    # build
     # NOTE: build() tests in test_build.py
-    ovl.approve(mock_market, approve_collateral, {"from": alice})
     tx = mock_market.build(input_collateral, input_leverage, input_is_long,
                            input_price_limit, {"from": alice})
     pos_id = tx.return_value
@@ -266,8 +261,8 @@ def test_liquidate_removes_oi(mock_market, mock_feed, alice, rando, ovl,
     # calculate expected liquidation price
     # NOTE: p_liq = p_entry * ( MM * OI(0) + D ) / OI if long
     # NOTE:       = p_entry * ( 2 - ( MM * OI(0) + D ) / OI ) if short
-    idx_mmf = RiskParameter.MAINTENANCE_MARGIN_FRACTION.value
-    idx_liq = RiskParameter.LIQUIDATION_FEE_RATE.value
+    idx_mmf = RiskParameter.MAINTENANCE_MARGIN_FRACTION
+    idx_liq = RiskParameter.LIQUIDATION_FEE_RATE
     maintenance_fraction = Decimal(mock_market.params(idx_mmf)) \
         / Decimal(1e18)
     liq_fee_rate = Decimal(mock_market.params(idx_liq)) / Decimal(1e18)
@@ -324,9 +319,9 @@ def test_liquidate_updates_market(mock_market, mock_feed, alice, rando, ovl):
     tol = 1e-4
 
     # calculate expected pos info data
-    idx_trade = RiskParameter.TRADING_FEE_RATE.value
+    idx_trade = RiskParameter.TRADING_FEE_RATE
     trading_fee_rate = Decimal(mock_market.params(idx_trade) / 1e18)
-    collateral, _, _, trade_fee \
+    collateral, _, _, _ \
         = calculate_position_info(notional_initial, leverage, trading_fee_rate)
 
     # input values for build
@@ -338,12 +333,8 @@ def test_liquidate_updates_market(mock_market, mock_feed, alice, rando, ovl):
     # NOTE: setting to min/max here, so never reverts with slippage>max
     input_price_limit = 2**256-1 if is_long else 0
 
-    # approve collateral amount: collateral + trade fee
-    approve_collateral = int((collateral + trade_fee) * Decimal(1e18))
-
-    # approve then build
+    # build
     # NOTE: build() tests in test_build.py
-    ovl.approve(mock_market, approve_collateral, {"from": alice})
     tx = mock_market.build(input_collateral, input_leverage, input_is_long,
                            input_price_limit, {"from": alice})
     pos_id = tx.return_value
@@ -390,8 +381,8 @@ def test_liquidate_updates_market(mock_market, mock_feed, alice, rando, ovl):
     #             + (mm * notional_initial + debt) / oi_current
     # liq_price = entry_price + notional_initial / oi_initial
     #             - (mm * notional_initial + debt) / oi_current
-    idx_mmf = RiskParameter.MAINTENANCE_MARGIN_FRACTION.value
-    idx_liq = RiskParameter.LIQUIDATION_FEE_RATE.value
+    idx_mmf = RiskParameter.MAINTENANCE_MARGIN_FRACTION
+    idx_liq = RiskParameter.LIQUIDATION_FEE_RATE
     maintenance_fraction = Decimal(mock_market.params(idx_mmf)) \
         / Decimal(1e18)
     liq_fee_rate = Decimal(mock_market.params(idx_liq)) / Decimal(1e18)
@@ -438,9 +429,9 @@ def test_liquidate_registers_zero_volume(mock_market, mock_feed, alice, rando,
     tol = 1e-4
 
     # calculate expected pos info data
-    idx_trade = RiskParameter.TRADING_FEE_RATE.value
+    idx_trade = RiskParameter.TRADING_FEE_RATE
     trading_fee_rate = Decimal(mock_market.params(idx_trade) / 1e18)
-    collateral, _, _, trade_fee \
+    collateral, _, _, _ \
         = calculate_position_info(notional_initial, leverage, trading_fee_rate)
 
     # input values for build
@@ -452,12 +443,8 @@ def test_liquidate_registers_zero_volume(mock_market, mock_feed, alice, rando,
     # NOTE: setting to min/max here, so never reverts with slippage>max
     input_price_limit = 2**256-1 if is_long else 0
 
-    # approve collateral amount: collateral + trade fee
-    approve_collateral = int((collateral + trade_fee) * Decimal(1e18))
-
-    # approve then build
+    # build
     # NOTE: build() tests in test_build.py
-    ovl.approve(mock_market, approve_collateral, {"from": alice})
     tx = mock_market.build(input_collateral, input_leverage, input_is_long,
                            input_price_limit, {"from": alice})
     pos_id = tx.return_value
@@ -503,8 +490,8 @@ def test_liquidate_registers_zero_volume(mock_market, mock_feed, alice, rando,
     # calculate expected liquidation price
     # NOTE: p_liq = p_entry * ( MM * OI(0) + D ) / OI if long
     # NOTE:       = p_entry * ( 2 - ( MM * OI(0) + D ) / OI ) if short
-    idx_mmf = RiskParameter.MAINTENANCE_MARGIN_FRACTION.value
-    idx_liq = RiskParameter.LIQUIDATION_FEE_RATE.value
+    idx_mmf = RiskParameter.MAINTENANCE_MARGIN_FRACTION
+    idx_liq = RiskParameter.LIQUIDATION_FEE_RATE
     maintenance_fraction = Decimal(mock_market.params(idx_mmf)) \
         / Decimal(1e18)
     liq_fee_rate = Decimal(mock_market.params(idx_liq)) / Decimal(1e18)
@@ -569,9 +556,9 @@ def test_liquidate_registers_mint(mock_market, mock_feed, alice, rando, ovl,
     tol = 1e-4
 
     # calculate expected pos info data
-    idx_trade = RiskParameter.TRADING_FEE_RATE.value
+    idx_trade = RiskParameter.TRADING_FEE_RATE
     trading_fee_rate = Decimal(mock_market.params(idx_trade) / 1e18)
-    collateral, _, _, trade_fee \
+    collateral, _, _, _ \
         = calculate_position_info(notional_initial, leverage, trading_fee_rate)
 
     # input values for build
@@ -583,12 +570,8 @@ def test_liquidate_registers_mint(mock_market, mock_feed, alice, rando, ovl,
     # NOTE: setting to min/max here, so never reverts with slippage>max
     input_price_limit = 2**256-1 if is_long else 0
 
-    # approve collateral amount: collateral + trade fee
-    approve_collateral = int((collateral + trade_fee) * Decimal(1e18))
-
-    # approve then build
+    # build
     # NOTE: build() tests in test_build.py
-    ovl.approve(mock_market, approve_collateral, {"from": alice})
     tx = mock_market.build(input_collateral, input_leverage, input_is_long,
                            input_price_limit, {"from": alice})
     pos_id = tx.return_value
@@ -633,8 +616,8 @@ def test_liquidate_registers_mint(mock_market, mock_feed, alice, rando, ovl,
     # calculate expected liquidation price
     # NOTE: p_liq = p_entry * ( MM * OI(0) + D ) / OI if long
     # NOTE:       = p_entry * ( 2 - ( MM * OI(0) + D ) / OI ) if short
-    idx_mmf = RiskParameter.MAINTENANCE_MARGIN_FRACTION.value
-    idx_liq = RiskParameter.LIQUIDATION_FEE_RATE.value
+    idx_mmf = RiskParameter.MAINTENANCE_MARGIN_FRACTION
+    idx_liq = RiskParameter.LIQUIDATION_FEE_RATE
     maintenance_fraction = Decimal(mock_market.params(idx_mmf)) \
         / Decimal(1e18)
     liq_fee_rate = Decimal(mock_market.params(idx_liq)) / Decimal(1e18)
@@ -678,7 +661,7 @@ def test_liquidate_registers_mint(mock_market, mock_feed, alice, rando, ovl,
     # NOTE: decayOverWindow() tested in test_rollers.py
     input_minted = int(actual_mint)
     input_window = int(
-        mock_market.params(RiskParameter.CIRCUIT_BREAKER_WINDOW.value))
+        mock_market.params(RiskParameter.CIRCUIT_BREAKER_WINDOW))
     input_timestamp = chain[tx.block_number]['timestamp']
 
     # expect accumulator now to be calculated as
@@ -718,9 +701,9 @@ def test_liquidate_executes_transfers(mock_market, mock_feed, alice, rando,
     tol = 1e-4
 
     # calculate expected pos info data
-    idx_trade = RiskParameter.TRADING_FEE_RATE.value
+    idx_trade = RiskParameter.TRADING_FEE_RATE
     trading_fee_rate = Decimal(mock_market.params(idx_trade) / 1e18)
-    collateral, _, _, trade_fee \
+    collateral, _, _, _ \
         = calculate_position_info(notional_initial, leverage, trading_fee_rate)
 
     # input values for build
@@ -732,12 +715,8 @@ def test_liquidate_executes_transfers(mock_market, mock_feed, alice, rando,
     # NOTE: setting to min/max here, so never reverts with slippage>max
     input_price_limit = 2**256-1 if is_long else 0
 
-    # approve collateral amount: collateral + trade fee
-    approve_collateral = int((collateral + trade_fee) * Decimal(1e18))
-
-    # approve then build
+    # build
     # NOTE: build() tests in test_build.py
-    ovl.approve(mock_market, approve_collateral, {"from": alice})
     tx = mock_market.build(input_collateral, input_leverage, input_is_long,
                            input_price_limit, {"from": alice})
     pos_id = tx.return_value
@@ -780,8 +759,8 @@ def test_liquidate_executes_transfers(mock_market, mock_feed, alice, rando,
     # calculate expected liquidation price
     # NOTE: p_liq = p_entry * ( MM * OI(0) + D ) / OI if long
     # NOTE:       = p_entry * ( 2 - ( MM * OI(0) + D ) / OI ) if short
-    idx_mmf = RiskParameter.MAINTENANCE_MARGIN_FRACTION.value
-    idx_liq = RiskParameter.LIQUIDATION_FEE_RATE.value
+    idx_mmf = RiskParameter.MAINTENANCE_MARGIN_FRACTION
+    idx_liq = RiskParameter.LIQUIDATION_FEE_RATE
     maintenance_fraction = Decimal(mock_market.params(idx_mmf)) \
         / Decimal(1e18)
     liq_fee_rate = Decimal(mock_market.params(idx_liq)) / Decimal(1e18)
@@ -836,7 +815,7 @@ def test_liquidate_executes_transfers(mock_market, mock_feed, alice, rando,
     margin_remaining = liq_value - liq_fee
 
     # adjust value for maintenance burn
-    idx_mmbr = RiskParameter.MAINTENANCE_MARGIN_BURN_RATE.value
+    idx_mmbr = RiskParameter.MAINTENANCE_MARGIN_BURN_RATE
     maintenance_burn = Decimal(mock_market.params(idx_mmbr)) \
         / Decimal(1e18)
     margin_burned = int(margin_remaining * maintenance_burn)
@@ -901,9 +880,9 @@ def test_liquidate_transfers_fee_to_liquidator(mock_market, mock_feed, alice,
     tol = 1e-4
 
     # calculate expected pos info data
-    idx_trade = RiskParameter.TRADING_FEE_RATE.value
+    idx_trade = RiskParameter.TRADING_FEE_RATE
     trading_fee_rate = Decimal(mock_market.params(idx_trade) / 1e18)
-    collateral, _, _, trade_fee \
+    collateral, _, _, _ \
         = calculate_position_info(notional_initial, leverage, trading_fee_rate)
 
     # input values for build
@@ -915,12 +894,8 @@ def test_liquidate_transfers_fee_to_liquidator(mock_market, mock_feed, alice,
     # NOTE: setting to min/max here, so never reverts with slippage>max
     input_price_limit = 2**256-1 if is_long else 0
 
-    # approve collateral amount: collateral + trade fee
-    approve_collateral = int((collateral + trade_fee) * Decimal(1e18))
-
-    # approve then build
+    # build
     # NOTE: build() tests in test_build.py
-    ovl.approve(mock_market, approve_collateral, {"from": alice})
     tx = mock_market.build(input_collateral, input_leverage, input_is_long,
                            input_price_limit, {"from": alice})
     pos_id = tx.return_value
@@ -963,8 +938,8 @@ def test_liquidate_transfers_fee_to_liquidator(mock_market, mock_feed, alice,
     # calculate expected liquidation price
     # NOTE: p_liq = p_entry * ( MM * OI(0) + D ) / OI if long
     # NOTE:       = p_entry * ( 2 - ( MM * OI(0) + D ) / OI ) if short
-    idx_mmf = RiskParameter.MAINTENANCE_MARGIN_FRACTION.value
-    idx_liq = RiskParameter.LIQUIDATION_FEE_RATE.value
+    idx_mmf = RiskParameter.MAINTENANCE_MARGIN_FRACTION
+    idx_liq = RiskParameter.LIQUIDATION_FEE_RATE
     maintenance_fraction = Decimal(mock_market.params(idx_mmf)) \
         / Decimal(1e18)
     liq_fee_rate = Decimal(mock_market.params(idx_liq)) / Decimal(1e18)
@@ -1056,9 +1031,9 @@ def test_liquidate_transfers_remaining_margin(mock_market, mock_feed, alice,
     tol = 1e-4
 
     # calculate expected pos info data
-    idx_trade = RiskParameter.TRADING_FEE_RATE.value
+    idx_trade = RiskParameter.TRADING_FEE_RATE
     trading_fee_rate = Decimal(mock_market.params(idx_trade) / 1e18)
-    collateral, _, _, trade_fee \
+    collateral, _, _, _ \
         = calculate_position_info(notional_initial, leverage, trading_fee_rate)
 
     # input values for build
@@ -1070,12 +1045,8 @@ def test_liquidate_transfers_remaining_margin(mock_market, mock_feed, alice,
     # NOTE: setting to min/max here, so never reverts with slippage>max
     input_price_limit = 2**256-1 if is_long else 0
 
-    # approve collateral amount: collateral + trade fee
-    approve_collateral = int((collateral + trade_fee) * Decimal(1e18))
-
-    # approve then build
+    # build
     # NOTE: build() tests in test_build.py
-    ovl.approve(mock_market, approve_collateral, {"from": alice})
     tx = mock_market.build(input_collateral, input_leverage, input_is_long,
                            input_price_limit, {"from": alice})
     pos_id = tx.return_value
@@ -1118,8 +1089,8 @@ def test_liquidate_transfers_remaining_margin(mock_market, mock_feed, alice,
     # calculate expected liquidation price
     # NOTE: p_liq = p_entry * ( MM * OI(0) + D ) / OI if long
     # NOTE:       = p_entry * ( 2 - ( MM * OI(0) + D ) / OI ) if short
-    idx_mmf = RiskParameter.MAINTENANCE_MARGIN_FRACTION.value
-    idx_liq = RiskParameter.LIQUIDATION_FEE_RATE.value
+    idx_mmf = RiskParameter.MAINTENANCE_MARGIN_FRACTION
+    idx_liq = RiskParameter.LIQUIDATION_FEE_RATE
     maintenance_fraction = Decimal(mock_market.params(idx_mmf)) \
         / Decimal(1e18)
     liq_fee_rate = Decimal(mock_market.params(idx_liq)) / Decimal(1e18)
@@ -1186,7 +1157,7 @@ def test_liquidate_transfers_remaining_margin(mock_market, mock_feed, alice,
     margin_remaining = liq_value - liq_fee
 
     # adjust value for maintenance burn
-    idx_mmbr = RiskParameter.MAINTENANCE_MARGIN_BURN_RATE.value
+    idx_mmbr = RiskParameter.MAINTENANCE_MARGIN_BURN_RATE
     maintenance_burn = Decimal(mock_market.params(idx_mmbr)) \
         / Decimal(1e18)
     margin_burned = int(margin_remaining * maintenance_burn)
@@ -1217,15 +1188,15 @@ def test_liquidate_floors_value_to_zero_when_position_underwater(mock_market,
     price_multiplier = Decimal(0.700)  # close to underwater but not there yet
 
     # exclude funding for testing edge case
-    mock_market.setRiskParam(RiskParameter.K.value, 0, {"from": factory})
+    mock_market.setRiskParam(RiskParameter.K, 0, {"from": factory})
 
     # tolerance
     tol = 1e-4
 
     # calculate expected pos info data
-    idx_trade = RiskParameter.TRADING_FEE_RATE.value
+    idx_trade = RiskParameter.TRADING_FEE_RATE
     trading_fee_rate = Decimal(mock_market.params(idx_trade) / 1e18)
-    collateral, _, _, trade_fee \
+    collateral, _, _, _ \
         = calculate_position_info(notional_initial, leverage, trading_fee_rate)
 
     # input values for build
@@ -1237,12 +1208,8 @@ def test_liquidate_floors_value_to_zero_when_position_underwater(mock_market,
     # NOTE: setting to min/max here, so never reverts with slippage>max
     input_price_limit = 2**256-1 if is_long else 0
 
-    # approve collateral amount: collateral + trade fee
-    approve_collateral = int((collateral + trade_fee) * Decimal(1e18))
-
-    # approve then build
+    # build
     # NOTE: build() tests in test_build.py
-    ovl.approve(mock_market, approve_collateral, {"from": alice})
     tx = mock_market.build(input_collateral, input_leverage, input_is_long,
                            input_price_limit, {"from": alice})
     pos_id = tx.return_value
@@ -1337,9 +1304,9 @@ def test_liquidate_reverts_when_not_position_owner(mock_market, mock_feed,
     tol = 1e-4
 
     # calculate expected pos info data
-    idx_trade = RiskParameter.TRADING_FEE_RATE.value
+    idx_trade = RiskParameter.TRADING_FEE_RATE
     trading_fee_rate = Decimal(mock_market.params(idx_trade) / 1e18)
-    collateral, _, _, trade_fee \
+    collateral, _, _, _ \
         = calculate_position_info(notional_initial, leverage, trading_fee_rate)
 
     # input values for build
@@ -1351,12 +1318,8 @@ def test_liquidate_reverts_when_not_position_owner(mock_market, mock_feed,
     # NOTE: setting to min/max here, so never reverts with slippage>max
     input_price_limit = 2**256-1 if is_long else 0
 
-    # approve collateral amount: collateral + trade fee
-    approve_collateral = int((collateral + trade_fee) * Decimal(1e18))
-
-    # approve then build
+    # build
     # NOTE: build() tests in test_build.py
-    ovl.approve(mock_market, approve_collateral, {"from": alice})
     tx = mock_market.build(input_collateral, input_leverage, input_is_long,
                            input_price_limit, {"from": alice})
     pos_id = tx.return_value
@@ -1397,8 +1360,8 @@ def test_liquidate_reverts_when_not_position_owner(mock_market, mock_feed,
     # calculate expected liquidation price
     # NOTE: p_liq = p_entry * ( MM * OI(0) + D ) / OI if long
     # NOTE:       = p_entry * ( 2 - ( MM * OI(0) + D ) / OI ) if short
-    idx_mmf = RiskParameter.MAINTENANCE_MARGIN_FRACTION.value
-    idx_liq = RiskParameter.LIQUIDATION_FEE_RATE.value
+    idx_mmf = RiskParameter.MAINTENANCE_MARGIN_FRACTION
+    idx_liq = RiskParameter.LIQUIDATION_FEE_RATE
     maintenance_fraction = Decimal(mock_market.params(idx_mmf)) \
         / Decimal(1e18)
     liq_fee_rate = Decimal(mock_market.params(idx_liq)) / Decimal(1e18)
@@ -1459,9 +1422,9 @@ def test_liquidate_reverts_when_position_liquidated(mock_market, mock_feed,
     tol = 1e-4
 
     # calculate expected pos info data
-    idx_trade = RiskParameter.TRADING_FEE_RATE.value
+    idx_trade = RiskParameter.TRADING_FEE_RATE
     trading_fee_rate = Decimal(mock_market.params(idx_trade) / 1e18)
-    collateral, _, _, trade_fee \
+    collateral, _, _, _ \
         = calculate_position_info(notional_initial, leverage, trading_fee_rate)
 
     # input values for build
@@ -1473,12 +1436,8 @@ def test_liquidate_reverts_when_position_liquidated(mock_market, mock_feed,
     # NOTE: setting to min/max here, so never reverts with slippage>max
     input_price_limit = 2**256-1 if is_long else 0
 
-    # approve collateral amount: collateral + trade fee
-    approve_collateral = int((collateral + trade_fee) * Decimal(1e18))
-
-    # approve then build
+    # build
     # NOTE: build() tests in test_build.py
-    ovl.approve(mock_market, approve_collateral, {"from": alice})
     tx = mock_market.build(input_collateral, input_leverage, input_is_long,
                            input_price_limit, {"from": alice})
     pos_id = tx.return_value
@@ -1519,8 +1478,8 @@ def test_liquidate_reverts_when_position_liquidated(mock_market, mock_feed,
     # calculate expected liquidation price
     # NOTE: p_liq = p_entry * ( MM * OI(0) + D ) / OI if long
     # NOTE:       = p_entry * ( 2 - ( MM * OI(0) + D ) / OI ) if short
-    idx_mmf = RiskParameter.MAINTENANCE_MARGIN_FRACTION.value
-    idx_liq = RiskParameter.LIQUIDATION_FEE_RATE.value
+    idx_mmf = RiskParameter.MAINTENANCE_MARGIN_FRACTION
+    idx_liq = RiskParameter.LIQUIDATION_FEE_RATE
     maintenance_fraction = Decimal(mock_market.params(idx_mmf)) \
         / Decimal(1e18)
     liq_fee_rate = Decimal(mock_market.params(idx_liq)) / Decimal(1e18)
@@ -1571,9 +1530,9 @@ def test_liquidate_reverts_when_position_not_liquidatable(mock_market,
     tol = 1e-4
 
     # calculate expected pos info data
-    idx_trade = RiskParameter.TRADING_FEE_RATE.value
+    idx_trade = RiskParameter.TRADING_FEE_RATE
     trading_fee_rate = Decimal(mock_market.params(idx_trade) / 1e18)
-    collateral, _, _, trade_fee \
+    collateral, _, _, _ \
         = calculate_position_info(notional_initial, leverage, trading_fee_rate)
 
     # input values for build
@@ -1585,12 +1544,8 @@ def test_liquidate_reverts_when_position_not_liquidatable(mock_market,
     # NOTE: setting to min/max here, so never reverts with slippage>max
     input_price_limit = 2**256-1 if is_long else 0
 
-    # approve collateral amount: collateral + trade fee
-    approve_collateral = int((collateral + trade_fee) * Decimal(1e18))
-
-    # approve then build
+    # build
     # NOTE: build() tests in test_build.py
-    ovl.approve(mock_market, approve_collateral, {"from": alice})
     tx = mock_market.build(input_collateral, input_leverage, input_is_long,
                            input_price_limit, {"from": alice})
     pos_id = tx.return_value
@@ -1631,8 +1586,8 @@ def test_liquidate_reverts_when_position_not_liquidatable(mock_market,
     # calculate expected liquidation price
     # NOTE: p_liq = p_entry * ( MM * OI(0) + D ) / OI if long
     # NOTE:       = p_entry * ( 2 - ( MM * OI(0) + D ) / OI ) if short
-    idx_mmf = RiskParameter.MAINTENANCE_MARGIN_FRACTION.value
-    idx_liq = RiskParameter.LIQUIDATION_FEE_RATE.value
+    idx_mmf = RiskParameter.MAINTENANCE_MARGIN_FRACTION
+    idx_liq = RiskParameter.LIQUIDATION_FEE_RATE
     maintenance_fraction = Decimal(mock_market.params(idx_mmf)) \
         / Decimal(1e18)
     liq_fee_rate = Decimal(mock_market.params(idx_liq)) / Decimal(1e18)
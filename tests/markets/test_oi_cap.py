@@ -1,63 +1,73 @@
+import pytest
 from decimal import Decimal
 from pytest import approx
 from brownie.test import given, strategy
+from hypothesis import example
 
-from .utils import mid_from_feed, RiskParameter
+from .utils import mid_from_feed, multicall_latest, RiskParameter, ONE
 
 
-def test_cap_notional_front_run_bound(market, feed):
-    idx = RiskParameter.LMBDA.value
-    lmbda = Decimal(market.params(idx)) / Decimal(1e18)
-    data = feed.latest()
+# NOTE: views in this module are pure functions of the data passed in, so
+# feed data read once per module
+@pytest.fixture(scope="module")
+def feed_data(feed):
+    yield feed.latest()
+
+
+def test_cap_notional_front_run_bound(market, risk_params, feed_data):
+    lmbda = risk_params[RiskParameter.LMBDA]
+    data = feed_data
 
     # NOTE: assumes using UniswapV3 feed with hasReserve = true
     _, _, _, _, _, _, reserve_micro, _ = data
 
     # check front run bound is lmbda * reserveOverMicro when has reserve
-    expect = int(lmbda * Decimal(reserve_micro))
+    expect = lmbda * reserve_micro // ONE
     actual = market.frontRunBound(data)
     assert int(actual) == approx(expect)
 
 
-def test_cap_notional_back_run_bound(market, feed):
-    idx = RiskParameter.DELTA.value
-    delta = Decimal(market.params(idx)) / Decimal(1e18)
-    data = feed.latest()
+def test_cap_notional_back_run_bound(market, risk_params, feed_data):
+    delta = risk_params[RiskParameter.DELTA]
+    data = feed_data
 
     # NOTE: assumes using UniswapV3 feed with hasReserve = true
-    average_block_time = market.params(RiskParameter.AVERAGE_BLOCK_TIME.value)
+    average_block_time = risk_params[RiskParameter.AVERAGE_BLOCK_TIME]
     _, _, macro_window, _, _, _, reserve_micro, _ = data
 
     # check back run bound is macroWindowInBlocks * reserveInOvl * 2 * delta
     # when has reserve
-    window = Decimal(macro_window) / Decimal(average_block_time)
-    expect = int(Decimal(2) * delta * Decimal(reserve_micro) * window)
+    expect = 2 * delta * reserve_micro * macro_window \
+        // (average_block_time * ONE)
     actual = market.backRunBound(data)
     assert int(actual) == approx(expect)
 
 
-def test_cap_notional_adjusted_for_bounds(market, feed):
+def test_cap_notional_adjusted_for_bounds(market, risk_params, feed_data,
+                                          multicall2):
     # Test cap notional adjustments is min of all bounds and circuit breaker
-    idx = RiskParameter.CAP_NOTIONAL.value
-    cap_notional = market.params(idx)
-    data = feed.latest()
+    cap_notional = risk_params[RiskParameter.CAP_NOTIONAL]
+    data = feed_data
 
     # calculate cap notional bounds:
     # 1. front run bound; 2. back run bound
-    cap_notional_front_run_bound = market.frontRunBound(data)
-    cap_notional_back_run_bound = market.backRunBound(data)
+    # NOTE: batched with actual into a single eth_call. multicall results
+    # are lazy proxies so cast before comparing
+    with multicall_latest():
+        cap_notional_front_run_bound = market.frontRunBound(data)
+        cap_notional_back_run_bound = market.backRunBound(data)
+        actual = market.capNotionalAdjustedForBounds(data, cap_notional)
 
     # expect is the min of all cap quantities
-    expect = min(cap_notional, cap_notional_front_run_bound,
-                 cap_notional_back_run_bound)
-    actual = market.capNotionalAdjustedForBounds(data, cap_notional)
-    assert actual == expect
+    expect = min(cap_notional, int(cap_notional_front_run_bound),
+                 int(cap_notional_back_run_bound))
+    assert int(actual) == expect
 
 
-def test_cap_notional_adjusted_for_bounds_when_no_reserve(market, feed):
+def test_cap_notional_adjusted_for_bounds_when_no_reserve(market,
+                                                          risk_params):
     # Test cap notional adjustments is min of all bounds and circuit breaker
-    idx = RiskParameter.CAP_NOTIONAL.value
-    cap_notional = market.params(idx)
+    cap_notional = risk_params[RiskParameter.CAP_NOTIONAL]
     data = (1642797758, 600, 3600, 2729583770051358617413,
             2739701430255362520176, 2729583770051358617413,
             1909229154186640322863637, False)  # has_reserve = False
@@ -68,76 +78,62 @@ def test_cap_notional_adjusted_for_bounds_when_no_reserve(market, feed):
     assert actual == expect
 
 
-# NOTE: strategy min/max rely on circuitBreakerMintTarget set in conftest.py
-@given(
-    minted=strategy('decimal', min_value='66670', max_value='133340',
-                    places=1))
-def test_cap_notional_circuit_breaker(market, minted):
-    idx_notional = RiskParameter.CAP_NOTIONAL.value
-    idx_target = RiskParameter.CIRCUIT_BREAKER_MINT_TARGET.value
-
-    cap_notional = market.params(idx_notional)
-    target = market.params(idx_target)
+# NOTE: (min, target, 2x target, max) bounds and points either side of
+# the target, 2x target branch boundaries. rely on circuitBreakerMintTarget
+# set in conftest.py
+CIRCUIT_BREAKER_EDGE_CASES = [
+    Decimal('-133340'),
+    Decimal('66670'),
+    Decimal('66670.1'),
+    Decimal('100005'),
+    Decimal('133339.9'),
+    Decimal('133340'),
+    Decimal('133340.1'),
+    Decimal('266680'),
+]
 
-    # assemble Roller.snapshot struct
-    timestamp = 1643247197
-    window = 2592000
-    minted = int(minted * Decimal(1e18))
-    snapshot = (timestamp, window, minted)
 
-    # check breaker bound returns capNotional
-    expect = int(cap_notional * (2 - minted / target))
-    actual = market.circuitBreaker(snapshot, cap_notional)
-    assert int(actual) == approx(expect)
+def circuit_breaker_edge_cases(test):
+    """
+    Pins CIRCUIT_BREAKER_EDGE_CASES as explicit hypothesis examples on test
+    """
+    for minted in CIRCUIT_BREAKER_EDGE_CASES:
+        test = example(minted=minted)(test)
+    return test
 
 
 # NOTE: strategy min/max rely on circuitBreakerMintTarget set in conftest.py
+@circuit_breaker_edge_cases
 @given(
-    minted=strategy('decimal', min_value='-133340', max_value='66670',
+    minted=strategy('decimal', min_value='-133340', max_value='266680',
                     places=1))
-def test_cap_notional_circuit_breaker_when_minted_less_than_target(market,
-                                                                   minted):
-    idx = RiskParameter.CAP_NOTIONAL.value
-    cap_notional = market.params(idx)
+def test_cap_notional_circuit_breaker(market, risk_params, minted):
+    cap_notional = risk_params[RiskParameter.CAP_NOTIONAL]
+    target = risk_params[RiskParameter.CIRCUIT_BREAKER_MINT_TARGET]
 
     # assemble Roller.snapshot struct
     timestamp = 1643247197
     window = 2592000
     minted = int(minted * Decimal(1e18))
     snapshot = (timestamp, window, minted)
-
-    # check breaker bound returns capNotional
-    expect = cap_notional
     actual = market.circuitBreaker(snapshot, cap_notional)
-    assert actual == expect
-
-
-# NOTE: strategy min/max rely on circuitBreakerMintTarget set in conftest.py
-@given(
-    minted=strategy('decimal', min_value='133340', max_value='266680',
-                    places=1))
-def test_cap_notional_circuit_breaker_when_mint_greater_than_2x_target(market,
-                                                                       minted):
-    idx = RiskParameter.CAP_NOTIONAL.value
-    cap_notional = market.params(idx)
-
-    # assemble Roller.snapshot struct
-    timestamp = 1643247197
-    window = 2592000
-    minted = int(minted * Decimal(1e18))
-    snapshot = (timestamp, window, minted)
 
-    # check breaker bound returns capNotional
-    expect = 0
-    actual = market.circuitBreaker(snapshot, cap_notional)
-    assert actual == expect
+    if minted <= target:
+        # check breaker bound returns capNotional when minted below target
+        assert actual == cap_notional
+    elif minted >= 2 * target:
+        # check breaker bound returns zero when minted above 2x target
+        assert actual == 0
+    else:
+        # check breaker bound adjusts capNotional down when in between
+        expect = cap_notional * (2 * target - minted) // target
+        assert int(actual) == approx(expect)
 
 
-def test_cap_notional_adjusted_for_circuit_breaker(market, feed):
+def test_cap_notional_adjusted_for_circuit_breaker(market, risk_params):
     # Test cap notional circuit adjustment is min cap notional and
     # circuit breaker
-    idx = RiskParameter.CAP_NOTIONAL.value
-    cap_notional = market.params(idx)
+    cap_notional = risk_params[RiskParameter.CAP_NOTIONAL]
     snapshot = market.snapshotMinted()
 
     # calculate cap notional adjusted for circuit breaker
@@ -150,16 +146,13 @@ def test_cap_notional_adjusted_for_circuit_breaker(market, feed):
     assert actual == expect
 
 
-def test_oi_from_notional(market, feed):
-    idx = RiskParameter.CAP_NOTIONAL.value
-    cap_notional = market.params(idx)
-    data = feed.latest()
+def test_oi_from_notional(market, risk_params, feed_data):
+    cap_notional = risk_params[RiskParameter.CAP_NOTIONAL]
+    data = feed_data
 
     # oi cap should be cap notional / mid, with zero volume assumption on
     # mid so cap is dependent on only underlying feed price
     mid = mid_from_feed(data)
-    cap_oi = Decimal(cap_notional) / Decimal(mid)
-
-    expect = int(cap_oi * Decimal(1e18))
+    expect = cap_notional * ONE // mid
     actual = market.oiFromNotional(cap_notional, mid)
     assert int(actual) == approx(expect)
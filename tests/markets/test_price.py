@@ -9,7 +9,7 @@ from .utils import RiskParameter
 
 def test_bid_adds_static_spread(market, rando):
     # params idx for delta param
-    idx = RiskParameter.DELTA.value
+    idx = RiskParameter.DELTA
 
     # get the price data from call to update. update tests in test_update.py
     tx = market.update({"from": rando})
@@ -33,8 +33,8 @@ def test_bid_adds_static_spread(market, rando):
                     places=4))
 def test_bid_adds_market_impact(market, volume, rando):
     # params idx for delta, lmbda params
-    idx_delta = RiskParameter.DELTA.value
-    idx_lmbda = RiskParameter.LMBDA.value
+    idx_delta = RiskParameter.DELTA
+    idx_lmbda = RiskParameter.LMBDA
 
     # get the price data from call to update. update tests in test_update.py
     tx = market.update({"from": rando})
@@ -56,8 +56,8 @@ def test_bid_adds_market_impact(market, volume, rando):
 
 def test_bid_reverts_when_slippage_greater_than_max(market, rando):
     # params idx for delta, lmbda params
-    idx_delta = RiskParameter.DELTA.value
-    idx_lmbda = RiskParameter.LMBDA.value
+    idx_delta = RiskParameter.DELTA
+    idx_lmbda = RiskParameter.LMBDA
 
     # get the price data from call to update. update tests in test_update.py
     tx = market.update({"from": rando})
@@ -86,7 +86,7 @@ def test_bid_reverts_when_slippage_greater_than_max(market, rando):
 
 def test_ask_adds_static_spread(market, rando):
     # params idx for delta param
-    idx = RiskParameter.DELTA.value
+    idx = RiskParameter.DELTA
 
     # get the price data from call to update. update tests in test_update.py
     tx = market.update({"from": rando})
@@ -110,8 +110,8 @@ def test_ask_adds_static_spread(market, rando):
                     places=4))
 def test_ask_adds_market_impact(market, volume, rando):
     # params idx for delta, lmbda params
-    idx_delta = RiskParameter.DELTA.value
-    idx_lmbda = RiskParameter.LMBDA.value
+    idx_delta = RiskParameter.DELTA
+    idx_lmbda = RiskParameter.LMBDA
 
     # get the price data from call to update. update tests in test_update.py
     tx = market.update({"from": rando})
@@ -133,8 +133,8 @@ def test_ask_adds_market_impact(market, volume, rando):
 
 def test_ask_reverts_when_impact_greater_than_max_slippage(market, rando):
     # params idx for delta, lmbda params
-    idx_delta = RiskParameter.DELTA.value
-    idx_lmbda = RiskParameter.LMBDA.value
+    idx_delta = RiskParameter.DELTA
+    idx_lmbda = RiskParameter.LMBDA
 
     # get the price data from call to update. update tests in test_update.py
     tx = market.update({"from": rando})
@@ -50,7 +50,7 @@ def test_set_risk_param(market, factory):
 def test_set_risk_param_caches_calc(market, feed, factory):
     # set the risk param
     expect_param = 50000000000000
-    idx_drift = RiskParameter.PRICE_DRIFT_UPPER_LIMIT.value
+    idx_drift = RiskParameter.PRICE_DRIFT_UPPER_LIMIT
     market.setRiskParam(idx_drift, expect_param, {"from": factory})
 
     # check was actually set
@@ -75,10 +75,10 @@ def test_set_risk_param_reverts_when_not_factory(market, alice):
 
 def test_set_delta_reverts_when_max_lev_liquidatable(market, factory):
     # idx for delta, cap_leverage, maintenance, liquidation fee rate
-    idx_delta = RiskParameter.DELTA.value
-    idx_cap_leverage = RiskParameter.CAP_LEVERAGE.value
-    idx_mmf = RiskParameter.MAINTENANCE_MARGIN_FRACTION.value
-    idx_lfr = RiskParameter.LIQUIDATION_FEE_RATE.value
+    idx_delta = RiskParameter.DELTA
+    idx_cap_leverage = RiskParameter.CAP_LEVERAGE
+    idx_mmf = RiskParameter.MAINTENANCE_MARGIN_FRACTION
+    idx_lfr = RiskParameter.LIQUIDATION_FEE_RATE
 
     tol = 1e-4
 
@@ -104,10 +104,10 @@ def test_set_delta_reverts_when_max_lev_liquidatable(market, factory):
 
 def test_set_cap_leverage_reverts_when_max_lev_liquidatable(market, factory):
     # idx for delta, cap_leverage, maintenance, liquidation fee rate
-    idx_delta = RiskParameter.DELTA.value
-    idx_cap_leverage = RiskParameter.CAP_LEVERAGE.value
-    idx_mmf = RiskParameter.MAINTENANCE_MARGIN_FRACTION.value
-    idx_lfr = RiskParameter.LIQUIDATION_FEE_RATE.value
+    idx_delta = RiskParameter.DELTA
+    idx_cap_leverage = RiskParameter.CAP_LEVERAGE
+    idx_mmf = RiskParameter.MAINTENANCE_MARGIN_FRACTION
+    idx_lfr = RiskParameter.LIQUIDATION_FEE_RATE
 
     tol = 1e-4
 
@@ -137,10 +137,10 @@ def test_set_maintenance_margin_fraction_reverts_when_max_lev_liquidatable(
     market, factory
 ):
     # idx for delta, cap_leverage, maintenance, liquidation fee rate
-    idx_delta = RiskParameter.DELTA.value
-    idx_cap_leverage = RiskParameter.CAP_LEVERAGE.value
-    idx_mmf = RiskParameter.MAINTENANCE_MARGIN_FRACTION.value
-    idx_lfr = RiskParameter.LIQUIDATION_FEE_RATE.value
+    idx_delta = RiskParameter.DELTA
+    idx_cap_leverage = RiskParameter.CAP_LEVERAGE
+    idx_mmf = RiskParameter.MAINTENANCE_MARGIN_FRACTION
+    idx_lfr = RiskParameter.LIQUIDATION_FEE_RATE
 
     tol = 1e-4
 
@@ -168,10 +168,10 @@ def test_set_liquidation_fee_rate_reverts_when_max_lev_liquidatable(
     market, factory
 ):
     # idx for delta, cap_leverage, maintenance, liquidation fee rate
-    idx_delta = RiskParameter.DELTA.value
-    idx_cap_leverage = RiskParameter.CAP_LEVERAGE.value
-    idx_mmf = RiskParameter.MAINTENANCE_MARGIN_FRACTION.value
-    idx_lfr = RiskParameter.LIQUIDATION_FEE_RATE.value
+    idx_delta = RiskParameter.DELTA
+    idx_cap_leverage = RiskParameter.CAP_LEVERAGE
+    idx_mmf = RiskParameter.MAINTENANCE_MARGIN_FRACTION
+    idx_lfr = RiskParameter.LIQUIDATION_FEE_RATE
 
     tol = 1e-4
 
@@ -200,7 +200,7 @@ def test_set_price_drift_upper_limit_reverts_when_exceeds_max_exp(
 ):
     # idx for price drift upper limit is: 13
     # in enum Risk.Parameters
-    idx_price_drift_upper_limit = RiskParameter.PRICE_DRIFT_UPPER_LIMIT.value
+    idx_price_drift_upper_limit = RiskParameter.PRICE_DRIFT_UPPER_LIMIT
 
     _, _, macro_window, _, _, _, _, _ = feed.latest()
     max_exp = 20000000000000000000
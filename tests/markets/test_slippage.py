@@ -8,6 +8,9 @@ from .utils import (
 )
 
 
+pytestmark = pytest.mark.usefixtures("approve_market")
+
+
 # NOTE: Tests passing with isolation fixture
 @pytest.fixture(autouse=True)
 def isolation(fn_isolation):
@@ -28,8 +31,8 @@ def test_build_when_price_limit_is_breached(market, feed, alice, ovl, is_long):
 
     # calculate expected pos info data
     trading_fee_rate = Decimal(
-        market.params(RiskParameter.TRADING_FEE_RATE.value) / 1e18)
-    collateral, notional, debt, trade_fee \
+        market.params(RiskParameter.TRADING_FEE_RATE) / 1e18)
+    collateral, notional, debt, _ \
         = calculate_position_info(notional, leverage, trading_fee_rate)
 
     # calculate expected entry price
@@ -40,7 +43,7 @@ def test_build_when_price_limit_is_breached(market, feed, alice, ovl, is_long):
 
     oi = market.oiFromNotional(int(notional * Decimal(1e18)), mid)
     cap_notional = Decimal(market.capNotionalAdjustedForBounds(
-        data, market.params(RiskParameter.CAP_NOTIONAL.value)))
+        data, market.params(RiskParameter.CAP_NOTIONAL)))
     cap_oi = Decimal(market.oiFromNotional(cap_notional, mid))
     volume = int((oi / cap_oi) * Decimal(1e18))
 
@@ -51,12 +54,6 @@ def test_build_when_price_limit_is_breached(market, feed, alice, ovl, is_long):
     input_leverage = int(leverage * Decimal(1e18))
     input_is_long = is_long
 
-    # approve collateral amount: collateral + trade fee
-    approve_collateral = int((collateral + trade_fee) * Decimal(1e18))
-
-    # approve market for spending then build
-    ovl.approve(market, approve_collateral, {"from": alice})
-
     # check build reverts when price surpasses limit
     input_price_limit = price * (1 - tol) if is_long else price * (1 + tol)
     with reverts("OVLV1:slippage>max"):
@@ -84,12 +81,12 @@ def test_unwind_when_price_limit_is_breached(market, feed, alice, factory, ovl,
     tol = 1e-3
 
     # so don't have to worry about funding
-    market.setRiskParam(RiskParameter.K.value, 0, {"from": factory})
+    market.setRiskParam(RiskParameter.K, 0, {"from": factory})
 
     # calculate expected pos info data
     trading_fee_rate = Decimal(
-        market.params(RiskParameter.TRADING_FEE_RATE.value) / 1e18)
-    collateral, notional, debt, trade_fee \
+        market.params(RiskParameter.TRADING_FEE_RATE) / 1e18)
+    collateral, notional, debt, _ \
         = calculate_position_info(notional, leverage, trading_fee_rate)
 
     # input values for tx
@@ -98,11 +95,7 @@ def test_unwind_when_price_limit_is_breached(market, feed, alice, factory, ovl,
     input_is_long = is_long
     input_price_limit = 2**256-1 if is_long else 0
 
-    # approve collateral amount: collateral + trade fee
-    approve_collateral = int((collateral + trade_fee) * Decimal(1e18))
-
-    # approve market for spending then build
-    ovl.approve(market, approve_collateral, {"from": alice})
+    # build
     tx = market.build(input_collateral, input_leverage, input_is_long,
                       input_price_limit, {"from": alice})
     pos_id = tx.return_value
@@ -120,7 +113,7 @@ def test_unwind_when_price_limit_is_breached(market, feed, alice, factory, ovl,
 
     oi = market.oiFromNotional(actual_notional, mid)
     cap_notional = Decimal(market.capNotionalAdjustedForBounds(
-        data, market.params(RiskParameter.CAP_NOTIONAL.value)))
+        data, market.params(RiskParameter.CAP_NOTIONAL)))
     cap_oi = Decimal(market.oiFromNotional(cap_notional, mid))
     volume = int((oi / cap_oi) * Decimal(1e18))
 
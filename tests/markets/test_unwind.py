@@ -1,20 +1,69 @@
 import pytest
 from pytest import approx
-from brownie import chain, reverts
+from brownie import ZERO_ADDRESS, chain, reverts
 from brownie.test import given, strategy
 from decimal import Decimal
 from math import exp
-from random import randint
+from random import Random
 
 from .utils import (
     calculate_position_info,
+    calculate_position_info_int,
+    calculate_unwound_pnl,
     get_position_key,
+    iapprox,
+    multicall_latest,
     mid_from_feed,
     entry_from_mid_ratio,
-    RiskParameter
+    RiskParameter,
+    ONE,
+    ONE_E18
 )
 
 
+def build_position(market, trader, notional, leverage, is_long,
+                   trading_fee_rate):
+    """
+    Builds position of notional, leverage (Decimal) on market from trader.
+    Returns the position id
+    """
+    collateral, _, _, _ = calculate_position_info_int(
+        int(notional * ONE_E18), int(leverage * ONE_E18), trading_fee_rate)
+
+    # NOTE: slippage tests in test_slippage.py
+    # NOTE: setting to min/max here, so never reverts with slippage>max
+    input_price_limit = 2**256-1 if is_long else 0
+    tx = market.build(collateral, int(leverage * ONE_E18), is_long,
+                      input_price_limit, {"from": trader})
+    return tx.events["Build"]["positionId"]
+
+
+def unwind_position(market, trader, pos_id, fraction, is_long):
+    """
+    Unwinds fraction (Decimal) of position pos_id on market from trader.
+    Returns unwind tx
+    """
+    # NOTE: slippage tests in test_slippage.py
+    # NOTE: setting to min/max here, so never reverts with slippage>max
+    input_price_limit = 0 if is_long else 2**256-1
+    return market.unwind(pos_id, int(fraction * ONE_E18),
+                         input_price_limit, {"from": trader})
+
+
+def oi_on_side(market, is_long):
+    """
+    Returns aggregate (oi, oi shares) on the long or short side of market
+    """
+    with multicall_latest():
+        oi = market.oiLong() if is_long else market.oiShort()
+        oi_shares = market.oiLongShares() if is_long \
+            else market.oiShortShares()
+    return int(oi), int(oi_shares)
+
+
+pytestmark = pytest.mark.usefixtures("approve_market")
+
+
 # NOTE: Tests passing with isolation fixture
 # TODO: Fix tests to pass even without isolation fixture (?)
 @pytest.fixture(autouse=True)
@@ -22,49 +71,42 @@ def isolation(fn_isolation):
     pass
 
 
+# NOTE: static spread factors (e**delta, e**-delta) from the mock market
+# delta, used to offset bid/ask when moving the mock price to liquidation
+@pytest.fixture(scope="module")
+def spread_factors(mock_risk_params):
+    delta = Decimal(mock_risk_params[RiskParameter.DELTA]) / ONE_E18
+    yield Decimal(exp(delta)), Decimal(exp(-delta))
+
+
 @given(
     fraction=strategy('decimal', min_value='0.001', max_value='1.000',
                       places=3),
     is_long=strategy('bool'))
-def test_unwind_updates_position(market, feed, alice, rando, ovl,
-                                 fraction, is_long):
+def test_unwind_updates_position(market, risk_params, multicall2, feed, alice,
+                                 rando, ovl, fraction, is_long):
     # position build attributes
     notional_initial = Decimal(1000)
     leverage = Decimal(1.5)
 
-    # calculate expected pos info data
-    idx_trade = RiskParameter.TRADING_FEE_RATE.value
-    trading_fee_rate = Decimal(market.params(idx_trade) / 1e18)
-    collateral, _, _, trade_fee \
-        = calculate_position_info(notional_initial, leverage, trading_fee_rate)
-
-    # input values for build
-    input_collateral = int(collateral * Decimal(1e18))
-    input_leverage = int(leverage * Decimal(1e18))
-    input_is_long = is_long
-
-    # NOTE: slippage tests in test_slippage.py
-    # NOTE: setting to min/max here, so never reverts with slippage>max
-    input_price_limit = 2**256-1 if is_long else 0
-
-    # approve collateral amount: collateral + trade fee
-    approve_collateral = int((collateral + trade_fee) * Decimal(1e18))
+    trading_fee_rate = risk_params[RiskParameter.TRADING_FEE_RATE]
 
-    # approve then build
+    # build
     # NOTE: build() tests in test_build.py
-    ovl.approve(market, approve_collateral, {"from": alice})
-    tx = market.build(input_collateral, input_leverage, input_is_long,
-                      input_price_limit, {"from": alice})
-    pos_id = tx.return_value
+    pos_id = build_position(market, alice, notional_initial, leverage,
+                            is_long, trading_fee_rate)
 
-    # get position info
+    # get position info and feed data for the entry price
     pos_key = get_position_key(alice.address, pos_id)
+    with multicall_latest():
+        position = market.positions(pos_key)
+        data = feed.latest()
+
     (expect_notional, expect_debt, expect_mid_ratio,
      expect_is_long, expect_liquidated,
-     expect_oi_shares) = market.positions(pos_key)
+     expect_oi_shares) = position
 
     # calculate the entry price
-    data = feed.latest()
     mid_price = int(mid_from_feed(data))
     expect_entry_price = entry_from_mid_ratio(expect_mid_ratio, mid_price)
 
@@ -77,10 +119,7 @@ def test_unwind_updates_position(market, feed, alice, rando, ovl,
     _ = market.update({"from": rando})
 
     # calculate current oi, debt values of position
-    expect_total_oi = market.oiLong() if is_long \
-        else market.oiShort()
-    expect_total_oi_shares = market.oiLongShares() if is_long \
-        else market.oiShortShares()
+    expect_total_oi, expect_total_oi_shares = oi_on_side(market, is_long)
     expect_oi_current = (Decimal(expect_total_oi)*Decimal(expect_oi_shares)) \
         / Decimal(expect_total_oi_shares)
 
@@ -91,25 +130,18 @@ def test_unwind_updates_position(market, feed, alice, rando, ovl,
     unwound_notional = fraction * Decimal(expect_notional)
     unwound_cost = fraction * Decimal(expect_notional - expect_debt)
 
-    # input values for unwind
-    input_pos_id = pos_id
-    input_fraction = int(fraction * Decimal(1e18))
-
-    # NOTE: slippage tests in test_slippage.py
-    # NOTE: setting to min/max here, so never reverts with slippage>max
-    input_price_limit = 0 if is_long else 2**256-1
-
     # unwind fraction of shares
-    tx = market.unwind(input_pos_id, input_fraction, input_price_limit,
-                       {"from": alice})
+    tx = unwind_position(market, alice, pos_id, fraction, is_long)
 
     # calculate expected exit price
-    data = feed.latest()
-    idx_cap_notional = RiskParameter.CAP_NOTIONAL.value
+    with multicall_latest():
+        data = feed.latest()
+        actual_position = market.positions(pos_key)
+
     cap_notional = Decimal(market.capNotionalAdjustedForBounds(
-        data, market.params(idx_cap_notional)))
-    cap_oi = cap_notional * Decimal(1e18) / Decimal(mid_from_feed(data))
-    volume = int((unwound_oi / cap_oi) * Decimal(1e18))
+        data, risk_params[RiskParameter.CAP_NOTIONAL]))
+    cap_oi = cap_notional * ONE_E18 / Decimal(mid_from_feed(data))
+    volume = int((unwound_oi / cap_oi) * ONE_E18)
     expect_exit_price = market.bid(data, volume) if is_long \
         else market.ask(data, volume)
 
@@ -121,7 +153,7 @@ def test_unwind_updates_position(market, feed, alice, rando, ovl,
     # check expected pos attributes match actual after unwind
     (actual_notional, actual_debt, actual_mid_ratio,
      actual_is_long, actual_liquidated,
-     actual_oi_shares) = market.positions(pos_key)
+     actual_oi_shares) = actual_position
 
     assert int(actual_oi_shares) == approx(expect_oi_shares)
     assert int(actual_notional) == approx(expect_notional)
@@ -134,16 +166,14 @@ def test_unwind_updates_position(market, feed, alice, rando, ovl,
     assert "Unwind" in tx.events
     assert tx.events["Unwind"]["sender"] == alice.address
     assert tx.events["Unwind"]["positionId"] == pos_id
-    assert tx.events["Unwind"]["fraction"] == input_fraction
+    assert tx.events["Unwind"]["fraction"] == int(fraction * ONE_E18)
 
     actual_exit_price = int(tx.events["Unwind"]["price"])
     assert actual_exit_price == approx(expect_exit_price, rel=1e-3)
 
     # calculate expected values for mint comparison
-    unwound_pnl = (unwound_oi / Decimal(1e18)) * \
-        (Decimal(actual_exit_price) - Decimal(expect_entry_price))
-    if not is_long:
-        unwound_pnl *= -1
+    unwound_pnl = calculate_unwound_pnl(unwound_oi, expect_entry_price,
+                                        actual_exit_price, is_long)
     unwound_funding = unwound_notional * (unwound_oi/unwound_oi_shares - 1)
 
     expect_value = int(unwound_cost + unwound_pnl + unwound_funding)
@@ -159,36 +189,18 @@ def test_unwind_updates_position(market, feed, alice, rando, ovl,
     fraction=strategy('decimal', min_value='0.001', max_value='1.000',
                       places=3),
     is_long=strategy('bool'))
-def test_unwind_removes_oi(market, feed, alice, rando, ovl,
-                           fraction, is_long):
+def test_unwind_removes_oi(market, risk_params, multicall2, feed, alice, rando,
+                           ovl, fraction, is_long):
     # position build attributes
     notional_initial = Decimal(1000)
     leverage = Decimal(1.5)
 
-    # calculate expected pos info data
-    idx_trade = RiskParameter.TRADING_FEE_RATE.value
-    trading_fee_rate = Decimal(market.params(idx_trade) / 1e18)
-    collateral, _, _, trade_fee \
-        = calculate_position_info(notional_initial, leverage, trading_fee_rate)
-
-    # input values for build
-    input_collateral = int(collateral * Decimal(1e18))
-    input_leverage = int(leverage * Decimal(1e18))
-    input_is_long = is_long
-
-    # NOTE: slippage tests in test_slippage.py
-    # NOTE: setting to min/max here, so never reverts with slippage>max
-    input_price_limit = 2**256-1 if is_long else 0
-
-    # approve collateral amount: collateral + trade fee
-    approve_collateral = int((collateral + trade_fee) * Decimal(1e18))
+    trading_fee_rate = risk_params[RiskParameter.TRADING_FEE_RATE]
 
-    # approve then build
+    # build
     # NOTE: build() tests in test_build.py
-    ovl.approve(market, approve_collateral, {"from": alice})
-    tx = market.build(input_collateral, input_leverage, input_is_long,
-                      input_price_limit, {"from": alice})
-    pos_id = tx.return_value
+    pos_id = build_position(market, alice, notional_initial, leverage,
+                            is_long, trading_fee_rate)
 
     # get position info
     pos_key = get_position_key(alice.address, pos_id)
@@ -205,9 +217,7 @@ def test_unwind_removes_oi(market, feed, alice, rando, ovl,
     _ = market.update({"from": rando})
 
     # calculate current oi, debt values of position
-    expect_total_oi = market.oiLong() if is_long else market.oiShort()
-    expect_total_oi_shares = market.oiLongShares() if is_long \
-        else market.oiShortShares()
+    expect_total_oi, expect_total_oi_shares = oi_on_side(market, is_long)
     expect_oi_current = (Decimal(expect_total_oi)*Decimal(expect_oi_shares)) \
         / Decimal(expect_total_oi_shares)
 
@@ -215,63 +225,34 @@ def test_unwind_removes_oi(market, feed, alice, rando, ovl,
     unwound_oi = int(fraction * expect_oi_current)
     unwound_oi_shares = int(fraction * Decimal(expect_oi_shares))
 
-    # input values for unwind
-    input_pos_id = pos_id
-    input_fraction = int(fraction * Decimal(1e18))
-
-    # NOTE: slippage tests in test_slippage.py
-    # NOTE: setting to min/max here, so never reverts with slippage>max
-    input_price_limit = 0 if is_long else 2**256-1
-
     # unwind fraction of shares
-    tx = market.unwind(input_pos_id, input_fraction, input_price_limit,
-                       {"from": alice})
+    unwind_position(market, alice, pos_id, fraction, is_long)
 
     # adjust total oi and total oi shares downward for unwind
     expect_total_oi -= unwound_oi
     expect_total_oi_shares -= unwound_oi_shares
 
     # check expected total oi and oi shares on side match actual
-    actual_total_oi = market.oiLong() if is_long else market.oiShort()
-    actual_total_oi_shares = market.oiLongShares() \
-        if is_long else market.oiShortShares()
+    actual_total_oi, actual_total_oi_shares = oi_on_side(market, is_long)
 
     assert int(actual_total_oi) == approx(expect_total_oi, rel=1e-4)
     assert int(actual_total_oi_shares) == approx(expect_total_oi_shares,
                                                  rel=1e-4)
 
 
-def test_unwind_updates_market(market, alice, ovl):
+def test_unwind_updates_market(market, risk_params, alice, ovl):
     # position build attributes
     notional_initial = Decimal(1000)
     leverage = Decimal(1.5)
     fraction = Decimal(1.0)
     is_long = True
 
-    # calculate expected pos info data
-    idx_trade = RiskParameter.TRADING_FEE_RATE.value
-    trading_fee_rate = Decimal(market.params(idx_trade) / 1e18)
-    collateral, _, _, trade_fee \
-        = calculate_position_info(notional_initial, leverage, trading_fee_rate)
-
-    # input values for build
-    input_collateral = int(collateral * Decimal(1e18))
-    input_leverage = int(leverage * Decimal(1e18))
-    input_is_long = is_long
-
-    # NOTE: slippage tests in test_slippage.py
-    # NOTE: setting to min/max here, so never reverts with slippage>max
-    input_price_limit = 2**256-1 if is_long else 0
+    trading_fee_rate = risk_params[RiskParameter.TRADING_FEE_RATE]
 
-    # approve collateral amount: collateral + trade fee
-    approve_collateral = int((collateral + trade_fee) * Decimal(1e18))
-
-    # approve then build
+    # build
     # NOTE: build() tests in test_build.py
-    ovl.approve(market, approve_collateral, {"from": alice})
-    tx = market.build(input_collateral, input_leverage, input_is_long,
-                      input_price_limit, {"from": alice})
-    pos_id = tx.return_value
+    pos_id = build_position(market, alice, notional_initial, leverage,
+                            is_long, trading_fee_rate)
 
     # cache prior timestamp update last value
     prior_timestamp_update_last = market.timestampUpdateLast()
@@ -280,17 +261,8 @@ def test_unwind_updates_market(market, alice, ovl):
     # funding should occur within this interval
     chain.mine(timedelta=600)
 
-    # input values for unwind
-    input_pos_id = pos_id
-    input_fraction = int(fraction * Decimal(1e18))
-
-    # NOTE: slippage tests in test_slippage.py
-    # NOTE: setting to min/max here, so never reverts with slippage>max
-    input_price_limit = 0 if is_long else 2**256-1
-
     # unwind fraction of shares
-    tx = market.unwind(input_pos_id, input_fraction, input_price_limit,
-                       {"from": alice})
+    tx = unwind_position(market, alice, pos_id, fraction, is_long)
 
     # get the expected timestamp and check equal to actual
     expect_timestamp_update_last = chain[tx.block_number]['timestamp']
@@ -304,36 +276,18 @@ def test_unwind_updates_market(market, alice, ovl):
     fraction=strategy('decimal', min_value='0.001', max_value='1.000',
                       places=3),
     is_long=strategy('bool'))
-def test_unwind_registers_volume(market, feed, alice, rando, ovl,
-                                 fraction, is_long):
+def test_unwind_registers_volume(market, risk_params, multicall2, feed, alice,
+                                 rando, ovl, fraction, is_long):
     # position build attributes
     notional_initial = Decimal(1000)
     leverage = Decimal(1.5)
 
-    # calculate expected pos info data
-    idx_trade = RiskParameter.TRADING_FEE_RATE.value
-    trading_fee_rate = Decimal(market.params(idx_trade) / 1e18)
-    collateral, _, _, trade_fee \
-        = calculate_position_info(notional_initial, leverage, trading_fee_rate)
-
-    # input values for build
-    input_collateral = int(collateral * Decimal(1e18))
-    input_leverage = int(leverage * Decimal(1e18))
-    input_is_long = is_long
+    trading_fee_rate = risk_params[RiskParameter.TRADING_FEE_RATE]
 
-    # NOTE: slippage tests in test_slippage.py
-    # NOTE: setting to min/max here, so never reverts with slippage>max
-    input_price_limit = 2**256-1 if is_long else 0
-
-    # approve collateral amount: collateral + trade fee
-    approve_collateral = int((collateral + trade_fee) * Decimal(1e18))
-
-    # approve then build
+    # build
     # NOTE: build() tests in test_build.py
-    ovl.approve(market, approve_collateral, {"from": alice})
-    tx = market.build(input_collateral, input_leverage, input_is_long,
-                      input_price_limit, {"from": alice})
-    pos_id = tx.return_value
+    pos_id = build_position(market, alice, notional_initial, leverage,
+                            is_long, trading_fee_rate)
 
     # get position info
     pos_key = get_position_key(alice.address, pos_id)
@@ -350,41 +304,37 @@ def test_unwind_registers_volume(market, feed, alice, rando, ovl,
     _ = market.update({"from": rando})
 
     # priors actual values. longs get the bid, shorts get the ask on unwind
-    snapshot_volume = market.snapshotVolumeBid() if is_long \
-        else market.snapshotVolumeAsk()
-    last_timestamp, last_window, last_volume = snapshot_volume
-
-    last_total_oi = market.oiLong() if is_long \
-        else market.oiShort()
-    last_total_oi_shares = market.oiLongShares() if is_long \
-        else market.oiShortShares()
-    last_pos_oi = (last_total_oi * expect_oi_shares) / last_total_oi_shares
-
-    # input values for unwind
-    input_pos_id = pos_id
-    input_fraction = int(fraction * Decimal(1e18))
+    with multicall_latest():
+        snapshot_volume = market.snapshotVolumeBid() if is_long \
+            else market.snapshotVolumeAsk()
+        last_total_oi = market.oiLong() if is_long \
+            else market.oiShort()
+        last_total_oi_shares = market.oiLongShares() if is_long \
+            else market.oiShortShares()
 
-    # NOTE: slippage tests in test_slippage.py
-    # NOTE: setting to min/max here, so never reverts with slippage>max
-    input_price_limit = 0 if is_long else 2**256-1
+    last_timestamp, last_window, last_volume = snapshot_volume
+    last_pos_oi = (int(last_total_oi) * expect_oi_shares) \
+        / int(last_total_oi_shares)
 
     # unwind fraction of shares
-    tx = market.unwind(input_pos_id, input_fraction, input_price_limit,
-                       {"from": alice})
+    tx = unwind_position(market, alice, pos_id, fraction, is_long)
 
     # calculate expected rolling volume and window numbers when
     # adjusted for decay
     # NOTE: decayOverWindow() tested in test_rollers.py
-    data = feed.latest()
+    with multicall_latest():
+        data = feed.latest()
+        actual = market.snapshotVolumeBid() if is_long else \
+            market.snapshotVolumeAsk()
+
     _, micro_window, _, _, _, _, _, _ = data
 
     oi = fraction * Decimal(last_pos_oi)
-    idx_cap_notional = RiskParameter.CAP_NOTIONAL.value
     cap_notional = Decimal(market.capNotionalAdjustedForBounds(
-        data, market.params(idx_cap_notional)))
-    cap_oi = cap_notional * Decimal(1e18) / Decimal(mid_from_feed(data))
+        data, risk_params[RiskParameter.CAP_NOTIONAL]))
+    cap_oi = cap_notional * ONE_E18 / Decimal(mid_from_feed(data))
 
-    input_volume = int((oi / cap_oi) * Decimal(1e18))
+    input_volume = int((oi / cap_oi) * ONE_E18)
     input_window = micro_window
     input_timestamp = chain[tx.block_number]['timestamp']
 
@@ -404,8 +354,6 @@ def test_unwind_registers_volume(market, feed, alice, rando, ovl,
     expect_timestamp = input_timestamp
 
     # compare with actual rolling volume, timestamp last, window last values
-    actual = market.snapshotVolumeBid() if is_long else \
-        market.snapshotVolumeAsk()
     actual_timestamp, actual_window, actual_volume = actual
 
     assert actual_timestamp == expect_timestamp
@@ -417,68 +365,38 @@ def test_unwind_registers_volume(market, feed, alice, rando, ovl,
     fraction=strategy('decimal', min_value='0.001', max_value='1.000',
                       places=3),
     is_long=strategy('bool'))
-def test_unwind_registers_mint(market, feed, alice, rando, ovl,
-                               fraction, is_long):
+def test_unwind_registers_mint(market, risk_params, feed, alice, ovl, fraction,
+                               is_long):
     # position build attributes
     notional_initial = Decimal(1000)
     leverage = Decimal(1.5)
 
-    # calculate expected pos info data
-    idx_trade = RiskParameter.TRADING_FEE_RATE.value
-    trading_fee_rate = Decimal(market.params(idx_trade) / 1e18)
-    collateral, _, _, trade_fee \
-        = calculate_position_info(notional_initial, leverage, trading_fee_rate)
-
-    # input values for build
-    input_collateral = int(collateral * Decimal(1e18))
-    input_leverage = int(leverage * Decimal(1e18))
-    input_is_long = is_long
-
-    # NOTE: slippage tests in test_slippage.py
-    # NOTE: setting to min/max here, so never reverts with slippage>max
-    input_price_limit = 2**256-1 if is_long else 0
-
-    # approve collateral amount: collateral + trade fee
-    approve_collateral = int((collateral + trade_fee) * Decimal(1e18))
+    trading_fee_rate = risk_params[RiskParameter.TRADING_FEE_RATE]
 
-    # approve then build
+    # build
     # NOTE: build() tests in test_build.py
-    ovl.approve(market, approve_collateral, {"from": alice})
-    tx = market.build(input_collateral, input_leverage, input_is_long,
-                      input_price_limit, {"from": alice})
-    pos_id = tx.return_value
+    pos_id = build_position(market, alice, notional_initial, leverage,
+                            is_long, trading_fee_rate)
 
     # mine the chain forward for some time difference with build and unwind
     # funding should occur within this interval.
-    # Use update() to update state to query values for checks vs expected
-    # after unwind.
-    # NOTE: update() tests in test_update.py
+    # NOTE: no update() prior needed. unwind calls update() itself and
+    # funding doesn't change the minted snapshot read before unwind
     chain.mine(timedelta=600)
-    _ = market.update({"from": rando})
 
     # priors actual values for snapshot of minted roller
     snapshot_minted = market.snapshotMinted()
     last_timestamp, last_window, last_minted = snapshot_minted
 
-    # input values for unwind
-    input_pos_id = pos_id
-    input_fraction = int(fraction * Decimal(1e18))
-
-    # NOTE: slippage tests in test_slippage.py
-    # NOTE: setting to min/max here, so never reverts with slippage>max
-    input_price_limit = 0 if is_long else 2**256-1
-
     # unwind fraction of shares
-    tx = market.unwind(input_pos_id, input_fraction, input_price_limit,
-                       {"from": alice})
+    tx = unwind_position(market, alice, pos_id, fraction, is_long)
     actual_mint = tx.events["Unwind"]["mint"]
 
     # calculate expected rolling minted and window numbers when
     # adjusted for decay
     # NOTE: decayOverWindow() tested in test_rollers.py
     input_minted = int(actual_mint)
-    input_window = int(market.params(
-        RiskParameter.CIRCUIT_BREAKER_WINDOW.value))
+    input_window = risk_params[RiskParameter.CIRCUIT_BREAKER_WINDOW]
     input_timestamp = chain[tx.block_number]['timestamp']
 
     # expect accumulator now to be calculated as
@@ -510,45 +428,31 @@ def test_unwind_registers_mint(market, feed, alice, rando, ovl,
     fraction=strategy('decimal', min_value='0.001', max_value='1.000',
                       places=3),
     is_long=strategy('bool'))
-def test_unwind_executes_transfers(market, feed, alice, rando, ovl,
-                                   factory, fraction, is_long):
+def test_unwind_executes_transfers(market, risk_params, multicall2, feed,
+                                   alice, rando, ovl, factory, fraction,
+                                   is_long):
     # position build attributes
     notional_initial = Decimal(1000)
     leverage = Decimal(1.5)
 
-    # calculate expected pos info data
-    idx_trade = RiskParameter.TRADING_FEE_RATE.value
-    trading_fee_rate = Decimal(market.params(idx_trade) / 1e18)
-    collateral, _, _, trade_fee \
-        = calculate_position_info(notional_initial, leverage, trading_fee_rate)
-
-    # input values for build
-    input_collateral = int(collateral * Decimal(1e18))
-    input_leverage = int(leverage * Decimal(1e18))
-    input_is_long = is_long
+    trading_fee_rate = risk_params[RiskParameter.TRADING_FEE_RATE]
 
-    # NOTE: slippage tests in test_slippage.py
-    # NOTE: setting to min/max here, so never reverts with slippage>max
-    input_price_limit = 2**256-1 if is_long else 0
-
-    # approve collateral amount: collateral + trade fee
-    approve_collateral = int((collateral + trade_fee) * Decimal(1e18))
-
-    # approve then build
+    # build
     # NOTE: build() tests in test_build.py
-    ovl.approve(market, approve_collateral, {"from": alice})
-    tx = market.build(input_collateral, input_leverage, input_is_long,
-                      input_price_limit, {"from": alice})
-    pos_id = tx.return_value
+    pos_id = build_position(market, alice, notional_initial, leverage,
+                            is_long, trading_fee_rate)
 
-    # get position info
+    # get position info and feed data for the entry price
     pos_key = get_position_key(alice.address, pos_id)
+    with multicall_latest():
+        position = market.positions(pos_key)
+        data = feed.latest()
+
     (expect_notional, expect_debt, expect_mid_ratio,
      expect_is_long, expect_liquidated,
-     expect_oi_shares) = market.positions(pos_key)
+     expect_oi_shares) = position
 
     # calculate the entry price
-    data = feed.latest()
     mid_price = int(mid_from_feed(data))
     expect_entry_price = entry_from_mid_ratio(expect_mid_ratio, mid_price)
 
@@ -561,23 +465,12 @@ def test_unwind_executes_transfers(market, feed, alice, rando, ovl,
     _ = market.update({"from": rando})
 
     # calculate current oi, debt values of position
-    expect_total_oi = market.oiLong() if is_long else market.oiShort()
-    expect_total_oi_shares = market.oiLongShares() if is_long \
-        else market.oiShortShares()
+    expect_total_oi, expect_total_oi_shares = oi_on_side(market, is_long)
     expect_oi_current = (Decimal(expect_total_oi)*Decimal(expect_oi_shares)) \
         / Decimal(expect_total_oi_shares)
 
-    # input values for unwind
-    input_pos_id = pos_id
-    input_fraction = int(fraction * Decimal(1e18))
-
-    # NOTE: slippage tests in test_slippage.py
-    # NOTE: setting to min/max here, so never reverts with slippage>max
-    input_price_limit = 0 if is_long else 2**256-1
-
     # unwind fraction of shares
-    tx = market.unwind(input_pos_id, input_fraction, input_price_limit,
-                       {"from": alice})
+    tx = unwind_position(market, alice, pos_id, fraction, is_long)
 
     # get expected exit price
     price = tx.events["Unwind"]["price"]
@@ -593,14 +486,12 @@ def test_unwind_executes_transfers(market, feed, alice, rando, ovl,
     # unwound collateral here includes adjustments due to funding payments
     unwound_collateral = unwound_notional * (unwound_oi / unwound_oi_shares) \
         - unwound_debt
-    unwound_pnl = unwound_oi * \
-        (Decimal(price) - Decimal(expect_entry_price)) / Decimal(1e18)
-    if not is_long:
-        unwound_pnl *= -1
+    unwound_pnl = calculate_unwound_pnl(unwound_oi, expect_entry_price,
+                                        price, is_long)
 
     unwound_value = unwound_collateral + unwound_pnl
     unwound_notional_w_pnl = unwound_value + unwound_debt
-    unwound_trading_fee = unwound_notional_w_pnl * trading_fee_rate
+    unwound_trading_fee = unwound_notional_w_pnl * trading_fee_rate / ONE
     if unwound_trading_fee > unwound_value:
         unwound_trading_fee = unwound_value
 
@@ -614,10 +505,8 @@ def test_unwind_executes_transfers(market, feed, alice, rando, ovl,
     # if expect_mint > 0, should have a mint with Transfer event
     # If expect_mint < 0, should have a burn with Transfer event
     minted = expect_mint > 0
-    expect_mint_from = "0x0000000000000000000000000000000000000000" if minted \
-        else market.address
-    expect_mint_to = market.address if minted \
-        else "0x0000000000000000000000000000000000000000"
+    expect_mint_from = ZERO_ADDRESS if minted else market.address
+    expect_mint_to = market.address if minted else ZERO_ADDRESS
     expect_mint_mag = abs(expect_mint)
 
     # value less fees expected
@@ -659,36 +548,18 @@ def test_unwind_executes_transfers(market, feed, alice, rando, ovl,
     fraction=strategy('decimal', min_value='0.001', max_value='1.000',
                       places=3),
     is_long=strategy('bool'))
-def test_unwind_transfers_value_to_trader(market, feed, alice, rando, ovl,
-                                          fraction, is_long):
+def test_unwind_transfers_value_to_trader(market, risk_params, multicall2,
+                                          feed, alice, ovl, fraction, is_long):
     # position build attributes
     notional_initial = Decimal(1000)
     leverage = Decimal(1.5)
 
-    # calculate expected pos info data
-    idx_trade = RiskParameter.TRADING_FEE_RATE.value
-    trading_fee_rate = Decimal(market.params(idx_trade) / 1e18)
-    collateral, _, _, trade_fee \
-        = calculate_position_info(notional_initial, leverage, trading_fee_rate)
-
-    # input values for build
-    input_collateral = int(collateral * Decimal(1e18))
-    input_leverage = int(leverage * Decimal(1e18))
-    input_is_long = is_long
+    trading_fee_rate = risk_params[RiskParameter.TRADING_FEE_RATE]
 
-    # NOTE: slippage tests in test_slippage.py
-    # NOTE: setting to min/max here, so never reverts with slippage>max
-    input_price_limit = 2**256-1 if is_long else 0
-
-    # approve collateral amount: collateral + trade fee
-    approve_collateral = int((collateral + trade_fee) * Decimal(1e18))
-
-    # approve then build
+    # build
     # NOTE: build() tests in test_build.py
-    ovl.approve(market, approve_collateral, {"from": alice})
-    tx = market.build(input_collateral, input_leverage, input_is_long,
-                      input_price_limit, {"from": alice})
-    pos_id = tx.return_value
+    pos_id = build_position(market, alice, notional_initial, leverage,
+                            is_long, trading_fee_rate)
 
     # get position info
     pos_key = get_position_key(alice.address, pos_id)
@@ -698,39 +569,33 @@ def test_unwind_transfers_value_to_trader(market, feed, alice, rando, ovl,
 
     # mine the chain forward for some time difference with build and unwind
     # funding should occur within this interval.
-    # Use update() to update state to query values for checks vs expected
-    # after unwind.
-    # NOTE: update() tests in test_update.py
+    # NOTE: no update() prior needed. unwind calls update() itself and
+    # funding doesn't change the ovl balances read before unwind
     chain.mine(timedelta=600)
-    tx = market.update({"from": rando})
 
     # priors actual values
-    expect_balance_alice = ovl.balanceOf(alice)
-    expect_balance_market = ovl.balanceOf(market)
+    with multicall_latest():
+        balance_alice = ovl.balanceOf(alice)
+        balance_market = ovl.balanceOf(market)
+
+    expect_balance_alice = int(balance_alice)
+    expect_balance_market = int(balance_market)
 
     # calculate position attributes at the current time for fraction
     # ignore payoff cap
-    unwound_cost = fraction * Decimal(expect_notional - expect_debt)
-    unwound_debt = fraction * Decimal(expect_debt)
-
-    # input values for unwind
-    input_pos_id = pos_id
-    input_fraction = int(fraction * Decimal(1e18))
-
-    # NOTE: slippage tests in test_slippage.py
-    # NOTE: setting to min/max here, so never reverts with slippage>max
-    input_price_limit = 0 if is_long else 2**256-1
+    input_fraction = int(fraction * ONE_E18)
+    unwound_cost = (expect_notional - expect_debt) * input_fraction // ONE
+    unwound_debt = expect_debt * input_fraction // ONE
 
     # unwind fraction of shares
-    tx = market.unwind(input_pos_id, input_fraction, input_price_limit,
-                       {"from": alice})
+    tx = unwind_position(market, alice, pos_id, fraction, is_long)
     actual_mint = tx.events["Unwind"]["mint"]
     expect_balance_market += actual_mint
 
     # calculate expected values
-    expect_value = int(unwound_cost + actual_mint)
-    expect_notional = int(expect_value + unwound_debt)
-    expect_trade_fee = int(Decimal(expect_notional) * trading_fee_rate)
+    expect_value = unwound_cost + int(actual_mint)
+    expect_notional = expect_value + unwound_debt
+    expect_trade_fee = expect_notional * trading_fee_rate // ONE
     if expect_trade_fee > expect_value:
         expect_trade_fee = expect_value
 
@@ -739,8 +604,9 @@ def test_unwind_transfers_value_to_trader(market, feed, alice, rando, ovl,
     expect_balance_alice += expect_value_out
     expect_balance_market -= expect_value
 
-    actual_balance_alice = ovl.balanceOf(alice)
-    actual_balance_market = ovl.balanceOf(market)
+    with multicall_latest():
+        actual_balance_alice = ovl.balanceOf(alice)
+        actual_balance_market = ovl.balanceOf(market)
 
     assert int(actual_balance_alice) == approx(expect_balance_alice)
     assert int(actual_balance_market) == approx(expect_balance_market)
@@ -750,36 +616,18 @@ def test_unwind_transfers_value_to_trader(market, feed, alice, rando, ovl,
     fraction=strategy('decimal', min_value='0.001', max_value='1.000',
                       places=3),
     is_long=strategy('bool'))
-def test_unwind_transfers_trading_fees(market, feed, alice, rando, ovl,
-                                       factory, fraction, is_long):
+def test_unwind_transfers_trading_fees(market, risk_params, multicall2, feed,
+                                       alice, ovl, factory, fraction, is_long):
     # position build attributes
     notional_initial = Decimal(1000)
     leverage = Decimal(1.5)
 
-    # calculate expected pos info data
-    idx_trade = RiskParameter.TRADING_FEE_RATE.value
-    trading_fee_rate = Decimal(market.params(idx_trade) / 1e18)
-    collateral, _, _, trade_fee \
-        = calculate_position_info(notional_initial, leverage, trading_fee_rate)
-
-    # input values for build
-    input_collateral = int(collateral * Decimal(1e18))
-    input_leverage = int(leverage * Decimal(1e18))
-    input_is_long = is_long
-
-    # NOTE: slippage tests in test_slippage.py
-    # NOTE: setting to min/max here, so never reverts with slippage>max
-    input_price_limit = 2**256-1 if is_long else 0
-
-    # approve collateral amount: collateral + trade fee
-    approve_collateral = int((collateral + trade_fee) * Decimal(1e18))
+    trading_fee_rate = risk_params[RiskParameter.TRADING_FEE_RATE]
 
-    # approve then build
+    # build
     # NOTE: build() tests in test_build.py
-    ovl.approve(market, approve_collateral, {"from": alice})
-    tx = market.build(input_collateral, input_leverage, input_is_long,
-                      input_price_limit, {"from": alice})
-    pos_id = tx.return_value
+    pos_id = build_position(market, alice, notional_initial, leverage,
+                            is_long, trading_fee_rate)
 
     # get position info
     pos_key = get_position_key(alice.address, pos_id)
@@ -789,48 +637,43 @@ def test_unwind_transfers_trading_fees(market, feed, alice, rando, ovl,
 
     # mine the chain forward for some time difference with build and unwind
     # funding should occur within this interval.
-    # Use update() to update state to query values for checks vs expected
-    # after unwind.
-    # NOTE: update() tests in test_update.py
+    # NOTE: no update() prior needed. unwind calls update() itself and
+    # funding doesn't change the ovl balances read before unwind
     chain.mine(timedelta=600)
-    tx = market.update({"from": rando})
 
     # priors actual values
     recipient = factory.feeRecipient()
-    expect_balance_recipient = ovl.balanceOf(recipient)
-    expect_balance_market = ovl.balanceOf(market)
+    with multicall_latest():
+        balance_recipient = ovl.balanceOf(recipient)
+        balance_market = ovl.balanceOf(market)
+
+    expect_balance_recipient = int(balance_recipient)
+    expect_balance_market = int(balance_market)
 
     # calculate position attributes at the current time for fraction
     # ignore payoff cap
-    unwound_cost = fraction * Decimal(expect_notional - expect_debt)
-    unwound_debt = fraction * Decimal(expect_debt)
-
-    # input values for unwind
-    input_pos_id = pos_id
-    input_fraction = int(fraction * Decimal(1e18))
-
-    # NOTE: slippage tests in test_slippage.py
-    # NOTE: setting to min/max here, so never reverts with slippage>max
-    input_price_limit = 0 if is_long else 2**256-1
+    input_fraction = int(fraction * ONE_E18)
+    unwound_cost = (expect_notional - expect_debt) * input_fraction // ONE
+    unwound_debt = expect_debt * input_fraction // ONE
 
     # unwind fraction of shares
-    tx = market.unwind(input_pos_id, input_fraction, input_price_limit,
-                       {"from": alice})
+    tx = unwind_position(market, alice, pos_id, fraction, is_long)
     actual_mint = tx.events["Unwind"]["mint"]
     expect_balance_market += actual_mint
 
     # calculate expected values
-    expect_value = int(unwound_cost + actual_mint)
-    expect_notional_w_pnl = int(expect_value + unwound_debt)
-    expect_trade_fee = int(Decimal(expect_notional_w_pnl) * trading_fee_rate)
+    expect_value = unwound_cost + int(actual_mint)
+    expect_notional_w_pnl = expect_value + unwound_debt
+    expect_trade_fee = expect_notional_w_pnl * trading_fee_rate // ONE
     if expect_trade_fee > expect_value:
         expect_trade_fee = expect_value
 
     expect_balance_recipient += expect_trade_fee
     expect_balance_market -= expect_value
 
-    actual_balance_recipient = ovl.balanceOf(recipient)
-    actual_balance_market = ovl.balanceOf(market)
+    with multicall_latest():
+        actual_balance_recipient = ovl.balanceOf(recipient)
+        actual_balance_market = ovl.balanceOf(market)
 
     assert int(actual_balance_recipient) == approx(expect_balance_recipient)
     assert int(actual_balance_market) == approx(expect_balance_market)
@@ -843,35 +686,30 @@ def test_unwind_transfers_trading_fees(market, feed, alice, rando, ovl,
     is_long=strategy('bool'),
     price_multiplier=strategy('decimal', min_value='1.100', max_value='5.000',
                               places=3))
-def test_unwind_mints_when_profitable(mock_market, mock_feed,
-                                      alice, rando,
-                                      ovl, fraction, is_long,
-                                      price_multiplier):
+def test_unwind_mints_when_profitable(mock_market, mock_risk_params,
+                                      multicall2, mock_feed, alice, rando, ovl,
+                                      fraction, is_long, price_multiplier):
     # position build attributes
     notional_initial = Decimal(1000)
     leverage = Decimal(1.5)
 
     # calculate expected pos info data
-    idx_trade = RiskParameter.TRADING_FEE_RATE.value
-    trading_fee_rate = Decimal(mock_market.params(idx_trade) / 1e18)
-    collateral, _, _, trade_fee \
+    trading_fee_rate = Decimal(
+        mock_risk_params[RiskParameter.TRADING_FEE_RATE]) / ONE_E18
+    collateral, _, _, _ \
         = calculate_position_info(notional_initial, leverage, trading_fee_rate)
 
     # input values for build
-    input_collateral = int(collateral * Decimal(1e18))
-    input_leverage = int(leverage * Decimal(1e18))
+    input_collateral = int(collateral * ONE_E18)
+    input_leverage = int(leverage * ONE_E18)
     input_is_long = is_long
 
     # NOTE: slippage tests in test_slippage.py
     # NOTE: setting to min/max here, so never reverts with slippage>max
     input_price_limit = 2**256-1 if is_long else 0
 
-    # approve collateral amount: collateral + trade fee
-    approve_collateral = int((collateral + trade_fee) * Decimal(1e18))
-
-    # approve then build
+    # build
     # NOTE: build() tests in test_build.py
-    ovl.approve(mock_market, approve_collateral, {"from": alice})
     tx = mock_market.build(input_collateral, input_leverage, input_is_long,
                            input_price_limit, {"from": alice})
     pos_id = tx.return_value
@@ -901,10 +739,8 @@ def test_unwind_mints_when_profitable(mock_market, mock_feed,
     mock_feed.setPrice(price, {"from": rando})
 
     # calculate current oi, debt values of position
-    expect_total_oi = mock_market.oiLong() if is_long \
-        else mock_market.oiShort()
-    expect_total_oi_shares = mock_market.oiLongShares() if is_long \
-        else mock_market.oiShortShares()
+    expect_total_oi, expect_total_oi_shares = oi_on_side(mock_market,
+                                                         is_long)
     expect_oi_current = (Decimal(expect_total_oi)*Decimal(expect_oi_shares)) \
         / Decimal(expect_total_oi_shares)
 
@@ -920,7 +756,7 @@ def test_unwind_mints_when_profitable(mock_market, mock_feed,
 
     # input values for unwind
     input_pos_id = pos_id
-    input_fraction = int(fraction * Decimal(1e18))
+    input_fraction = int(fraction * ONE_E18)
 
     # NOTE: slippage tests in test_slippage.py
     # NOTE: setting to min/max here, so never reverts with slippage>max
@@ -931,10 +767,8 @@ def test_unwind_mints_when_profitable(mock_market, mock_feed,
                             {"from": alice})
     expect_exit_price = tx.events["Unwind"]['price']
 
-    unwound_pnl = unwound_oi * (Decimal(expect_exit_price)
-                                - Decimal(expect_entry_price)) / Decimal(1e18)
-    if not is_long:
-        unwound_pnl *= -1
+    unwound_pnl = calculate_unwound_pnl(unwound_oi, expect_entry_price,
+                                        expect_exit_price, is_long)
 
     # calculate expected values
     expect_value = int(unwound_collateral + unwound_pnl)
@@ -942,8 +776,7 @@ def test_unwind_mints_when_profitable(mock_market, mock_feed,
     expect_mint = expect_value - expect_cost
 
     # check tx events have a mint to the mock market address
-    assert tx.events["Transfer"][0]['from'] \
-        == "0x0000000000000000000000000000000000000000"
+    assert tx.events["Transfer"][0]['from'] == ZERO_ADDRESS
     assert tx.events["Transfer"][0]['to'] == mock_market.address
     assert int(tx.events["Transfer"][0]['value']) == approx(expect_mint,
                                                             rel=1e-3)
@@ -956,8 +789,8 @@ def test_unwind_mints_when_profitable(mock_market, mock_feed,
     is_long=strategy('bool'),
     price_multiplier=strategy('decimal', min_value='1.001', max_value='1.5000',
                               places=3))
-def test_unwind_burns_when_not_profitable(mock_market, mock_feed,
-                                          alice, rando,
+def test_unwind_burns_when_not_profitable(mock_market, mock_risk_params,
+                                          multicall2, mock_feed, alice, rando,
                                           ovl, fraction, is_long,
                                           price_multiplier):
     # position build attributes
@@ -965,26 +798,22 @@ def test_unwind_burns_when_not_profitable(mock_market, mock_feed,
     leverage = Decimal(1.5)
 
     # calculate expected pos info data
-    idx_trade = RiskParameter.TRADING_FEE_RATE.value
-    trading_fee_rate = Decimal(mock_market.params(idx_trade) / 1e18)
-    collateral, _, _, trade_fee \
+    trading_fee_rate = Decimal(
+        mock_risk_params[RiskParameter.TRADING_FEE_RATE]) / ONE_E18
+    collateral, _, _, _ \
         = calculate_position_info(notional_initial, leverage, trading_fee_rate)
 
     # input values for build
-    input_collateral = int(collateral * Decimal(1e18))
-    input_leverage = int(leverage * Decimal(1e18))
+    input_collateral = int(collateral * ONE_E18)
+    input_leverage = int(leverage * ONE_E18)
     input_is_long = is_long
 
     # NOTE: slippage tests in test_slippage.py
     # NOTE: setting to min/max here, so never reverts with slippage>max
     input_price_limit = 2**256-1 if is_long else 0
 
-    # approve collateral amount: collateral + trade fee
-    approve_collateral = int((collateral + trade_fee) * Decimal(1e18))
-
-    # approve then build
+    # build
     # NOTE: build() tests in test_build.py
-    ovl.approve(mock_market, approve_collateral, {"from": alice})
     tx = mock_market.build(input_collateral, input_leverage, input_is_long,
                            input_price_limit, {"from": alice})
     pos_id = tx.return_value
@@ -1014,10 +843,8 @@ def test_unwind_burns_when_not_profitable(mock_market, mock_feed,
     mock_feed.setPrice(price, {"from": rando})
 
     # calculate current oi, debt values of position
-    expect_total_oi = mock_market.oiLong() if is_long \
-        else mock_market.oiShort()
-    expect_total_oi_shares = mock_market.oiLongShares() if is_long \
-        else mock_market.oiShortShares()
+    expect_total_oi, expect_total_oi_shares = oi_on_side(mock_market,
+                                                         is_long)
     expect_oi_current = (Decimal(expect_total_oi)*Decimal(expect_oi_shares)) \
         / Decimal(expect_total_oi_shares)
 
@@ -1033,7 +860,7 @@ def test_unwind_burns_when_not_profitable(mock_market, mock_feed,
 
     # input values for unwind
     input_pos_id = pos_id
-    input_fraction = int(fraction * Decimal(1e18))
+    input_fraction = int(fraction * ONE_E18)
 
     # NOTE: slippage tests in test_slippage.py
     # NOTE: setting to min/max here, so never reverts with slippage>max
@@ -1044,10 +871,8 @@ def test_unwind_burns_when_not_profitable(mock_market, mock_feed,
                             {"from": alice})
     expect_exit_price = tx.events["Unwind"]['price']
 
-    unwound_pnl = unwound_oi * (Decimal(expect_exit_price)
-                                - Decimal(expect_entry_price)) / Decimal(1e18)
-    if not is_long:
-        unwound_pnl *= -1
+    unwound_pnl = calculate_unwound_pnl(unwound_oi, expect_entry_price,
+                                        expect_exit_price, is_long)
 
     # calculate expected values
     expect_value = int(unwound_collateral + unwound_pnl)
@@ -1060,8 +885,7 @@ def test_unwind_burns_when_not_profitable(mock_market, mock_feed,
 
     # check tx events have a burn from the mock market address
     assert tx.events["Transfer"][0]['from'] == mock_market.address
-    assert tx.events["Transfer"][0]['to'] \
-        == "0x0000000000000000000000000000000000000000"
+    assert tx.events["Transfer"][0]['to'] == ZERO_ADDRESS
     assert int(tx.events["Transfer"][0]['value']) == approx(expect_burn,
                                                             rel=1e-3)
 
@@ -1073,9 +897,10 @@ def test_unwind_burns_when_not_profitable(mock_market, mock_feed,
                       places=3),
     price_multiplier=strategy('decimal', min_value='6.000', max_value='10.000',
                               places=3))
-def test_unwind_mints_when_greater_than_cap_payoff(mock_market, mock_feed,
-                                                   alice, rando,
-                                                   ovl, fraction,
+def test_unwind_mints_when_greater_than_cap_payoff(mock_market,
+                                                   mock_risk_params,
+                                                   multicall2, mock_feed,
+                                                   alice, rando, ovl, fraction,
                                                    price_multiplier):
     # position build attributes
     notional_initial = Decimal(1000)
@@ -1083,26 +908,22 @@ def test_unwind_mints_when_greater_than_cap_payoff(mock_market, mock_feed,
     is_long = True
 
     # calculate expected pos info data
-    idx_trade = RiskParameter.TRADING_FEE_RATE.value
-    trading_fee_rate = Decimal(mock_market.params(idx_trade) / 1e18)
-    collateral, _, _, trade_fee \
+    trading_fee_rate = Decimal(
+        mock_risk_params[RiskParameter.TRADING_FEE_RATE]) / ONE_E18
+    collateral, _, _, _ \
         = calculate_position_info(notional_initial, leverage, trading_fee_rate)
 
     # input values for build
-    input_collateral = int(collateral * Decimal(1e18))
-    input_leverage = int(leverage * Decimal(1e18))
+    input_collateral = int(collateral * ONE_E18)
+    input_leverage = int(leverage * ONE_E18)
     input_is_long = is_long
 
     # NOTE: slippage tests in test_slippage.py
     # NOTE: setting to min/max here, so never reverts with slippage>max
     input_price_limit = 2**256-1 if is_long else 0
 
-    # approve collateral amount: collateral + trade fee
-    approve_collateral = int((collateral + trade_fee) * Decimal(1e18))
-
-    # approve then build
+    # build
     # NOTE: build() tests in test_build.py
-    ovl.approve(mock_market, approve_collateral, {"from": alice})
     tx = mock_market.build(input_collateral, input_leverage, input_is_long,
                            input_price_limit, {"from": alice})
     pos_id = tx.return_value
@@ -1131,10 +952,8 @@ def test_unwind_mints_when_greater_than_cap_payoff(mock_market, mock_feed,
     mock_feed.setPrice(price, {"from": rando})
 
     # calculate current oi, debt values of position
-    expect_total_oi = mock_market.oiLong() if is_long \
-        else mock_market.oiShort()
-    expect_total_oi_shares = mock_market.oiLongShares() if is_long \
-        else mock_market.oiShortShares()
+    expect_total_oi, expect_total_oi_shares = oi_on_side(mock_market,
+                                                         is_long)
     expect_oi_current = (Decimal(expect_total_oi)*Decimal(expect_oi_shares)) \
         / Decimal(expect_total_oi_shares)
 
@@ -1150,7 +969,7 @@ def test_unwind_mints_when_greater_than_cap_payoff(mock_market, mock_feed,
 
     # input values for unwind
     input_pos_id = pos_id
-    input_fraction = int(fraction * Decimal(1e18))
+    input_fraction = int(fraction * ONE_E18)
 
     # NOTE: slippage tests in test_slippage.py
     # NOTE: setting to min/max here, so never reverts with slippage>max
@@ -1162,11 +981,11 @@ def test_unwind_mints_when_greater_than_cap_payoff(mock_market, mock_feed,
     expect_exit_price = tx.events["Unwind"]['price']
 
     # impose payoff cap on pnl
-    idx_cap_payoff = RiskParameter.CAP_PAYOFF.value
-    cap_payoff = Decimal(mock_market.params(idx_cap_payoff)) / Decimal(1e18)
-    unwound_pnl = unwound_oi * \
-        min(Decimal(expect_exit_price) - Decimal(expect_entry_price),
-            cap_payoff * Decimal(expect_entry_price)) / Decimal(1e18)
+    cap_payoff = Decimal(
+        mock_risk_params[RiskParameter.CAP_PAYOFF]) / ONE_E18
+    unwound_pnl = calculate_unwound_pnl(unwound_oi, expect_entry_price,
+                                        expect_exit_price, is_long,
+                                        cap_payoff)
 
     # calculate expected values
     expect_value = int(unwound_collateral + unwound_pnl)
@@ -1174,8 +993,7 @@ def test_unwind_mints_when_greater_than_cap_payoff(mock_market, mock_feed,
     expect_mint = expect_value - expect_cost
 
     # check tx events have a mint to the mock market address
-    assert tx.events["Transfer"][0]['from'] \
-        == "0x0000000000000000000000000000000000000000"
+    assert tx.events["Transfer"][0]['from'] == ZERO_ADDRESS
     assert tx.events["Transfer"][0]['to'] == mock_market.address
     assert int(tx.events["Transfer"][0]['value']) == approx(expect_mint,
                                                             rel=1e-4)
@@ -1183,6 +1001,8 @@ def test_unwind_mints_when_greater_than_cap_payoff(mock_market, mock_feed,
 
 # test for trading fee edge case of tradingFee > value
 def test_unwind_transfers_fees_when_fees_greater_than_value(mock_market,
+                                                            mock_risk_params,
+                                                            multicall2,
                                                             mock_feed, alice,
                                                             factory, rando,
                                                             ovl):
@@ -1194,31 +1014,27 @@ def test_unwind_transfers_fees_when_fees_greater_than_value(mock_market,
     price_multiplier = Decimal(0.8061)  # close to underwater but not there
 
     # exclude funding for testing edge case of fees > value
-    mock_market.setRiskParam(RiskParameter.K.value, 0, {"from": factory})
+    mock_market.setRiskParam(RiskParameter.K, 0, {"from": factory})
     mock_market.setRiskParam(
-        RiskParameter.MAINTENANCE_MARGIN_FRACTION.value, 0, {"from": factory})
+        RiskParameter.MAINTENANCE_MARGIN_FRACTION, 0, {"from": factory})
 
     # calculate expected pos info data
-    idx_trade = RiskParameter.TRADING_FEE_RATE.value
-    trading_fee_rate = Decimal(mock_market.params(idx_trade) / 1e18)
-    collateral, _, _, trade_fee \
+    trading_fee_rate = Decimal(
+        mock_risk_params[RiskParameter.TRADING_FEE_RATE]) / ONE_E18
+    collateral, _, _, _ \
         = calculate_position_info(notional_initial, leverage, trading_fee_rate)
 
     # input values for build
-    input_collateral = int(collateral * Decimal(1e18))
-    input_leverage = int(leverage * Decimal(1e18))
+    input_collateral = int(collateral * ONE_E18)
+    input_leverage = int(leverage * ONE_E18)
     input_is_long = is_long
 
     # NOTE: slippage tests in test_slippage.py
     # NOTE: setting to min/max here, so never reverts with slippage>max
     input_price_limit = 2**256-1 if is_long else 0
 
-    # approve collateral amount: collateral + trade fee
-    approve_collateral = int((collateral + trade_fee) * Decimal(1e18))
-
-    # approve then build
+    # build
     # NOTE: build() tests in test_build.py
-    ovl.approve(mock_market, approve_collateral, {"from": alice})
     tx = mock_market.build(input_collateral, input_leverage, input_is_long,
                            input_price_limit, {"from": alice})
     pos_id = tx.return_value
@@ -1244,9 +1060,14 @@ def test_unwind_transfers_fees_when_fees_greater_than_value(mock_market,
 
     # priors actual values
     recipient = factory.feeRecipient()
-    expect_balance_recipient = ovl.balanceOf(recipient)
-    expect_balance_market = ovl.balanceOf(mock_market)
-    expect_balance_alice = ovl.balanceOf(alice)
+    with multicall_latest():
+        balance_recipient = ovl.balanceOf(recipient)
+        balance_market = ovl.balanceOf(mock_market)
+        balance_alice = ovl.balanceOf(alice)
+
+    expect_balance_recipient = int(balance_recipient)
+    expect_balance_market = int(balance_market)
+    expect_balance_alice = int(balance_alice)
 
     # change price by factor
     price = mock_feed.price() * price_multiplier if is_long \
@@ -1254,10 +1075,8 @@ def test_unwind_transfers_fees_when_fees_greater_than_value(mock_market,
     mock_feed.setPrice(price, {"from": rando})
 
     # calculate current oi, debt values of position
-    expect_total_oi = mock_market.oiLong() if is_long \
-        else mock_market.oiShort()
-    expect_total_oi_shares = mock_market.oiLongShares() if is_long \
-        else mock_market.oiShortShares()
+    expect_total_oi, expect_total_oi_shares = oi_on_side(mock_market,
+                                                         is_long)
     expect_oi_current = (Decimal(expect_total_oi)*Decimal(expect_oi_shares)) \
         / Decimal(expect_total_oi_shares)
 
@@ -1272,7 +1091,7 @@ def test_unwind_transfers_fees_when_fees_greater_than_value(mock_market,
 
     # input values for unwind
     input_pos_id = pos_id
-    input_fraction = int(fraction * Decimal(1e18))
+    input_fraction = int(fraction * ONE_E18)
 
     # NOTE: slippage tests in test_slippage.py
     # NOTE: setting to min/max here, so never reverts with slippage>max
@@ -1289,10 +1108,8 @@ def test_unwind_transfers_fees_when_fees_greater_than_value(mock_market,
     actual_mint = tx.events["Unwind"]["mint"]
     expect_balance_market += actual_mint
 
-    unwound_pnl = unwound_oi * (Decimal(expect_exit_price)
-                                - Decimal(expect_entry_price)) / Decimal(1e18)
-    if not is_long:
-        unwound_pnl *= -1
+    unwound_pnl = calculate_unwound_pnl(unwound_oi, expect_entry_price,
+                                        expect_exit_price, is_long)
 
     # since notional * fee < value, trading_fee should equal value
     unwound_value = unwound_collateral + unwound_pnl
@@ -1306,9 +1123,10 @@ def test_unwind_transfers_fees_when_fees_greater_than_value(mock_market,
     expect_balance_recipient += expect_trade_fee
     expect_balance_market -= expect_value
 
-    actual_balance_recipient = ovl.balanceOf(recipient)
-    actual_balance_market = ovl.balanceOf(mock_market)
-    actual_balance_alice = ovl.balanceOf(alice)
+    with multicall_latest():
+        actual_balance_recipient = ovl.balanceOf(recipient)
+        actual_balance_market = ovl.balanceOf(mock_market)
+        actual_balance_alice = ovl.balanceOf(alice)
 
     assert int(actual_balance_recipient) == approx(expect_balance_recipient)
     assert int(actual_balance_market) == approx(expect_balance_market)
@@ -1317,6 +1135,8 @@ def test_unwind_transfers_fees_when_fees_greater_than_value(mock_market,
 
 # test for when value is underwater and unwind
 def test_unwind_floors_value_to_zero_when_position_underwater(mock_market,
+                                                              mock_risk_params,
+                                                              multicall2,
                                                               mock_feed, alice,
                                                               rando, ovl,
                                                               factory):
@@ -1328,31 +1148,27 @@ def test_unwind_floors_value_to_zero_when_position_underwater(mock_market,
     price_multiplier = Decimal(0.700)  # underwater
 
     # exclude funding for testing edge case
-    mock_market.setRiskParam(RiskParameter.K.value, 0, {"from": factory})
+    mock_market.setRiskParam(RiskParameter.K, 0, {"from": factory})
     mock_market.setRiskParam(
-        RiskParameter.MAINTENANCE_MARGIN_FRACTION.value, 0, {"from": factory})
+        RiskParameter.MAINTENANCE_MARGIN_FRACTION, 0, {"from": factory})
 
     # calculate expected pos info data
-    idx_trade = RiskParameter.TRADING_FEE_RATE.value
-    trading_fee_rate = Decimal(mock_market.params(idx_trade) / 1e18)
-    collateral, _, _, trade_fee \
+    trading_fee_rate = Decimal(
+        mock_risk_params[RiskParameter.TRADING_FEE_RATE]) / ONE_E18
+    collateral, _, _, _ \
         = calculate_position_info(notional_initial, leverage, trading_fee_rate)
 
     # input values for build
-    input_collateral = int(collateral * Decimal(1e18))
-    input_leverage = int(leverage * Decimal(1e18))
+    input_collateral = int(collateral * ONE_E18)
+    input_leverage = int(leverage * ONE_E18)
     input_is_long = is_long
 
     # NOTE: slippage tests in test_slippage.py
     # NOTE: setting to min/max here, so never reverts with slippage>max
     input_price_limit = 2**256-1 if is_long else 0
 
-    # approve collateral amount: collateral + trade fee
-    approve_collateral = int((collateral + trade_fee) * Decimal(1e18))
-
-    # approve then build
+    # build
     # NOTE: build() tests in test_build.py
-    ovl.approve(mock_market, approve_collateral, {"from": alice})
     tx = mock_market.build(input_collateral, input_leverage, input_is_long,
                            input_price_limit, {"from": alice})
     pos_id = tx.return_value
@@ -1373,9 +1189,14 @@ def test_unwind_floors_value_to_zero_when_position_underwater(mock_market,
 
     # priors actual values
     recipient = factory.feeRecipient()
-    expect_balance_recipient = ovl.balanceOf(recipient)
-    expect_balance_market = ovl.balanceOf(mock_market)
-    expect_balance_alice = ovl.balanceOf(alice)
+    with multicall_latest():
+        balance_recipient = ovl.balanceOf(recipient)
+        balance_market = ovl.balanceOf(mock_market)
+        balance_alice = ovl.balanceOf(alice)
+
+    expect_balance_recipient = int(balance_recipient)
+    expect_balance_market = int(balance_market)
+    expect_balance_alice = int(balance_alice)
 
     # change price by factor
     price = mock_feed.price() * price_multiplier if is_long \
@@ -1388,7 +1209,7 @@ def test_unwind_floors_value_to_zero_when_position_underwater(mock_market,
 
     # input values for unwind
     input_pos_id = pos_id
-    input_fraction = int(fraction * Decimal(1e18))
+    input_fraction = int(fraction * ONE_E18)
 
     # NOTE: slippage tests in test_slippage.py
     # NOTE: setting to min/max here, so never reverts with slippage>max
@@ -1419,144 +1240,56 @@ def test_unwind_floors_value_to_zero_when_position_underwater(mock_market,
     expect_balance_recipient += expect_trade_fee
     expect_balance_market -= expect_value
 
-    actual_balance_recipient = ovl.balanceOf(recipient)
-    actual_balance_market = ovl.balanceOf(mock_market)
-    actual_balance_alice = ovl.balanceOf(alice)
+    with multicall_latest():
+        actual_balance_recipient = ovl.balanceOf(recipient)
+        actual_balance_market = ovl.balanceOf(mock_market)
+        actual_balance_alice = ovl.balanceOf(alice)
 
     assert int(actual_balance_recipient) == approx(expect_balance_recipient)
     assert int(actual_balance_market) == approx(expect_balance_market)
     assert int(actual_balance_alice) == approx(expect_balance_alice)
 
 
-def test_unwind_reverts_when_fraction_zero(market, alice, ovl):
-    # position build attributes
-    notional_initial = Decimal(1000)
-    leverage = Decimal(1.5)
-    is_long = True
-
-    # calculate expected pos info data
-    idx_trade = RiskParameter.TRADING_FEE_RATE.value
-    trading_fee_rate = Decimal(market.params(idx_trade) / 1e18)
-    collateral, _, _, trade_fee \
-        = calculate_position_info(notional_initial, leverage, trading_fee_rate)
-
-    # input values for build
-    input_collateral = int(collateral * Decimal(1e18))
-    input_leverage = int(leverage * Decimal(1e18))
-    input_is_long = is_long
-
-    # NOTE: slippage tests in test_slippage.py
-    # NOTE: setting to min/max here, so never reverts with slippage>max
-    input_price_limit = 2**256-1 if is_long else 0
+# NOTE: unwind args for a standard long built by alice. Sender is a fixture
+# name resolved at test time
+UNWIND_REVERT_CASES = [
+    (0, "alice", "OVLV1:fraction<min"),
+    (1000000000000000001, "alice", "OVLV1:fraction>max"),
+    (1000000000000000000, "bob", "OVLV1:!position"),
+]
 
-    # approve collateral amount: collateral + trade fee
-    approve_collateral = int((collateral + trade_fee) * Decimal(1e18))
 
-    # approve then build
-    # NOTE: build() tests in test_build.py
-    ovl.approve(market, approve_collateral, {"from": alice})
-    tx = market.build(input_collateral, input_leverage, input_is_long,
-                      input_price_limit, {"from": alice})
-    pos_id = tx.return_value
-
-    # NOTE: slippage tests in test_slippage.py
-    # NOTE: setting to min/max here, so never reverts with slippage>max
-    input_price_limit = 0 if is_long else 2**256-1
-
-    # check unwind reverts when fraction is zero
-    input_fraction = 0
-    with reverts("OVLV1:fraction<min"):
-        market.unwind(pos_id, input_fraction, input_price_limit,
-                      {"from": alice})
-
-
-def test_unwind_reverts_when_fraction_greater_than_one(market, alice, ovl):
+@pytest.mark.parametrize("input_fraction,sender,revert_msg",
+                         UNWIND_REVERT_CASES,
+                         ids=["fraction_zero",
+                              "fraction_greater_than_one",
+                              "not_position_owner"])
+def test_unwind_reverts(market, risk_params, alice, ovl, input_fraction,
+                        sender, revert_msg, request):
     # position build attributes
     notional_initial = Decimal(1000)
     leverage = Decimal(1.5)
     is_long = True
 
-    # calculate expected pos info data
-    idx_trade = RiskParameter.TRADING_FEE_RATE.value
-    trading_fee_rate = Decimal(market.params(idx_trade) / 1e18)
-    collateral, _, _, trade_fee \
-        = calculate_position_info(notional_initial, leverage, trading_fee_rate)
-
-    # input values for build
-    input_collateral = int(collateral * Decimal(1e18))
-    input_leverage = int(leverage * Decimal(1e18))
-    input_is_long = is_long
-
-    # NOTE: slippage tests in test_slippage.py
-    # NOTE: setting to min/max here, so never reverts with slippage>max
-    input_price_limit = 2**256-1 if is_long else 0
-
-    # approve collateral amount: collateral + trade fee
-    approve_collateral = int((collateral + trade_fee) * Decimal(1e18))
+    trading_fee_rate = risk_params[RiskParameter.TRADING_FEE_RATE]
 
-    # approve then build
+    # build
     # NOTE: build() tests in test_build.py
-    ovl.approve(market, approve_collateral, {"from": alice})
-    tx = market.build(input_collateral, input_leverage, input_is_long,
-                      input_price_limit, {"from": alice})
-    pos_id = tx.return_value
+    pos_id = build_position(market, alice, notional_initial, leverage,
+                            is_long, trading_fee_rate)
 
     # NOTE: slippage tests in test_slippage.py
     # NOTE: setting to min/max here, so never reverts with slippage>max
     input_price_limit = 0 if is_long else 2**256-1
 
-    # check unwind reverts when fraction is 1 more than 1e18
-    input_fraction = 1000000000000000001
-    with reverts("OVLV1:fraction>max"):
+    # check unwind reverts with given args
+    sender = request.getfixturevalue(sender)
+    with reverts(revert_msg):
         market.unwind(pos_id, input_fraction, input_price_limit,
-                      {"from": alice})
-
-    # check unwind succeeds when fraction is 1e18
-    input_fraction = 1000000000000000000
-    market.unwind(pos_id, input_fraction, input_price_limit, {"from": alice})
-
-
-def test_unwind_reverts_when_not_position_owner(market, alice, bob, ovl):
-    # position build attributes
-    notional_initial = Decimal(1000)
-    leverage = Decimal(1.5)
-    is_long = True
-
-    # calculate expected pos info data
-    idx_trade = RiskParameter.TRADING_FEE_RATE.value
-    trading_fee_rate = Decimal(market.params(idx_trade) / 1e18)
-    collateral, _, _, trade_fee \
-        = calculate_position_info(notional_initial, leverage, trading_fee_rate)
-
-    # input values for build
-    input_collateral = int(collateral * Decimal(1e18))
-    input_leverage = int(leverage * Decimal(1e18))
-    input_is_long = is_long
+                      {"from": sender})
 
-    # NOTE: slippage tests in test_slippage.py
-    # NOTE: setting to min/max here, so never reverts with slippage>max
-    input_price_limit = 2**256-1 if is_long else 0
-
-    # approve collateral amount: collateral + trade fee
-    approve_collateral = int((collateral + trade_fee) * Decimal(1e18))
-
-    # approve then build
-    # NOTE: build() tests in test_build.py
-    ovl.approve(market, approve_collateral, {"from": alice})
-    tx = market.build(input_collateral, input_leverage, input_is_long,
-                      input_price_limit, {"from": alice})
-    pos_id = tx.return_value
-
-    # NOTE: slippage tests in test_slippage.py
-    # NOTE: setting to min/max here, so never reverts with slippage>max
-    input_price_limit = 0 if is_long else 2**256-1
-
-    # check unwind reverts when bob attempts
+    # check unwind succeeds when alice unwinds fraction of 1e18
     input_fraction = 1000000000000000000
-    with reverts("OVLV1:!position"):
-        market.unwind(pos_id, input_fraction, input_price_limit, {"from": bob})
-
-    # check unwind succeeds when alice attempts
     market.unwind(pos_id, input_fraction, input_price_limit, {"from": alice})
 
 
@@ -1569,8 +1302,10 @@ def test_unwind_reverts_when_position_not_exists(market, alice, ovl):
         market.unwind(pos_id, input_fraction, 0, {"from": alice})
 
 
-def test_unwind_reverts_when_position_liquidated(mock_market, mock_feed,
-                                                 factory, alice, rando, ovl):
+def test_unwind_reverts_when_position_liquidated(mock_market, mock_risk_params,
+                                                 spread_factors, multicall2,
+                                                 mock_feed, factory, alice,
+                                                 rando, ovl):
     # position build attributes
     notional_initial = Decimal(1000)
     leverage = Decimal(1.5)
@@ -1580,41 +1315,43 @@ def test_unwind_reverts_when_position_liquidated(mock_market, mock_feed,
     tol = 1e-4
 
     # set k to zero to avoid funding calcs
-    mock_market.setRiskParam(RiskParameter.K.value, 0, {"from": factory})
+    mock_market.setRiskParam(RiskParameter.K, 0, {"from": factory})
 
     # calculate expected pos info data
-    idx_trade = RiskParameter.TRADING_FEE_RATE.value
-    trading_fee_rate = Decimal(mock_market.params(idx_trade) / 1e18)
-    collateral, _, _, trade_fee \
+    trading_fee_rate = Decimal(
+        mock_risk_params[RiskParameter.TRADING_FEE_RATE]) / ONE_E18
+    collateral, _, _, _ \
         = calculate_position_info(notional_initial, leverage, trading_fee_rate)
 
     # input values for build
-    input_collateral = int(collateral * Decimal(1e18))
-    input_leverage = int(leverage * Decimal(1e18))
+    input_collateral = int(collateral * ONE_E18)
+    input_leverage = int(leverage * ONE_E18)
     input_is_long = is_long
 
     # NOTE: slippage tests in test_slippage.py
     # NOTE: setting to min/max here, so never reverts with slippage>max
     input_price_limit = 2**256-1 if is_long else 0
 
-    # approve collateral amount: collateral + trade fee
-    approve_collateral = int((collateral + trade_fee) * Decimal(1e18))
-
-    # approve then build
+    # build
     # NOTE: build() tests in test_build.py
-    ovl.approve(mock_market, approve_collateral, {"from": alice})
     tx = mock_market.build(input_collateral, input_leverage, input_is_long,
                            input_price_limit, {"from": alice})
     pos_id = tx.return_value
 
-    # get position info
+    # get position info, feed data for the entry price and the mock feed
+    # price prior to any changes
     pos_key = get_position_key(alice.address, pos_id)
+    with multicall_latest():
+        position = mock_market.positions(pos_key)
+        data = mock_feed.latest()
+        original_price = mock_feed.price()
+
     (expect_notional, expect_debt, expect_mid_ratio,
      expect_is_long, expect_liquidated,
-     expect_oi_shares) = mock_market.positions(pos_key)
+     expect_oi_shares) = position
+    original_price = int(original_price)
 
     # calculate the entry price
-    data = mock_feed.latest()
     mid_price = int(mid_from_feed(data))
     expect_entry_price = entry_from_mid_ratio(expect_mid_ratio, mid_price)
 
@@ -1627,22 +1364,17 @@ def test_unwind_reverts_when_position_liquidated(mock_market, mock_feed,
     tx = mock_market.update({"from": rando})
 
     # calculate current oi, debt values of position
-    expect_total_oi = mock_market.oiLong() if is_long \
-        else mock_market.oiShort()
-    expect_total_oi_shares = mock_market.oiLongShares() if is_long \
-        else mock_market.oiShortShares()
+    expect_total_oi, expect_total_oi_shares = oi_on_side(mock_market,
+                                                         is_long)
     expect_oi_current = (Decimal(expect_total_oi)*Decimal(expect_oi_shares)) \
         / Decimal(expect_total_oi_shares)
 
     # calculate expected liquidation price
     # NOTE: p_liq = p_entry * ( MM * Q(0) + D ) / OI if long
     # NOTE:       = p_entry * ( 2 - ( MM * Q(0) + D ) / OI ) if short
-    idx_mmf = RiskParameter.MAINTENANCE_MARGIN_FRACTION.value
-    maintenance_fraction = Decimal(mock_market.params(idx_mmf)) \
-        / Decimal(1e18)
-
-    idx_delta = RiskParameter.DELTA.value
-    delta = Decimal(mock_market.params(idx_delta)) / Decimal(1e18)
+    maintenance_fraction = Decimal(
+        mock_risk_params[RiskParameter.MAINTENANCE_MARGIN_FRACTION]) / ONE_E18
+    exp_delta, exp_neg_delta = spread_factors
     if is_long:
         expect_liquidation_price = Decimal(expect_entry_price) * \
             (maintenance_fraction * Decimal(expect_notional)
@@ -1660,13 +1392,13 @@ def test_unwind_reverts_when_position_liquidated(mock_market, mock_feed,
     if is_long:
         # longs get the bid on exit, which has e**(-delta) multiplied to it
         # mock feed price should then be liq price * e**(delta) to account
-        price_multiplier *= Decimal(exp(delta)) / Decimal(1 + tol)
+        price_multiplier *= exp_delta / Decimal(1 + tol)
     else:
         # shorts get the ask on exit, which has e**(+delta) multiplied to it
         # mock feed price should then be liq price * e**(-delta) to account
-        price_multiplier *= Decimal(exp(-delta)) * Decimal(1 + tol)
+        price_multiplier *= exp_neg_delta * Decimal(1 + tol)
 
-    price = Decimal(mock_feed.price()) * price_multiplier
+    price = Decimal(original_price) * price_multiplier
     mock_feed.setPrice(price, {"from": rando})
 
     # input values for liquidate
@@ -1682,8 +1414,11 @@ def test_unwind_reverts_when_position_liquidated(mock_market, mock_feed,
         mock_market.unwind(input_pos_id, input_fraction, 0, {"from": alice})
 
 
-def test_unwind_reverts_when_position_liquidatable(mock_market, mock_feed,
-                                                   factory, alice, rando, ovl):
+def test_unwind_reverts_when_position_liquidatable(mock_market,
+                                                   mock_risk_params,
+                                                   spread_factors, multicall2,
+                                                   mock_feed, factory, alice,
+                                                   rando, ovl):
     # position build attributes
     notional_initial = Decimal(1000)
     leverage = Decimal(1.5)
@@ -1694,41 +1429,43 @@ def test_unwind_reverts_when_position_liquidatable(mock_market, mock_feed,
     tol = 1e-2
 
     # set k to zero to avoid funding calcs
-    mock_market.setRiskParam(RiskParameter.K.value, 0, {"from": factory})
+    mock_market.setRiskParam(RiskParameter.K, 0, {"from": factory})
 
     # calculate expected pos info data
-    idx_trade = RiskParameter.TRADING_FEE_RATE.value
-    trading_fee_rate = Decimal(mock_market.params(idx_trade) / 1e18)
-    collateral, _, _, trade_fee \
+    trading_fee_rate = Decimal(
+        mock_risk_params[RiskParameter.TRADING_FEE_RATE]) / ONE_E18
+    collateral, _, _, _ \
         = calculate_position_info(notional_initial, leverage, trading_fee_rate)
 
     # input values for build
-    input_collateral = int(collateral * Decimal(1e18))
-    input_leverage = int(leverage * Decimal(1e18))
+    input_collateral = int(collateral * ONE_E18)
+    input_leverage = int(leverage * ONE_E18)
     input_is_long = is_long
 
     # NOTE: slippage tests in test_slippage.py
     # NOTE: setting to min/max here, so never reverts with slippage>max
     input_price_limit = 2**256-1 if is_long else 0
 
-    # approve collateral amount: collateral + trade fee
-    approve_collateral = int((collateral + trade_fee) * Decimal(1e18))
-
-    # approve then build
+    # build
     # NOTE: build() tests in test_build.py
-    ovl.approve(mock_market, approve_collateral, {"from": alice})
     tx = mock_market.build(input_collateral, input_leverage, input_is_long,
                            input_price_limit, {"from": alice})
     pos_id = tx.return_value
 
-    # get position info
+    # get position info, feed data for the entry price and the mock feed
+    # price prior to any changes
     pos_key = get_position_key(alice.address, pos_id)
+    with multicall_latest():
+        position = mock_market.positions(pos_key)
+        data = mock_feed.latest()
+        original_price = mock_feed.price()
+
     (expect_notional, expect_debt, expect_mid_ratio,
      expect_is_long, expect_liquidated,
-     expect_oi_shares) = mock_market.positions(pos_key)
+     expect_oi_shares) = position
+    original_price = int(original_price)
 
     # calculate the entry price
-    data = mock_feed.latest()
     mid_price = int(mid_from_feed(data))
     expect_entry_price = entry_from_mid_ratio(expect_mid_ratio, mid_price)
 
@@ -1741,24 +1478,19 @@ def test_unwind_reverts_when_position_liquidatable(mock_market, mock_feed,
     tx = mock_market.update({"from": rando})
 
     # calculate current oi, debt values of position
-    expect_total_oi = mock_market.oiLong() if is_long \
-        else mock_market.oiShort()
-    expect_total_oi_shares = mock_market.oiLongShares() if is_long \
-        else mock_market.oiShortShares()
+    expect_total_oi, expect_total_oi_shares = oi_on_side(mock_market,
+                                                         is_long)
     expect_oi_current = (Decimal(expect_total_oi)*Decimal(expect_oi_shares)) \
         / Decimal(expect_total_oi_shares)
 
     # calculate expected liquidation price
     # NOTE: p_liq = p_entry * ( MM * Q(0) + D ) / OI if long
     # NOTE:       = p_entry * ( 2 - ( MM * Q(0) + D ) / OI ) if short
-    idx_mmf = RiskParameter.MAINTENANCE_MARGIN_FRACTION.value
-    idx_liq = RiskParameter.LIQUIDATION_FEE_RATE.value
-    maintenance_fraction = Decimal(mock_market.params(idx_mmf)) \
-        / Decimal(1e18)
-    liq_fee_rate = Decimal(mock_market.params(idx_liq)) / Decimal(1e18)
-
-    idx_delta = RiskParameter.DELTA.value
-    delta = Decimal(mock_market.params(idx_delta)) / Decimal(1e18)
+    maintenance_fraction = Decimal(
+        mock_risk_params[RiskParameter.MAINTENANCE_MARGIN_FRACTION]) / ONE_E18
+    liq_fee_rate = Decimal(
+        mock_risk_params[RiskParameter.LIQUIDATION_FEE_RATE]) / ONE_E18
+    exp_delta, exp_neg_delta = spread_factors
     if is_long:
         expect_liquidation_price = Decimal(expect_entry_price) * \
             (maintenance_fraction * Decimal(expect_notional)
@@ -1777,13 +1509,12 @@ def test_unwind_reverts_when_position_liquidatable(mock_market, mock_feed,
     if is_long:
         # longs get the bid on exit, which has e**(-delta) multiplied to it
         # mock feed price should then be liq price * e**(delta) to account
-        price_multiplier *= Decimal(exp(delta)) / Decimal(1 + tol)
+        price_multiplier *= exp_delta / Decimal(1 + tol)
     else:
         # shorts get the ask on exit, which has e**(+delta) multiplied to it
         # mock feed price should then be liq price * e**(-delta) to account
-        price_multiplier *= Decimal(exp(-delta)) * Decimal(1 + tol)
+        price_multiplier *= exp_neg_delta * Decimal(1 + tol)
 
-    original_price = mock_feed.price()
     price = Decimal(original_price) * price_multiplier
     mock_feed.setPrice(price, {"from": rando})
 
@@ -1800,11 +1531,11 @@ def test_unwind_reverts_when_position_liquidatable(mock_market, mock_feed,
     if is_long:
         # longs get the bid on exit, which has e**(-delta) multiplied to it
         # mock feed price should then be liq price * e**(delta) to account
-        price_multiplier *= Decimal(exp(delta)) / Decimal(1 - tol)
+        price_multiplier *= exp_delta / Decimal(1 - tol)
     else:
         # shorts get the ask on exit, which has e**(+delta) multiplied to it
         # mock feed price should then be liq price * e**(-delta) to account
-        price_multiplier *= Decimal(exp(-delta)) * Decimal(1 - tol)
+        price_multiplier *= exp_neg_delta * Decimal(1 - tol)
 
     price = Decimal(original_price) * price_multiplier
     mock_feed.setPrice(price, {"from": rando})
@@ -1814,7 +1545,8 @@ def test_unwind_reverts_when_position_liquidatable(mock_market, mock_feed,
                        {"from": alice})
 
 
-def test_multiple_unwind_unwinds_multiple_positions(market, factory, ovl,
+def test_multiple_unwind_unwinds_multiple_positions(market, risk_params,
+                                                    multicall2, factory, ovl,
                                                     alice, bob):
     # loop through 10 times
     n = 10
@@ -1822,28 +1554,14 @@ def test_multiple_unwind_unwinds_multiple_positions(market, factory, ovl,
     total_notional_short = Decimal(7500)
 
     # set k to zero to avoid funding calcs
-    market.setRiskParam(RiskParameter.K.value, 0, {"from": factory})
+    market.setRiskParam(RiskParameter.K, 0, {"from": factory})
 
     # alice goes long and bob goes short n times
-    input_total_notional_long = total_notional_long * Decimal(1e18)
-    input_total_notional_short = total_notional_short * Decimal(1e18)
-
     # calculate expected pos info data
-    idx_trade = RiskParameter.TRADING_FEE_RATE.value
-    trading_fee_rate = Decimal(market.params(idx_trade) / 1e18)
+    trading_fee_rate = Decimal(
+        risk_params[RiskParameter.TRADING_FEE_RATE]) / ONE_E18
 
-    idx_cap_leverage = RiskParameter.CAP_LEVERAGE.value
-    leverage_cap = Decimal(market.params(idx_cap_leverage) / 1e18)
-
-    # approve collateral amount: collateral + trade fee
-    approve_collateral_alice = int((input_total_notional_long
-                                    * (1 + trading_fee_rate)))
-    approve_collateral_bob = int((input_total_notional_short
-                                  * (1 + trading_fee_rate)))
-
-    # approve market for spending then build
-    ovl.approve(market, approve_collateral_alice, {"from": alice})
-    ovl.approve(market, approve_collateral_bob, {"from": bob})
+    leverage_cap = Decimal(risk_params[RiskParameter.CAP_LEVERAGE]) / ONE_E18
 
     # per trade notional values
     notional_alice = total_notional_long / Decimal(n)
@@ -1851,13 +1569,17 @@ def test_multiple_unwind_unwinds_multiple_positions(market, factory, ovl,
     is_long_alice = True
     is_long_bob = False
 
-    actual_pos_ids = []
+    # NOTE: seeded so leverages, fractions are reproducible across runs
+    rng = Random(0xC0FFEE)
+
+    # NOTE: (trader, is_long, pos_id) per build so unwinds needn't infer owner
+    positions = []
     for i in range(n):
         chain.mine(timedelta=60)
 
         # choose a random leverage
-        leverage_alice = randint(1, leverage_cap)
-        leverage_bob = randint(1, leverage_cap)
+        leverage_alice = rng.randint(1, int(leverage_cap))
+        leverage_bob = rng.randint(1, int(leverage_cap))
 
         # calculate collateral amounts
         collateral_alice, _, debt_alice, _ = calculate_position_info(
@@ -1865,10 +1587,10 @@ def test_multiple_unwind_unwinds_multiple_positions(market, factory, ovl,
         collateral_bob, _, debt_bob, _ = calculate_position_info(
             notional_bob, leverage_bob, trading_fee_rate)
 
-        input_collateral_alice = int(collateral_alice * Decimal(1e18))
-        input_collateral_bob = int(collateral_bob * Decimal(1e18))
-        input_leverage_alice = int(leverage_alice * Decimal(1e18))
-        input_leverage_bob = int(leverage_bob * Decimal(1e18))
+        input_collateral_alice = int(collateral_alice * ONE_E18)
+        input_collateral_bob = int(collateral_bob * ONE_E18)
+        input_leverage_alice = int(leverage_alice * ONE_E18)
+        input_leverage_bob = int(leverage_bob * ONE_E18)
 
         # NOTE: slippage tests in test_slippage.py
         # NOTE: setting to min/max here, so never reverts with slippage>max
@@ -1879,44 +1601,42 @@ def test_multiple_unwind_unwinds_multiple_positions(market, factory, ovl,
         tx_alice = market.build(input_collateral_alice, input_leverage_alice,
                                 is_long_alice, input_price_limit_alice,
                                 {"from": alice})
-        pos_id_alice = tx_alice.return_value
+        pos_id_alice = tx_alice.events["Build"]["positionId"]
 
         # build position for bob
         tx_bob = market.build(input_collateral_bob, input_leverage_bob,
                               is_long_bob, input_price_limit_bob,
                               {"from": bob})
-        pos_id_bob = tx_bob.return_value
+        pos_id_bob = tx_bob.events["Build"]["positionId"]
 
-        actual_pos_ids.append(pos_id_alice)  # alice ids are even
-        actual_pos_ids.append(pos_id_bob)  # bob ids are odd
+        positions.append((alice, is_long_alice, pos_id_alice))
+        positions.append((bob, is_long_bob, pos_id_bob))
 
     # mine the chain into the future then unwind each
     chain.mine(timedelta=600)
 
     # unwind fractions of each position
-    for id in actual_pos_ids:
+    for trader, is_long, id in positions:
         chain.mine(timedelta=60)
 
-        # alice is even ids, bob is odd
-        is_alice = (id % 2 == 0)
-        trader = alice if is_alice else bob
-
         # choose a random fraction of pos to unwind
-        input_fraction = randint(1, 1e18)
-        fraction = Decimal(input_fraction) / Decimal(1e18)
+        input_fraction = rng.randint(1, 10**18)
 
         # NOTE: slippage tests in test_slippage.py
         # NOTE: setting to min/max here, so never reverts with slippage>max
-        input_price_limit_trader = 0 if is_alice else 2**256-1
+        input_price_limit_trader = 0 if is_long else 2**256-1
 
-        # cache current aggregate oi and oi shares for comparison later
-        total_oi = market.oiLong() if is_alice else market.oiShort()
-        total_oi_shares = market.oiLongShares() if is_alice \
-            else market.oiShortShares()
-
-        # cache position attributes for everything for later comparison
+        # cache current aggregate oi and oi shares along with position
+        # attributes for everything for later comparison
         pos_key = get_position_key(trader.address, id)
-        expect_pos = market.positions(pos_key)
+        with multicall_latest():
+            total_oi = market.oiLong() if is_long else market.oiShort()
+            total_oi_shares = market.oiLongShares() if is_long \
+                else market.oiShortShares()
+            expect_pos = market.positions(pos_key)
+
+        total_oi = int(total_oi)
+        total_oi_shares = int(total_oi_shares)
         (expect_notional, expect_debt, expect_mid_ratio,
          expect_is_long, expect_liquidated, expect_oi_shares) = expect_pos
 
@@ -1924,23 +1644,29 @@ def test_multiple_unwind_unwinds_multiple_positions(market, factory, ovl,
         _ = market.unwind(id, input_fraction, input_price_limit_trader,
                           {"from": trader})
 
-        # get updated actual position attributes
-        actual_pos = market.positions(pos_key)
+        # get updated actual position attributes and aggregate oi on side
+        with multicall_latest():
+            actual_pos = market.positions(pos_key)
+            actual_total_oi = market.oiLong() if is_long \
+                else market.oiShort()
+            actual_total_oi_shares = market.oiLongShares() if is_long \
+                else market.oiShortShares()
+
         (actual_notional, actual_debt, actual_mid_ratio,
          actual_is_long, actual_liquidated, actual_oi_shares) = actual_pos
 
         # check position info for id has decreased position oi, debt
-        expect_oi_shares_unwound = int(expect_oi_shares * fraction)
-        expect_oi_unwound = int(expect_oi_shares_unwound * total_oi
-                                / total_oi_shares)
+        expect_oi_shares_unwound = expect_oi_shares * input_fraction // ONE
+        expect_oi_unwound = expect_oi_shares_unwound * total_oi \
+            // total_oi_shares
 
-        expect_notional = int(expect_notional * (1 - fraction))
-        expect_oi_shares = int(expect_oi_shares * (1 - fraction))
-        expect_debt = int(expect_debt * (1 - fraction))
+        expect_notional = expect_notional * (ONE - input_fraction) // ONE
+        expect_oi_shares = expect_oi_shares * (ONE - input_fraction) // ONE
+        expect_debt = expect_debt * (ONE - input_fraction) // ONE
 
-        assert int(actual_notional) == approx(expect_notional)
-        assert int(actual_oi_shares) == approx(expect_oi_shares)
-        assert int(actual_debt) == approx(expect_debt)
+        assert iapprox(actual_notional, expect_notional, rel_ppm=1)
+        assert iapprox(actual_oi_shares, expect_oi_shares, rel_ppm=1)
+        assert iapprox(actual_debt, expect_debt, rel_ppm=1)
         assert actual_is_long == expect_is_long
         assert actual_liquidated == expect_liquidated
         assert actual_mid_ratio == expect_mid_ratio
@@ -1949,9 +1675,6 @@ def test_multiple_unwind_unwinds_multiple_positions(market, factory, ovl,
         expect_total_oi = total_oi - expect_oi_unwound
         expect_total_oi_shares = total_oi_shares - expect_oi_shares_unwound
 
-        actual_total_oi = market.oiLong() if is_alice else market.oiShort()
-        actual_total_oi_shares = market.oiLongShares() if is_alice \
-            else market.oiShortShares()
-
-        assert int(actual_total_oi) == approx(expect_total_oi)
-        assert int(actual_total_oi_shares) == approx(expect_total_oi_shares)
+        assert iapprox(actual_total_oi, expect_total_oi, rel_ppm=1)
+        assert iapprox(actual_total_oi_shares, expect_total_oi_shares,
+                       rel_ppm=1)
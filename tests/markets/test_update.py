@@ -1,8 +1,10 @@
+import pytest
 from brownie import chain
 from brownie.test import given, strategy
 from decimal import Decimal
 
-from .utils import RiskParameter
+
+pytestmark = pytest.mark.usefixtures("approve_market")
 
 
 def test_update_fetches_from_feed(market, feed, rando):
@@ -22,20 +24,9 @@ def test_update_fetches_from_feed(market, feed, rando):
                             places=3))
 def test_update_pays_funding(market, feed, ovl, alice, bob, rando,
                              notional_long, notional_short):
-    idx_trade = RiskParameter.TRADING_FEE_RATE.value
-
     notional_long = notional_long * Decimal(1e18)
     notional_short = notional_short * Decimal(1e18)
 
-    # calculate expected pos info data
-    trading_fee_rate = Decimal(market.params(idx_trade) / 1e18)
-    approve_collateral_long = notional_long * (1 + trading_fee_rate)
-    approve_collateral_short = notional_short * (1 + trading_fee_rate)
-
-    # approve collateral amounts
-    ovl.approve(market, approve_collateral_long, {"from": alice})
-    ovl.approve(market, approve_collateral_short, {"from": bob})
-
     # build long and short positions for oi
     # NOTE: build() tests in test_build.py
     _ = market.build(notional_long, 1e18, True, 2**256-1, {"from": alice})
@@ -1,11 +1,17 @@
-from brownie import web3
+from brownie import multicall, web3
 from decimal import Decimal
-from enum import Enum
+from enum import IntEnum
+from functools import lru_cache
 from hexbytes import HexBytes
 from typing import Any
 
 
-class RiskParameter(Enum):
+ONE = 10 ** 18
+ONE_E18 = Decimal(ONE)
+MID_RATIO_ONE = 10 ** 14
+
+
+class RiskParameter(IntEnum):
     K = 0
     LMBDA = 1
     DELTA = 2
@@ -23,6 +29,8 @@ class RiskParameter(Enum):
     AVERAGE_BLOCK_TIME = 14
 
 
+# NOTE: cached since hypothesis examples repeat (notional, leverage) draws
+@lru_cache(maxsize=4096)
 def calculate_position_info(notional: Decimal,
                             leverage: Decimal,
                             trading_fee_rate: Decimal) -> (Decimal, Decimal,
@@ -36,6 +44,33 @@ def calculate_position_info(notional: Decimal,
     return collateral, notional, debt, trade_fee
 
 
+def calculate_position_info_int(notional: int,
+                                leverage: int,
+                                trading_fee_rate: int) -> (int, int,
+                                                           int, int):
+    """
+    Returns position attributes in int FixedPoint format (1e18 = ONE)
+
+    NOTE: trade fee rounds up as the market does on build
+    """
+    collateral = notional * ONE // leverage
+    trade_fee = (notional * trading_fee_rate + ONE - 1) // ONE  # mulUp
+    debt = notional - collateral
+    return collateral, notional, debt, trade_fee
+
+
+# NOTE: brownie < 1.20.2 keeps the block of the first `with multicall:` for
+# every later batch, which isolation reverts may have since dropped
+def multicall_latest():
+    """
+    Returns brownie multicall context manager pinned to the latest block
+    """
+    return multicall(block_identifier=web3.eth.block_number)
+
+
+# NOTE: cached since tests rebuild the same (owner, id) keys repeatedly.
+# owner must be the address str (hashable), not the account object
+@lru_cache(maxsize=1024)
 def get_position_key(owner: str, id: int) -> HexBytes:
     """
     Returns the position key to retrieve an individual position
@@ -44,14 +79,17 @@ def get_position_key(owner: str, id: int) -> HexBytes:
     return web3.solidityKeccak(['address', 'uint256'], [owner, id])
 
 
-def mid_from_feed(data: Any) -> float:
+# NOTE: cached since the same feed data is reused across checks in a test.
+# data must be a tuple (hashable), as returned by feed.latest()
+@lru_cache(maxsize=128)
+def mid_from_feed(data: Any) -> int:
     """
     Returns mid price from oracle feed data
     """
     (_, _, _, price_micro, price_macro, _, _, _) = data
     ask = max(price_micro, price_macro)
     bid = min(price_micro, price_macro)
-    mid = (ask + bid) / 2
+    mid = (ask + bid) // 2
     return mid
 
 
@@ -62,7 +100,7 @@ def entry_from_mid_ratio(mid_ratio: int, mid: int) -> int:
     NOTE: mid_ratio is uint48 format and mid price is int FixedPoint format
     """
     # NOTE: mid_ratio "ONE" is 1e14 given uint48
-    entry_price = int((Decimal(mid_ratio) / Decimal(1e14)) * mid)
+    entry_price = int(mid_ratio) * int(mid) // MID_RATIO_ONE
     return entry_price
 
 
@@ -73,6 +111,37 @@ def calculate_mid_ratio(entry_price: int, mid_price: int) -> int:
     NOTE: mid_ratio is uint48 format and mid, entry prices
     are int FixedPoint format
     """
-    # NOTE: mid_ratio "ONE" is 1e14 given uint48
-    mid_ratio = int(Decimal(entry_price) * Decimal(1e14) / Decimal(mid_price))
+    # NOTE: mid_ratio "ONE" is 1e14 given uint48. rounds down as
+    # Position.calcEntryToMidRatio does
+    mid_ratio = int(entry_price) * MID_RATIO_ONE // int(mid_price)
     return mid_ratio
+
+
+def calculate_unwound_pnl(oi: Decimal,
+                          entry_price: int,
+                          exit_price: int,
+                          is_long: bool,
+                          cap_payoff: Decimal = None) -> Decimal:
+    """
+    Returns pnl on unwound oi from entry to exit price in decimal format,
+    capping the price change at cap_payoff * entry_price if given
+
+    NOTE: oi is int FixedPoint format as Decimal; entry, exit prices are int
+    FixedPoint format
+    """
+    dp = Decimal(exit_price) - Decimal(entry_price)
+    if not is_long:
+        dp *= -1
+    if cap_payoff is not None:
+        dp = min(dp, cap_payoff * Decimal(entry_price))
+    return oi * dp / Decimal(ONE)
+
+
+def iapprox(actual: int, expect: int, rel_ppm: int = 1000) -> bool:
+    """
+    Returns whether actual is within rel_ppm parts per million of expect
+
+    NOTE: int only equivalent of approx(expect, rel=rel_ppm/1e6) for
+    wei values, so no float conversion
+    """
+    return abs(int(actual) - int(expect)) * 10**6 <= rel_ppm * abs(int(expect))